@@ -43,7 +43,7 @@ async def regenerate_map(request: RegenerateMapRequest):
 @router.get("/maps")
 async def list_saved_maps():
     """List all saved game files."""
-    saves = storage_service.list_saves()
+    saves = await storage_service.list_saves()
     return {"saves": saves}
 
 
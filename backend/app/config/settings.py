@@ -49,6 +49,11 @@ class AISettings:
     debug_enabled: bool = field(
         default_factory=lambda: os.getenv("AI_DEBUG", "false").lower() == "true"
     )
+    # Store MongoDB Q-tables as int8 with per-state scales (4x smaller, lossy:
+    # values survive a restart only to ~1/127 of each state's largest value)
+    quantize_q_tables: bool = field(
+        default_factory=lambda: os.getenv("AI_QUANTIZE_Q_TABLES", "false").lower() == "true"
+    )
 
     def clamp(self) -> None:
         self.max_generation_cap = max(1, self.max_generation_cap)
@@ -80,6 +85,16 @@ class AuthSettings:
     jwt_algorithm: str = "HS256"
     jwt_expire_days: int = 30
     max_profiles_per_user: int = 4
+    # bcrypt cost factor for new hashes; existing hashes keep their own
+    bcrypt_rounds: int = field(
+        default_factory=lambda: int(os.getenv("BCRYPT_ROUNDS", "12"))
+    )
+    # In-process user lookup cache; other workers see changes after the TTL
+    user_cache_size: int = 10_000
+    user_cache_ttl_seconds: float = 30.0
+    # Decoded JWT payloads, keyed by the raw token; exp is still checked
+    token_cache_size: int = 4096
+    token_cache_ttl_seconds: float = 300.0
 
 
 @dataclass
@@ -253,7 +253,8 @@ class Game:
         height = height or settings.game.default_map_height
         room_count = room_count or settings.game.default_room_count
         
-        generated = generate_dungeon(width=width, height=height, room_count=room_count, seed=seed)
+        # Generation is CPU-bound, so run it off the event loop
+        generated = await asyncio.to_thread(generate_dungeon, width=width, height=height, room_count=room_count, seed=seed)
         
         self.width = generated.width
         self.height = generated.height
@@ -702,25 +703,23 @@ class Game:
         if not self.monsters:
             return False
         
-        any_moved = False
         occupied = {(p.x, p.y) for p in self.players.values()}
         occupied.update((m.x, m.y) for m in self.monsters.values())
         
         await self._check_monster_aggro()
         
+        # World states are snapshotted before anyone moves; they only read
+        # player positions and room membership, which monster moves keep
+        entries = []
         for monster in self.monsters.values():
             if self._is_monster_in_fight(monster.id):
                 continue
             room = next((r for r in self.rooms if r.id == monster.room_id), None)
             if not room:
                 continue
-            
-            occupied.discard((monster.x, monster.y))
-            world_state = self._build_monster_world_state(monster, room)
-            moved = _get_monster_service().update_monster(monster=monster, room_bounds=room.bounds, tiles=self.tiles, occupied_positions=occupied, current_tick=current_tick, world_state=world_state)
-            if moved:
-                any_moved = True
-            occupied.add((monster.x, monster.y))
+            entries.append((monster, room.bounds, self._build_monster_world_state(monster, room)))
+        
+        any_moved = _get_monster_service().update_monsters_batch(entries, tiles=self.tiles, occupied_positions=occupied, current_tick=current_tick)
         
         if any_moved:
             self._mark_dirty()
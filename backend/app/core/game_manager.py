@@ -154,8 +154,9 @@ class GameManager:
         
         print(f"[GameManager] Generating new map {width}x{height} with ~{room_count} rooms...")
         
-        # Generate dungeon structure
-        generated = generate_dungeon(
+        # Generate dungeon structure (CPU-bound, so run it off the event loop)
+        generated = await asyncio.to_thread(
+            generate_dungeon,
             width=width,
             height=height,
             room_count=room_count,
@@ -772,14 +773,13 @@ class GameManager:
         if not self.monsters:
             return False
         
-        any_moved = False
-        
         occupied = {(p.x, p.y) for p in self.players.values()}
         occupied.update((m.x, m.y) for m in self.monsters.values())
         
         # First, check for monsters that should initiate combat with adjacent players
         await self._check_monster_aggro()
         
+        entries = []
         for monster in self.monsters.values():
             # Skip monsters already in combat
             if self._is_monster_in_fight(monster.id):
@@ -789,23 +789,17 @@ class GameManager:
             if not room:
                 continue
             
-            occupied.discard((monster.x, monster.y))
-            
-            world_state = self._build_monster_world_state(monster, room)
+            entries.append((monster, room.bounds, self._build_monster_world_state(monster, room)))
 
-            moved = monster_service.update_monster(
-                monster=monster,
-                room_bounds=room.bounds,
-                tiles=self.tiles,
-                occupied_positions=occupied,
-                current_tick=current_tick,
-                world_state=world_state,
-            )
-            
-            if moved:
-                any_moved = True
-            
-            occupied.add((monster.x, monster.y))
+        # Same-species decisions are batched; moves still apply in order.
+        # The world states above are one snapshot per tick: they only read
+        # player positions and room membership, which monster moves keep
+        any_moved = monster_service.update_monsters_batch(
+            entries,
+            tiles=self.tiles,
+            occupied_positions=occupied,
+            current_tick=current_tick,
+        )
         
         if any_moved:
             self._mark_dirty()
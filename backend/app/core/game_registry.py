@@ -302,7 +302,7 @@ class GameRegistry:
         from .game import Game
         
         try:
-            saved_games = storage_service.list_game_saves()
+            saved_games = await storage_service.list_game_saves()
             for save_info in saved_games:
                 game_id = save_info.get("game_id")
                 if not game_id:
@@ -315,6 +315,7 @@ class SandboxManager:
         # Clean up memory in monster service
         if monster_id in monster_service.monster_memories:
             del monster_service.monster_memories[monster_id]
+        monster_service.monster_paths.pop(monster_id, None)
         
         self._save()
         return True
@@ -955,13 +956,14 @@ class SandboxManager:
         # Try MongoDB first if available
         if settings.mongodb.is_enabled and mongodb_manager.is_connected:
             try:
-                loop = asyncio.get_event_loop()
-                if loop.is_running():
-                    asyncio.create_task(self._async_save())
-                    return
+                try:
+                    loop = asyncio.get_running_loop()
+                except RuntimeError:
+                    # No loop running in this thread: save to completion
+                    asyncio.run(self._async_save())
                 else:
-                    loop.run_until_complete(self._async_save())
-                    return
+                    loop.create_task(self._async_save())
+                return
             except Exception as e:
                 print(f"[SandboxManager] MongoDB save failed, falling back to JSON: {e}")
 
@@ -1058,17 +1060,19 @@ class SandboxManager:
         # Try MongoDB first if available
         if settings.mongodb.is_enabled and mongodb_manager.is_connected:
             try:
-                loop = asyncio.get_event_loop()
-                if loop.is_running():
-                    asyncio.create_task(self._async_load())
+                try:
+                    loop = asyncio.get_running_loop()
+                except RuntimeError:
+                    # No loop running in this thread: load to completion
+                    asyncio.run(self._async_load())
+                    if self.state:  # Successfully loaded from MongoDB
+                        return
+                else:
+                    loop.create_task(self._async_load())
                     # Also try JSON as immediate fallback
                     if self.save_path.exists():
                         self._load_from_json()
                     return
-                else:
-                    loop.run_until_complete(self._async_load())
-                    if self.state:  # Successfully loaded from MongoDB
-                        return
             except Exception as e:
                 print(f"[SandboxManager] MongoDB load failed, falling back to JSON: {e}")
 
@@ -1,6 +1,6 @@
 """
 Database connection management module for DungeonAI.
 """
-from .mongodb import mongodb_manager
+from .mongodb import CollectionHandles, mongodb_manager
 
-__all__ = ["mongodb_manager"]
+__all__ = ["CollectionHandles", "mongodb_manager"]
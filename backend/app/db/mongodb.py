@@ -2,6 +2,7 @@
 MongoDB connection management for DungeonAI.
 Uses Motor (async MongoDB driver) for FastAPI compatibility.
 """
+import asyncio
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
 from typing import Optional
 import logging
@@ -10,6 +11,27 @@ import certifi
 logger = logging.getLogger(__name__)
 
 
+class CollectionHandles:
+    """
+    Collection handles for one database, built once per name.
+
+    Motor builds a new collection object on every ``db.<name>`` access;
+    this resolves each name on first use and stores it as a plain
+    attribute, so later lookups skip Motor entirely.
+    """
+
+    def __init__(self, database: AsyncIOMotorDatabase) -> None:
+        self.database = database
+
+    def __getattr__(self, name: str):
+        # Only called for names not cached yet
+        if name.startswith("_"):
+            raise AttributeError(name)
+        collection = getattr(self.database, name)
+        setattr(self, name, collection)
+        return collection
+
+
 class MongoDBManager:
     """Singleton MongoDB connection manager."""
 
@@ -77,43 +99,56 @@ class MongoDBManager:
             logger.info("[MongoDB] Disconnected")
 
     async def _create_indexes(self) -> None:
-        """Create all necessary indexes for optimal query performance."""
+        """
+        Create all necessary indexes for optimal query performance.
+
+        create_index is a no-op for existing indexes; the builds are sent
+        concurrently so startup waits for one round trip, not one per index.
+        """
         if self._db is None:
             return
 
+        db = self._db
         try:
-            # Games collection indexes
-            await self._db.games.create_index("game_id", unique=True)
-            await self._db.games.create_index("last_activity")
-            await self._db.games.create_index("created_at")
-
-            # Users collection indexes
-            await self._db.users.create_index("user_id", unique=True)
-            await self._db.users.create_index("email", unique=True)
-
-            # Players collection indexes
-            await self._db.players.create_index("token", unique=True)
-            await self._db.players.create_index("user_id")  # For querying all profiles of a user
-
-            # Player stats collection indexes
-            await self._db.player_stats.create_index("token", unique=True)
-            await self._db.player_stats.create_index(
-                [("experience_earned", -1)]  # For leaderboard queries
+            await asyncio.gather(
+                # Games collection indexes
+                db.games.create_index("game_id", unique=True),
+                db.games.create_index("last_activity"),
+                db.games.create_index("created_at"),
+
+                # Users collection indexes
+                db.users.create_index("user_id", unique=True),
+                db.users.create_index("email", unique=True),
+
+                # Players collection indexes
+                db.players.create_index("token", unique=True),
+                db.players.create_index("user_id"),  # For querying all profiles of a user
+
+                # Player stats collection indexes
+                db.player_stats.create_index("token", unique=True),
+                db.player_stats.create_index(
+                    [("experience_earned", -1)]  # For leaderboard queries
+                ),
+
+                # Species knowledge collection indexes
+                db.species_knowledge.create_index("monster_type", unique=True),
+                db.species_knowledge.create_index("schema_version"),
+
+                # Species history collection indexes (species_history holds
+                # legacy embedded histories until they are migrated to events)
+                db.species_history.create_index("monster_type", unique=True),
+                db.species_history_events.create_index(
+                    [("monster_type", 1), ("timestamp", -1)]
+                ),
+
+                # Monster and spawn rate config lookups (MonsterService)
+                db.monsters.create_index("config_version"),
+                db.spawn_rates.create_index("config_version", unique=True),
+
+                # Sandbox collection indexes
+                db.sandbox.create_index("singleton", unique=True),
             )
 
-            # Species knowledge collection indexes
-            await self._db.species_knowledge.create_index("monster_type", unique=True)
-            await self._db.species_knowledge.create_index("schema_version")
-
-            # Species history collection indexes
-            await self._db.species_history.create_index("monster_type", unique=True)
-
-            # Spawn rates collection indexes
-            await self._db.spawn_rates.create_index("config_version", unique=True)
-
-            # Sandbox collection indexes
-            await self._db.sandbox.create_index("singleton", unique=True)
-
             logger.info("[MongoDB] Indexes created successfully")
 
         except Exception as e:
@@ -119,6 +119,13 @@ class Monster:
     # Future expansion
     target_player_id: Optional[str] = None
     last_seen_player_pos: Optional[tuple[int, int]] = None
+
+    # Per-monster stagger for movement rate limits (not serialized); a
+    # multiple of 2 and 3 so callers can take either modulus from it
+    move_jitter: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.move_jitter = hash(self.id) % 6
     
     def to_dict(self) -> dict:
         """Serialize monster to dictionary."""
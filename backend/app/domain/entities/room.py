@@ -2,6 +2,7 @@
 Room entity for DungeonAI.
 """
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import Optional
 
 
@@ -22,6 +23,17 @@ ROOM_TYPES = [
 ]
 
 
+def _room_index(ref) -> int:
+    """Convert a connected-room reference to a room index.
+    
+    Older saves stored generator IDs ("room_1", "room_2", ...) which map to
+    index N - 1 of the room list.
+    """
+    if isinstance(ref, str):
+        return int(ref.rsplit("_", 1)[-1]) - 1
+    return ref
+
+
 @dataclass
 class Room:
     """Represents a room in the dungeon."""
@@ -34,7 +46,7 @@ class Room:
     name: str = ""
     description: str = ""
     furniture: list[tuple[int, int, int]] = field(default_factory=list)  # (x, y, tile_type)
-    connected_rooms: list[str] = field(default_factory=list)
+    connected_rooms: list[int] = field(default_factory=list)  # indices into the map's room list
     visited: bool = False  # Track if room has been visited (for monster spawning)
     
     # Future expansion
@@ -43,17 +55,19 @@ class Room:
     trap_type: Optional[str] = None
     light_level: int = 100  # 0-100, for future lighting system
     
-    @property
+    # Room geometry never changes after creation, so centers are computed once
+    # and then read back as plain instance attributes.
+    @cached_property
     def center_x(self) -> int:
         """Get center X coordinate."""
         return self.x + self.width // 2
     
-    @property
+    @cached_property
     def center_y(self) -> int:
         """Get center Y coordinate."""
         return self.y + self.height // 2
     
-    @property
+    @cached_property
     def center(self) -> tuple[int, int]:
         """Get center coordinates."""
         return (self.center_x, self.center_y)
@@ -106,7 +120,7 @@ class Room:
             name=data.get("name", ""),
             description=data.get("description", ""),
             furniture=data.get("furniture", []),
-            connected_rooms=data.get("connected_rooms", []),
+            connected_rooms=[_room_index(r) for r in data.get("connected_rooms", [])],
             visited=data.get("visited", False),
             locked=data.get("locked", False),
             required_key=data.get("required_key"),
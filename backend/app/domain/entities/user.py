@@ -7,6 +7,13 @@ from typing import Optional
 import uuid
 
 
+def _as_iso(value) -> Optional[str]:
+    """ISO string for a stored timestamp (BSON dates come back as datetime)."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
 @dataclass
 class User:
     """User account with authentication credentials."""
@@ -50,7 +57,7 @@ class User:
             role=data.get("role", "user"),
             is_active=data.get("is_active", True),
             created_at=data.get("created_at", datetime.utcnow().isoformat()),
-            last_login=data.get("last_login")
+            last_login=_as_iso(data.get("last_login"))
         )
 
     def update_last_login(self):
@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, Optional, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
 
 import numpy as np
 
@@ -65,6 +65,48 @@ class DecisionEngine:
             confidence=confidence,
         )
 
+    def decide_batch(self, contexts: Sequence[DecisionContext]) -> List[DecisionResult]:
+        """
+        Decide for many monsters of one species in a single pass.
+        
+        All contexts must share the same q_table and personality. State
+        encoding, Q-row lookup and action selection run as array operations
+        over the whole batch.
+        """
+        if not contexts:
+            return []
+        q_table = contexts[0].q_table
+        features = [self._state_features(context) for context in contexts]
+        state_indices, multi_indices = self.encoder.encode_batch(
+            **{name: [feature[name] for feature in features] for name in features[0]}
+        )
+        actions = self.agent.select_actions(
+            q_table,
+            state_indices,
+            personality=contexts[0].personality,
+        )
+        q_max = np.max(q_table[state_indices], axis=1).astype(np.float64)
+        confidence = np.where(q_max != 0, 1.0 / (1.0 + np.exp(-q_max)), 0.5)
+
+        results = []
+        for context, state_index, multi_index, action_value, score in zip(
+            contexts,
+            state_indices.tolist(),
+            multi_indices.tolist(),
+            actions.tolist(),
+            confidence.tolist(),
+        ):
+            action = AIAction(action_value)
+            multi_index = tuple(multi_index)
+            AIDebugger.log_decision(context.monster.id, state_index, action, multi_index)
+            results.append(DecisionResult(
+                action=action,
+                state_index=state_index,
+                discrete_state=multi_index,
+                confidence=score,
+            ))
+        return results
+
     def learn(
         self,
         q_table: np.ndarray,
@@ -79,8 +121,12 @@ class DecisionEngine:
         AIDebugger.log_reward(state_index, action, reward, next_state_index)
 
     def _encode_state(self, context: DecisionContext) -> Tuple[int, Tuple[int, int, int, int, int, int, int]]:
+        """Encode the current world state into a discrete state index."""
+        return self.encoder.encode(**self._state_features(context))
+
+    def _state_features(self, context: DecisionContext) -> Dict[str, object]:
         """
-        Encode the current world state into a discrete state index.
+        Extract the encoder inputs for one monster.
         
         Handles intelligence-based awareness gating: low-intelligence monsters
         (intelligence <= OBLIVIOUS_INTELLIGENCE_THRESHOLD) are "oblivious" to players
@@ -109,12 +155,12 @@ class DecisionEngine:
             distance_to_threat = raw_distance
             threat_direction = raw_threat_direction
         
-        return self.encoder.encode(
-            hp_ratio=max(0.0, min(1.0, hp_ratio)),
-            enemy_count=max(0, enemy_count),
-            ally_count=max(0, ally_count),
-            room_type=room_type,
-            distance_to_threat=max(0, distance_to_threat),
-            threat_direction=threat_direction,
-            in_corridor=in_corridor,
-        )
+        return {
+            "hp_ratio": max(0.0, min(1.0, hp_ratio)),
+            "enemy_count": max(0, enemy_count),
+            "ally_count": max(0, ally_count),
+            "room_type": room_type,
+            "distance_to_threat": max(0, distance_to_threat),
+            "threat_direction": threat_direction,
+            "in_corridor": in_corridor,
+        }
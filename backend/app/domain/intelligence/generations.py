@@ -35,6 +35,18 @@ from .learning import SCHEMA_VERSION
 HISTORY_LIMIT = 1000
 
 
+def resize_q_table(q_table: np.ndarray, state_space: int, action_count: int) -> np.ndarray:
+    """
+    Q-table of shape (state_space, action_count) keeping the overlapping
+    values of q_table; new states and actions start at zero.
+    """
+    resized = np.zeros((state_space, action_count), dtype=np.float32)
+    min_states = min(state_space, q_table.shape[0])
+    min_actions = min(action_count, q_table.shape[1])
+    resized[:min_states, :min_actions] = q_table[:min_states, :min_actions]
+    return resized
+
+
 @dataclass
 class LearningHistoryEntry:
     """Single learning event for tracking evolution over time."""
@@ -120,9 +132,9 @@ class SpeciesKnowledgeRecord:
         )
         self.history.append(entry)
         self._history_dirty = True
-        # Trim to limit
+        # Trim to limit in place; re-slicing copied the whole list per event
         if len(self.history) > HISTORY_LIMIT:
-            self.history = self.history[-HISTORY_LIMIT:]
+            del self.history[:-HISTORY_LIMIT]
 
 
 class SpeciesKnowledgeStore:
@@ -324,22 +336,19 @@ class SpeciesKnowledgeStore:
         Automatically resizes Q-table if state space changed (preserving
         as much learned knowledge as possible through truncation/padding).
         """
-        if monster_type not in self.records:
+        # Called per monster decision: one lookup on the common path
+        record = self.records.get(monster_type)
+        if record is None:
             table = np.zeros((state_space, action_count), dtype=np.float32)
-            self.records[monster_type] = SpeciesKnowledgeRecord(
+            record = self.records[monster_type] = SpeciesKnowledgeRecord(
                 monster_type=monster_type,
                 generation=0,
                 q_table=table,
             )
-        record = self.records[monster_type]
         # Resize table if encoder changed (e.g., new bins).
-        if record.q_table.shape != (state_space, action_count):
+        elif record.q_table.shape != (state_space, action_count):
             print(f"[SpeciesKnowledgeStore] Resizing {monster_type} Q-table: {record.q_table.shape} -> ({state_space}, {action_count})")
-            padded = np.zeros((state_space, action_count), dtype=np.float32)
-            min_states = min(state_space, record.q_table.shape[0])
-            min_actions = min(action_count, record.q_table.shape[1])
-            padded[:min_states, :min_actions] = record.q_table[:min_states, :min_actions]
-            record.q_table = padded
+            record.q_table = resize_q_table(record.q_table, state_space, action_count)
         return record
 
     def bump_generation(self, monster_type: str, max_generation: int | None = None) -> None:
@@ -416,6 +425,10 @@ class SpeciesKnowledgeStore:
             return record.history[-limit:]
         return record.history
     
+    async def get_history_async(self, monster_type: str, limit: int = 0) -> List[LearningHistoryEntry]:
+        """Async counterpart of get_history, matching the MongoDB store."""
+        return self.get_history(monster_type, limit)
+
     def record_learning_event(
         self,
         monster_type: str,
@@ -333,6 +333,39 @@ class StateEncoder:
         multi_index = (hp_idx, enemy_idx, ally_idx, room_idx, distance_idx, direction_idx, corridor_idx)
         flat_index = self._flatten_index(multi_index)
         return flat_index, multi_index
+
+    def encode_batch(
+        self,
+        *,
+        hp_ratio: Sequence[float],
+        enemy_count: Sequence[int],
+        ally_count: Sequence[int],
+        room_type: Sequence[str],
+        distance_to_threat: Sequence[int],
+        threat_direction: Sequence[int],
+        in_corridor: Sequence[bool],
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Vectorized encode() for many observations at once.
+        
+        Each argument holds one value per observation, in the same units as
+        encode().
+        
+        Returns:
+            Tuple of (flat_indices, multi_indices) where flat_indices has shape
+            (n,) and multi_indices has shape (n, 7), matching encode() row by row
+        """
+        multi_index = np.column_stack((
+            self._bucket_batch(hp_ratio, self.hp_bins),
+            self._bucket_batch(enemy_count, self.enemy_bins),
+            self._bucket_batch(ally_count, self.ally_bins),
+            np.fromiter((ROOM_CATEGORIES.get(room, 1) for room in room_type), dtype=np.intp, count=len(room_type)),
+            self._bucket_batch(distance_to_threat, self.distance_bins),
+            np.clip(np.asarray(threat_direction, dtype=np.intp), 0, 8),
+            np.asarray(in_corridor, dtype=bool).astype(np.intp),
+        ))
+        flat_index = np.ravel_multi_index(multi_index.T, self.state_shape)
+        return flat_index, multi_index
     
     def _bucket(self, value: float, bins: Sequence) -> int:
         """
@@ -345,6 +378,12 @@ class StateEncoder:
                 return idx
         return len(bins) - 1
 
+    @staticmethod
+    def _bucket_batch(values: Sequence, bins: Sequence) -> np.ndarray:
+        """Vectorized _bucket(): first bin whose threshold is >= value."""
+        indices = np.searchsorted(bins, values, side="left")
+        return np.minimum(indices, len(bins) - 1)
+
     def _flatten_index(self, indices: Tuple[int, ...]) -> int:
         """
         Convert multi-dimensional index to flat index for Q-table lookup.
@@ -483,6 +522,42 @@ class QLearningAgent:
         action_idx = int(np.argmax(weighted))
         return AIAction(action_idx)
 
+    def select_actions(
+        self,
+        q_table: np.ndarray,
+        state_indices: np.ndarray,
+        *,
+        personality: Optional["PersonalityProfile"] = None,
+    ) -> np.ndarray:
+        """
+        Vectorized select_action() for many states of one Q-table.
+        
+        Applies the same personality weighting row by row. Exploration draws
+        from ``random`` in the same order as calling select_action() per state,
+        so seeded runs pick the same actions on either path.
+        
+        Returns:
+            np.ndarray of action values (AIAction.value), one per state index
+        """
+        q_values = q_table[state_indices]
+
+        if personality:
+            biases = np.array(
+                [personality.action_bias(action) for action in AIAction],
+                dtype=np.float32,
+            )
+            learned = np.max(np.abs(q_values), axis=1) >= 0.1
+            weighted = np.where(learned[:, None], q_values * biases, biases)
+        else:
+            weighted = q_values
+
+        actions = np.argmax(weighted, axis=1)
+        all_actions = AIAction.list()
+        for i in range(len(actions)):
+            if random.random() < self.exploration_rate:
+                actions[i] = random.choice(all_actions).value
+        return actions
+
     def update(
         self,
         q_table: np.ndarray,
@@ -5,14 +5,18 @@ from .tiles import (
     TILE_FLOOR, TILE_WALL, TILE_DOOR_CLOSED, TILE_DOOR_OPEN,
     TILE_CHEST, TILE_TABLE, TILE_CHAIR, TILE_BED,
     TILE_BOOKSHELF, TILE_BARREL, TILE_TORCH, TILE_VOID,
-    FURNITURE_TILES, TILE_TYPES, WALKABLE_TILES, is_walkable, is_door
+    FURNITURE_TILES, TILE_TYPES, WALKABLE_TILES, is_walkable, is_door,
+    TileGrid,
 )
 from .dungeon import GeneratedMap
 from .generator import generate_dungeon, DungeonGenerator
 from .pathfinding import (
     Direction,
     AStar,
+    PathFollower,
     get_direction_to_target,
+    build_room_mask,
+    get_corridor_mask,
     get_corridor_positions,
     is_in_corridor,
     find_nearest_corridor,
@@ -25,11 +29,14 @@ __all__ = [
     "TILE_BOOKSHELF", "TILE_BARREL", "TILE_TORCH", "TILE_VOID",
     "FURNITURE_TILES", "TILE_TYPES", "WALKABLE_TILES",
     # Tile utilities
-    "is_walkable", "is_door",
+    "is_walkable", "is_door", "TileGrid",
     # Pathfinding
     "Direction",
     "AStar",
+    "PathFollower",
     "get_direction_to_target",
+    "build_room_mask",
+    "get_corridor_mask",
     "get_corridor_positions",
     "is_in_corridor",
     "find_nearest_corridor",
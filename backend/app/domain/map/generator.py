@@ -9,8 +9,11 @@ Rules:
 - All rooms are guaranteed to be reachable
 """
 import random
+from collections import deque
 from typing import Optional
 
+import numpy as np
+
 from ..entities.room import Room, ROOM_TYPES
 from .tiles import (
     TILE_FLOOR, TILE_WALL, TILE_DOOR_CLOSED, TILE_DOOR_OPEN,
@@ -19,6 +22,97 @@ from .tiles import (
 from .dungeon import GeneratedMap
 
 
+# Room type -> (display name, name prefixes)
+_ROOM_NAMES: dict[str, tuple[str, tuple[str, ...]]] = {
+    "chamber": ("Chamber", ("Ancient", "Dusty", "Forgotten", "Hidden", "Dark")),
+    "library": ("Library", ("Ruined", "Arcane", "Silent", "Forbidden", "Lost")),
+    "armory": ("Armory", ("Old", "Royal", "Abandoned", "Guard's", "Knight's")),
+    "bedroom": ("Bedroom", ("Noble's", "Servant's", "Guest", "Master", "Dusty")),
+    "storage": ("Storage Room", ("Supply", "Old", "Forgotten", "Cluttered", "Dark")),
+    "throne_room": ("Throne Room", ("Grand", "Fallen", "Ancient", "Cursed", "Royal")),
+    "dining_hall": ("Dining Hall", ("Great", "Abandoned", "Noble", "Feasting", "Old")),
+    "crypt": ("Crypt", ("Silent", "Haunted", "Ancient", "Forgotten", "Dark")),
+    "treasury": ("Treasury", ("Empty", "Looted", "Hidden", "Royal", "Forgotten")),
+    "dungeon_cell": ("Cell", ("Dark", "Damp", "Forgotten", "Torture", "Prison")),
+    "alchemy_lab": ("Laboratory", ("Abandoned", "Mysterious", "Arcane", "Ruined", "Secret")),
+    "guard_post": ("Guard Post", ("Abandoned", "Old", "Watchtower", "Patrol", "Empty")),
+}
+_DEFAULT_ROOM_NAME = ("Room", ("Mysterious",))
+
+# Tiles the reachability flood fill may pass through, and the same set as a
+# lookup table indexed by tile id (one gather classifies a whole grid)
+_FLOOD_WALKABLE_TILES = frozenset((TILE_FLOOR, TILE_DOOR_CLOSED, TILE_DOOR_OPEN, TILE_CHEST, TILE_TORCH))
+_FLOOD_WALKABLE = np.zeros(256, dtype=bool)
+_FLOOD_WALKABLE[list(_FLOOD_WALKABLE_TILES)] = True
+
+
+def _dilate(mask: np.ndarray) -> np.ndarray:
+    """Grow a boolean mask by one cell in all 8 directions (3x3 dilation)."""
+    height, width = mask.shape
+    dilated = mask.copy()
+    for dy in (-1, 0, 1):
+        for dx in (-1, 0, 1):
+            if dx == 0 and dy == 0:
+                continue
+            dilated[max(0, dy):height + min(0, dy), max(0, dx):width + min(0, dx)] |= \
+                mask[max(0, -dy):height + min(0, -dy), max(0, -dx):width + min(0, -dx)]
+    return dilated
+
+
+def _room_masks(bounds: np.ndarray, height: int, width: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Build room masks from an (N, 4) table of room (x, y, width, height).
+    
+    Returns (inside, forbidden): inside marks room floor; forbidden also
+    marks the wall lines cardinally adjacent to each room and the 3x3 block
+    around each room corner, where corridors must not be carved.
+    """
+    inside = np.zeros((height, width), dtype=bool)
+    forbidden = np.zeros_like(inside)
+    
+    for x1, y1, w, h in bounds.tolist():
+        x2, y2 = x1 + w, y1 + h
+        inside[y1:y2, x1:x2] = True
+        
+        # Wall lines cardinally adjacent to the floor
+        forbidden[max(y1 - 1, 0), x1:x2] = True
+        forbidden[min(y2, height - 1), x1:x2] = True
+        forbidden[y1:y2, max(x1 - 1, 0)] = True
+        forbidden[y1:y2, min(x2, width - 1)] = True
+    
+    # Corners and their diagonal neighbours: stamp a 3x3 block around every
+    # corner of every room in one scatter
+    x1, y1 = bounds[:, 0], bounds[:, 1]
+    x2, y2 = x1 + bounds[:, 2], y1 + bounds[:, 3]
+    corner_x = np.stack((x1 - 1, x2, x1 - 1, x2), axis=1).reshape(-1, 1, 1)
+    corner_y = np.stack((y1 - 1, y1 - 1, y2, y2), axis=1).reshape(-1, 1, 1)
+    offsets = np.arange(-1, 2)
+    block_x = np.clip(corner_x + offsets[None, None, :], 0, width - 1)
+    block_y = np.clip(corner_y + offsets[None, :, None], 0, height - 1)
+    forbidden[block_y, block_x] = True
+    
+    return inside, inside | forbidden
+
+
+class _UnionFind:
+    """Disjoint-set forest over room indices."""
+    
+    def __init__(self, size: int):
+        self.parent = list(range(size))
+    
+    def find(self, i: int) -> int:
+        """Return the representative of i's set, halving paths on the way."""
+        parent = self.parent
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+    
+    def union(self, a: int, b: int) -> None:
+        """Merge the sets containing a and b."""
+        self.parent[self.find(b)] = self.find(a)
+
+
 class DungeonGenerator:
     """
     Generates procedural dungeons with:
@@ -31,6 +125,9 @@ class DungeonGenerator:
     MAX_SIZE = 5000
     CORRIDOR_WIDTH = 1
     MIN_ROOM_GAP = 10  # Minimum gap between rooms (for corridor + walls)
+    PLACEMENT_PASSES = 16  # Passes over the placement cells, one candidate room per cell each
+    ROOM_GRID_CELL = 32  # Bucket size of the placed-room spatial index
+    VERIFY_CONNECTIVITY = False  # Re-check reachability with a flood fill (debugging)
     
     def __init__(
         self,
@@ -49,21 +146,27 @@ class DungeonGenerator:
         self.seed = seed if seed is not None else random.randint(0, 2**31 - 1)
         
         self.rng = random.Random(self.seed)
-        self.tiles: list[list[int]] = []
+        self.tiles: np.ndarray = np.empty((0, 0), dtype=np.uint8)
         self.rooms: list[Room] = []
         self.room_id_counter = 0
-        self.corridor_tiles: set[tuple[int, int]] = set()
+        self._corridor_mask: np.ndarray = np.zeros((0, 0), dtype=bool)
+        self._room_grid: dict[tuple[int, int], list[int]] = {}
+        self._room_bounds: np.ndarray = np.zeros((0, 4), dtype=np.int32)
+        self._room_mask: np.ndarray = np.zeros((0, 0), dtype=bool)
+        self._forbidden: np.ndarray = np.zeros((0, 0), dtype=bool)
         
     def generate(self) -> GeneratedMap:
         """Generate a complete dungeon map."""
         # Initialize all tiles as void
-        self.tiles = [[TILE_VOID for _ in range(self.width)] for _ in range(self.height)]
+        self.tiles = np.full((self.height, self.width), TILE_VOID, dtype=np.uint8)
         self.rooms = []
         self.room_id_counter = 0
-        self.corridor_tiles = set()
+        self._corridor_mask = np.zeros((self.height, self.width), dtype=bool)
+        self._room_grid = {}
         
         # Step 1: Place rooms with gaps (no adjacency)
         self._place_rooms()
+        self._build_room_masks()
         
         # Step 2: Connect rooms with 1-tile wide corridors
         self._connect_rooms()
@@ -74,8 +177,9 @@ class DungeonGenerator:
         # Step 4: Place doors at corridor-room junctions
         self._place_doors()
         
-        # Step 5: Verify all rooms are reachable
-        self._ensure_all_rooms_connected()
+        # Step 5: Verify all rooms are reachable (guaranteed by _connect_rooms)
+        if self.VERIFY_CONNECTIVITY:
+            self._ensure_all_rooms_connected()
         
         # Step 6: Place chests in some rooms
         self._place_chests()
@@ -89,7 +193,7 @@ class DungeonGenerator:
         return GeneratedMap(
             width=self.width,
             height=self.height,
-            tiles=self.tiles,
+            tiles=self.tiles.tolist(),
             rooms=self.rooms,
             spawn_x=spawn_x,
             spawn_y=spawn_y,
@@ -97,48 +201,83 @@ class DungeonGenerator:
         )
     
     def _place_rooms(self) -> None:
-        """Place rooms ensuring they are not adjacent (minimum gap between them)."""
-        attempts = 0
-        max_attempts = self.room_count * 100
-        
-        while len(self.rooms) < self.room_count and attempts < max_attempts:
-            attempts += 1
-            
-            # Generate random room dimensions
-            room_width = self.rng.randint(self.min_room_size, self.max_room_size)
-            room_height = self.rng.randint(self.min_room_size, self.max_room_size)
-            
-            # Random position (leaving margin for walls and corridors)
-            margin = self.MIN_ROOM_GAP + 2
-            max_x = self.width - room_width - margin
-            max_y = self.height - room_height - margin
+        """
+        Place rooms ensuring they are not adjacent (minimum gap between them).
+        
+        The map is partitioned into cells just wider than the smallest room.
+        Each pass visits the cells in a fixed random order and draws one
+        candidate room whose corner lies inside the cell, checked against the
+        room grid. Cells this small still offer a candidate position
+        everywhere a room could fit, so room counts match the old
+        room_count * 100 rejection sampling while the total work stays
+        bounded by PLACEMENT_PASSES * cells.
+        """
+        margin = self.MIN_ROOM_GAP + 2
+        cell = self.min_room_size + 1
+        cells = [
+            (cx, cy)
+            for cy in range(margin, self.height - margin, cell)
+            for cx in range(margin, self.width - margin, cell)
+        ]
+        self.rng.shuffle(cells)
+        
+        # Draw room types and, per pass, all candidate sizes in batched calls
+        sizes = range(self.min_room_size, self.max_room_size + 1)
+        room_types = self.rng.choices(ROOM_TYPES, k=self.room_count)
+        
+        for _ in range(self.PLACEMENT_PASSES):
+            widths = self.rng.choices(sizes, k=len(cells))
+            heights = self.rng.choices(sizes, k=len(cells))
             
-            if max_x <= margin or max_y <= margin:
-                continue
+            for (cell_x, cell_y), room_width, room_height in zip(cells, widths, heights):
+                if len(self.rooms) >= self.room_count:
+                    return
                 
-            room_x = self.rng.randint(margin, max_x)
-            room_y = self.rng.randint(margin, max_y)
-            
-            # Check if room overlaps or is too close to existing rooms
-            if self._room_fits(room_x, room_y, room_width, room_height):
-                self.room_id_counter += 1
-                room_type = self.rng.choice(ROOM_TYPES)
-                room = Room(
-                    id=f"room_{self.room_id_counter}",
-                    x=room_x,
-                    y=room_y,
-                    width=room_width,
-                    height=room_height,
-                    room_type=room_type,
-                    name=self._generate_room_name(room_type)
-                )
+                # Random position inside the cell (leaving margin for walls and corridors)
+                max_x = min(self.width - room_width - margin, cell_x + cell - 1)
+                max_y = min(self.height - room_height - margin, cell_y + cell - 1)
+                
+                if max_x <= margin or max_y <= margin or max_x < cell_x or max_y < cell_y:
+                    continue
                 
-                # Carve floor tiles
-                for y in range(room_y, room_y + room_height):
-                    for x in range(room_x, room_x + room_width):
-                        self.tiles[y][x] = TILE_FLOOR
+                room_x = self.rng.randint(cell_x, max_x)
+                room_y = self.rng.randint(cell_y, max_y)
                 
-                self.rooms.append(room)
+                # Check if room is too close to rooms in neighbouring cells
+                if self._room_fits(room_x, room_y, room_width, room_height):
+                    room_type = room_types[len(self.rooms)]
+                    self._add_room(room_x, room_y, room_width, room_height, room_type)
+    
+    def _add_room(self, x: int, y: int, w: int, h: int, room_type: str) -> None:
+        """Create a room, carve its floor and register it in the room grid."""
+        self.room_id_counter += 1
+        room = Room(
+            id=f"room_{self.room_id_counter}",
+            x=x,
+            y=y,
+            width=w,
+            height=h,
+            room_type=room_type,
+            name=self._generate_room_name(room_type)
+        )
+        
+        # Carve floor tiles
+        self.tiles[y:y + h, x:x + w] = TILE_FLOOR
+        
+        self._index_room(len(self.rooms), x, y, w, h)
+        self.rooms.append(room)
+    
+    def _grid_cells(self, x1: int, y1: int, x2: int, y2: int):
+        """Yield the room-grid buckets overlapping the half-open box [x1, x2) x [y1, y2)."""
+        cell = self.ROOM_GRID_CELL
+        for gy in range(y1 // cell, (y2 - 1) // cell + 1):
+            for gx in range(x1 // cell, (x2 - 1) // cell + 1):
+                yield (gx, gy)
+    
+    def _index_room(self, index: int, x: int, y: int, w: int, h: int) -> None:
+        """Register a placed room in every grid bucket it covers."""
+        for key in self._grid_cells(x, y, x + w, y + h):
+            self._room_grid.setdefault(key, []).append(index)
     
     def _room_fits(self, x: int, y: int, w: int, h: int) -> bool:
         """Check if a room fits without being adjacent to other rooms."""
@@ -147,7 +286,13 @@ class DungeonGenerator:
         check_x2 = x + w + self.MIN_ROOM_GAP
         check_y2 = y + h + self.MIN_ROOM_GAP
         
-        for room in self.rooms:
+        # Only rooms sharing a bucket with the expanded box can overlap it
+        candidates = set()
+        for key in self._grid_cells(check_x1, check_y1, check_x2, check_y2):
+            candidates.update(self._room_grid.get(key, ()))
+        
+        for index in candidates:
+            room = self.rooms[index]
             room_x2 = room.x + room.width
             room_y2 = room.y + room.height
             
@@ -159,31 +304,59 @@ class DungeonGenerator:
         return True
     
     def _connect_rooms(self) -> None:
-        """Connect all rooms with corridors using MST approach."""
-        if len(self.rooms) < 2:
+        """
+        Connect all rooms with corridors along a minimum spanning tree.
+        
+        Uses Prim's algorithm on a pairwise distance matrix of room centers,
+        keeping for every unconnected room its nearest connected room so each
+        step is a single argmin instead of a scan over all pairs.
+        
+        Corridors that actually open a walkable path are recorded in a
+        union-find; rooms left in other components afterwards are joined with
+        a forced corridor, so every room is reachable without a flood fill.
+        """
+        count = len(self.rooms)
+        if count < 2:
             return
         
-        connected = {0}
-        unconnected = set(range(1, len(self.rooms)))
+        bounds = self._room_bounds
+        centers = (bounds[:, :2] + bounds[:, 2:] // 2).astype(np.float64)
+        dist = np.hypot(
+            centers[:, 0:1] - centers[None, :, 0],
+            centers[:, 1:2] - centers[None, :, 1],
+        )
         
-        while unconnected:
-            best_dist = float('inf')
-            best_pair = None
+        connected = np.zeros(count, dtype=bool)
+        connected[0] = True
+        best_dist = dist[0].copy()
+        best_parent = np.zeros(count, dtype=np.intp)
+        best_dist[0] = np.inf
+        
+        components = _UnionFind(count)
+        
+        for _ in range(count - 1):
+            ui = int(np.argmin(best_dist))
+            ci = int(best_parent[ui])
             
-            for ci in connected:
-                for ui in unconnected:
-                    dist = self._room_distance(self.rooms[ci], self.rooms[ui])
-                    if dist < best_dist:
-                        best_dist = dist
-                        best_pair = (ci, ui)
+            if self._carve_corridor(self.rooms[ci], self.rooms[ui]):
+                components.union(ci, ui)
+            self.rooms[ci].connected_rooms.append(ui)
+            self.rooms[ui].connected_rooms.append(ci)
             
-            if best_pair:
-                ci, ui = best_pair
-                self._carve_corridor(self.rooms[ci], self.rooms[ui])
-                self.rooms[ci].connected_rooms.append(self.rooms[ui].id)
-                self.rooms[ui].connected_rooms.append(self.rooms[ci].id)
-                connected.add(ui)
-                unconnected.remove(ui)
+            connected[ui] = True
+            best_dist[ui] = np.inf
+            closer = ~connected & (dist[ui] < best_dist)
+            best_dist[closer] = dist[ui][closer]
+            best_parent[closer] = ui
+        
+        # Join every room cut off from the spawn room to its nearest reachable room
+        for i in range(1, count):
+            if components.find(i) == components.find(0):
+                continue
+            reachable = [j for j in range(count) if components.find(j) == components.find(0)]
+            nearest = min(reachable, key=lambda j: dist[i, j])
+            self._force_corridor(self.rooms[nearest], self.rooms[i])
+            components.union(nearest, i)
     
     def _room_distance(self, room1: Room, room2: Room) -> float:
         """Calculate distance between room centers."""
@@ -191,140 +364,92 @@ class DungeonGenerator:
         dy = room1.center_y - room2.center_y
         return (dx * dx + dy * dy) ** 0.5
     
-    def _carve_corridor(self, room1: Room, room2: Room) -> None:
-        """Carve a 1-tile wide L-shaped corridor between two rooms."""
+    def _carve_corridor(self, room1: Room, room2: Room) -> bool:
+        """
+        Carve a 1-tile wide L-shaped corridor between two rooms.
+        
+        Returns True if the corridor forms a walkable path between the two
+        room centers once walls and doors are placed.
+        """
         x1, y1 = room1.center_x, room1.center_y
         x2, y2 = room2.center_x, room2.center_y
+        step_x = 1 if x2 >= x1 else -1
+        step_y = 1 if y2 >= y1 else -1
         
         if self.rng.random() < 0.5:
             self._carve_h_corridor(x1, x2, y1)
             self._carve_v_corridor(y1, y2, x2)
+            path = [(x, y1) for x in range(x1, x2 + step_x, step_x)]
+            path += [(x2, y) for y in range(y1 + step_y, y2 + step_y, step_y)]
         else:
             self._carve_v_corridor(y1, y2, x1)
             self._carve_h_corridor(x1, x2, y2)
+            path = [(x1, y) for y in range(y1, y2 + step_y, step_y)]
+            path += [(x, y2) for x in range(x1 + step_x, x2 + step_x, step_x)]
+        
+        return self._path_is_open(path)
     
-    def _is_inside_room(self, x: int, y: int) -> bool:
-        """Check if a position is inside any room's floor area."""
-        for room in self.rooms:
-            if room.x <= x < room.x + room.width and room.y <= y < room.y + room.height:
-                return True
-        return False
-    
-    def _is_adjacent_to_room_floor(self, x: int, y: int) -> bool:
-        """Check if position is cardinally adjacent to any room floor tile."""
-        for room in self.rooms:
-            if x == room.x - 1 and room.y <= y < room.y + room.height:
-                return True
-            if x == room.x + room.width and room.y <= y < room.y + room.height:
-                return True
-            if y == room.y - 1 and room.x <= x < room.x + room.width:
-                return True
-            if y == room.y + room.height and room.x <= x < room.x + room.width:
-                return True
-        return False
-    
-    def _is_at_room_corner(self, x: int, y: int) -> bool:
-        """Check if position is at or diagonally adjacent to any room corner."""
-        for room in self.rooms:
-            corners = [
-                (room.x - 1, room.y - 1),
-                (room.x + room.width, room.y - 1),
-                (room.x - 1, room.y + room.height),
-                (room.x + room.width, room.y + room.height),
-            ]
+    def _path_is_open(self, path: list[tuple[int, int]]) -> bool:
+        """
+        Check that a carved path will be walkable end to end.
+        
+        Every tile must be floor, except single wall tiles crossed straight
+        from room floor into corridor, which _place_doors turns into doors.
+        """
+        for k in range(1, len(path) - 1):
+            x, y = path[k]
+            if self.tiles[y, x] == TILE_FLOOR:
+                continue
             
-            for cx, cy in corners:
-                if abs(x - cx) <= 1 and abs(y - cy) <= 1:
-                    return True
-        return False
+            (px, py), (nx, ny) = path[k - 1], path[k + 1]
+            if px + nx != 2 * x or py + ny != 2 * y:
+                return False
+            if self._room_mask[py, px] and self._corridor_mask[ny, nx]:
+                continue
+            if self._room_mask[ny, nx] and self._corridor_mask[py, px]:
+                continue
+            return False
+        return True
+    
+    def _build_room_masks(self) -> None:
+        """Precompute the room bounds table and per-tile room masks used while carving corridors."""
+        self._room_bounds = np.array(
+            [(r.x, r.y, r.width, r.height) for r in self.rooms], dtype=np.int32
+        ).reshape(-1, 4)
+        self._room_mask, self._forbidden = _room_masks(self._room_bounds, self.height, self.width)
     
     def _carve_h_corridor(self, x1: int, x2: int, y: int) -> None:
         """Carve a horizontal corridor."""
-        for x in range(min(x1, x2), max(x1, x2) + 1):
-            if 0 <= x < self.width and 0 <= y < self.height:
-                if (not self._is_inside_room(x, y) and 
-                    not self._is_adjacent_to_room_floor(x, y) and
-                    not self._is_at_room_corner(x, y)):
-                    if self.tiles[y][x] == TILE_VOID:
-                        self.tiles[y][x] = TILE_FLOOR
-                        self.corridor_tiles.add((x, y))
+        if 0 <= y < self.height:
+            span = slice(max(min(x1, x2), 0), max(x1, x2) + 1)
+            self._carve_span(np.s_[y, span])
     
     def _carve_v_corridor(self, y1: int, y2: int, x: int) -> None:
         """Carve a vertical corridor."""
-        for y in range(min(y1, y2), max(y1, y2) + 1):
-            if 0 <= x < self.width and 0 <= y < self.height:
-                if (not self._is_inside_room(x, y) and 
-                    not self._is_adjacent_to_room_floor(x, y) and
-                    not self._is_at_room_corner(x, y)):
-                    if self.tiles[y][x] == TILE_VOID:
-                        self.tiles[y][x] = TILE_FLOOR
-                        self.corridor_tiles.add((x, y))
+        if 0 <= x < self.width:
+            span = slice(max(min(y1, y2), 0), max(y1, y2) + 1)
+            self._carve_span(np.s_[span, x])
+    
+    def _carve_span(self, index: tuple) -> None:
+        """Turn void tiles outside the forbidden mask into corridor floor along a 1D slice."""
+        tiles = self.tiles[index]
+        carve = ~self._forbidden[index] & (tiles == TILE_VOID)
+        tiles[carve] = TILE_FLOOR
+        self._corridor_mask[index][carve] = True
     
     def _add_walls(self) -> None:
         """Add single-line walls around all floor tiles."""
-        wall_positions = set()
-        
-        for y in range(self.height):
-            for x in range(self.width):
-                if self.tiles[y][x] == TILE_FLOOR:
-                    for dy in [-1, 0, 1]:
-                        for dx in [-1, 0, 1]:
-                            if dx == 0 and dy == 0:
-                                continue
-                            nx, ny = x + dx, y + dy
-                            if 0 <= nx < self.width and 0 <= ny < self.height:
-                                if self.tiles[ny][nx] == TILE_VOID:
-                                    wall_positions.add((nx, ny))
-        
-        for x, y in wall_positions:
-            self.tiles[y][x] = TILE_WALL
+        walls = _dilate(self.tiles == TILE_FLOOR) & (self.tiles == TILE_VOID)
+        self.tiles[walls] = TILE_WALL
     
     def _is_corridor_floor(self, x: int, y: int) -> bool:
         """Check if a position is a corridor floor tile."""
-        return (x, y) in self.corridor_tiles
+        return bool(self._corridor_mask[y, x])
     
     def _place_doors(self) -> None:
         """Place doors where corridors meet room walls."""
         for room in self.rooms:
-            # Top wall
-            wall_y = room.y - 1
-            if wall_y >= 0:
-                for x in range(room.x, room.x + room.width):
-                    if self.tiles[wall_y][x] == TILE_WALL:
-                        room_below = self.tiles[wall_y + 1][x] == TILE_FLOOR
-                        corridor_above = wall_y > 0 and self._is_corridor_floor(x, wall_y - 1)
-                        if room_below and corridor_above:
-                            self.tiles[wall_y][x] = TILE_DOOR_CLOSED
-            
-            # Bottom wall
-            wall_y = room.y + room.height
-            if wall_y < self.height:
-                for x in range(room.x, room.x + room.width):
-                    if self.tiles[wall_y][x] == TILE_WALL:
-                        room_above = self.tiles[wall_y - 1][x] == TILE_FLOOR
-                        corridor_below = wall_y < self.height - 1 and self._is_corridor_floor(x, wall_y + 1)
-                        if room_above and corridor_below:
-                            self.tiles[wall_y][x] = TILE_DOOR_CLOSED
-            
-            # Left wall
-            wall_x = room.x - 1
-            if wall_x >= 0:
-                for y in range(room.y, room.y + room.height):
-                    if self.tiles[y][wall_x] == TILE_WALL:
-                        room_right = self.tiles[y][wall_x + 1] == TILE_FLOOR
-                        corridor_left = wall_x > 0 and self._is_corridor_floor(wall_x - 1, y)
-                        if room_right and corridor_left:
-                            self.tiles[y][wall_x] = TILE_DOOR_CLOSED
-            
-            # Right wall
-            wall_x = room.x + room.width
-            if wall_x < self.width:
-                for y in range(room.y, room.y + room.height):
-                    if self.tiles[y][wall_x] == TILE_WALL:
-                        room_left = self.tiles[y][wall_x - 1] == TILE_FLOOR
-                        corridor_right = wall_x < self.width - 1 and self._is_corridor_floor(wall_x + 1, y)
-                        if room_left and corridor_right:
-                            self.tiles[y][wall_x] = TILE_DOOR_CLOSED
+            self._place_room_doors(room)
     
     def _ensure_all_rooms_connected(self) -> None:
         """
@@ -343,8 +468,7 @@ class DungeonGenerator:
         # Check which rooms are reachable
         unreachable_rooms = []
         for room in self.rooms:
-            room_center = (room.center_x, room.center_y)
-            if room_center not in reachable:
+            if not reachable[room.center_y, room.center_x]:
                 unreachable_rooms.append(room)
         
         # Force connect any unreachable rooms
@@ -354,9 +478,9 @@ class DungeonGenerator:
             best_room = None
             
             for room in self.rooms:
-                if room.id == unreachable_room.id:
+                if room is unreachable_room:
                     continue
-                if (room.center_x, room.center_y) in reachable:
+                if reachable[room.center_y, room.center_x]:
                     dist = self._room_distance(room, unreachable_room)
                     if dist < best_dist:
                         best_dist = dist
@@ -364,10 +488,10 @@ class DungeonGenerator:
             
             if best_room:
                 # Force carve a direct corridor
-                self._force_corridor(best_room, unreachable_room)
+                carved = self._force_corridor(best_room, unreachable_room)
                 
-                # Update walls after new corridor
-                self._add_walls()
+                # Wall in only the newly carved tiles
+                self._add_walls_around(carved)
                 
                 # Place door for the new connection
                 self._place_room_doors(unreachable_room)
@@ -375,96 +499,109 @@ class DungeonGenerator:
                 # Update reachable set
                 reachable = self._flood_fill(start_x, start_y)
     
-    def _flood_fill(self, start_x: int, start_y: int) -> set[tuple[int, int]]:
-        """Flood fill to find all walkable tiles reachable from a starting point."""
-        reachable = set()
-        walkable_tiles = {TILE_FLOOR, TILE_DOOR_CLOSED, TILE_DOOR_OPEN, TILE_CHEST, TILE_TORCH}
-        
-        stack = [(start_x, start_y)]
+    def _flood_fill(self, start_x: int, start_y: int) -> np.ndarray:
+        """
+        Flood fill to find all walkable tiles reachable from a starting point.
         
-        while stack:
-            x, y = stack.pop()
-            
-            if (x, y) in reachable:
-                continue
-            
-            if not (0 <= x < self.width and 0 <= y < self.height):
-                continue
-            
-            if self.tiles[y][x] not in walkable_tiles:
-                continue
-            
-            reachable.add((x, y))
+        Returns a boolean (height, width) mask of the reachable tiles.
+        """
+        width, size = self.width, self.width * self.height
+        
+        # Walk flat indices over byte buffers; per-element NumPy access is slow
+        walkable = _FLOOD_WALKABLE[self.tiles].tobytes()
+        reachable = bytearray(size)
+        
+        # Breadth-first search; tiles are marked when queued so each is queued once
+        queue = deque()
+        if 0 <= start_x < self.width and 0 <= start_y < self.height:
+            start = start_y * width + start_x
+            if walkable[start]:
+                reachable[start] = 1
+                queue.append(start)
+        
+        while queue:
+            i = queue.popleft()
+            x = i % width
             
-            # Add cardinal neighbors
-            stack.extend([(x+1, y), (x-1, y), (x, y+1), (x, y-1)])
-        
-        return reachable
+            # Visit cardinal neighbors
+            if x + 1 < width and walkable[i + 1] and not reachable[i + 1]:
+                reachable[i + 1] = 1
+                queue.append(i + 1)
+            if x > 0 and walkable[i - 1] and not reachable[i - 1]:
+                reachable[i - 1] = 1
+                queue.append(i - 1)
+            if i + width < size and walkable[i + width] and not reachable[i + width]:
+                reachable[i + width] = 1
+                queue.append(i + width)
+            if i >= width and walkable[i - width] and not reachable[i - width]:
+                reachable[i - width] = 1
+                queue.append(i - width)
+        
+        return np.frombuffer(reachable, dtype=bool).reshape(self.height, self.width)
     
-    def _force_corridor(self, room1: Room, room2: Room) -> None:
+    def _force_corridor(self, room1: Room, room2: Room) -> list[tuple[int, int]]:
         """
         Force carve a corridor between two rooms, ignoring adjacency checks.
         This ensures connectivity even if normal corridor placement failed.
+        
+        Returns the (x, y) positions that were turned into floor.
         """
         x1, y1 = room1.center_x, room1.center_y
         x2, y2 = room2.center_x, room2.center_y
+        carved = []
         
         # Horizontal then vertical
         for x in range(min(x1, x2), max(x1, x2) + 1):
             if 0 <= x < self.width and 0 <= y1 < self.height:
-                if self.tiles[y1][x] in (TILE_VOID, TILE_WALL):
-                    self.tiles[y1][x] = TILE_FLOOR
-                    if not self._is_inside_room(x, y1):
-                        self.corridor_tiles.add((x, y1))
+                if self.tiles[y1, x] in (TILE_VOID, TILE_WALL):
+                    self.tiles[y1, x] = TILE_FLOOR
+                    carved.append((x, y1))
+                    if not self._room_mask[y1, x]:
+                        self._corridor_mask[y1, x] = True
         
         for y in range(min(y1, y2), max(y1, y2) + 1):
             if 0 <= x2 < self.width and 0 <= y < self.height:
-                if self.tiles[y][x2] in (TILE_VOID, TILE_WALL):
-                    self.tiles[y][x2] = TILE_FLOOR
-                    if not self._is_inside_room(x2, y):
-                        self.corridor_tiles.add((x2, y))
+                if self.tiles[y, x2] in (TILE_VOID, TILE_WALL):
+                    self.tiles[y, x2] = TILE_FLOOR
+                    carved.append((x2, y))
+                    if not self._room_mask[y, x2]:
+                        self._corridor_mask[y, x2] = True
+        
+        return carved
+    
+    def _add_walls_around(self, positions: list[tuple[int, int]]) -> None:
+        """Add walls on void tiles around the given floor positions only."""
+        for x, y in positions:
+            block = self.tiles[max(y - 1, 0):y + 2, max(x - 1, 0):x + 2]
+            block[block == TILE_VOID] = TILE_WALL
     
     def _place_room_doors(self, room: Room) -> None:
         """Place doors for a specific room where corridors meet walls."""
+        tiles, corridors = self.tiles, self._corridor_mask
+        x1, y1 = room.x, room.y
+        x2, y2 = room.x + room.width, room.y + room.height
+        
+        # Each side passes (wall line, room floor line, corridor line beyond)
         # Top wall
-        wall_y = room.y - 1
-        if wall_y >= 0:
-            for x in range(room.x, room.x + room.width):
-                if self.tiles[wall_y][x] == TILE_WALL:
-                    room_below = self.tiles[wall_y + 1][x] == TILE_FLOOR
-                    corridor_above = wall_y > 0 and self._is_corridor_floor(x, wall_y - 1)
-                    if room_below and corridor_above:
-                        self.tiles[wall_y][x] = TILE_DOOR_CLOSED
+        if y1 >= 2:
+            self._open_wall_doors(tiles[y1 - 1, x1:x2], tiles[y1, x1:x2], corridors[y1 - 2, x1:x2])
         
         # Bottom wall
-        wall_y = room.y + room.height
-        if wall_y < self.height:
-            for x in range(room.x, room.x + room.width):
-                if self.tiles[wall_y][x] == TILE_WALL:
-                    room_above = self.tiles[wall_y - 1][x] == TILE_FLOOR
-                    corridor_below = wall_y < self.height - 1 and self._is_corridor_floor(x, wall_y + 1)
-                    if room_above and corridor_below:
-                        self.tiles[wall_y][x] = TILE_DOOR_CLOSED
+        if y2 + 1 < self.height:
+            self._open_wall_doors(tiles[y2, x1:x2], tiles[y2 - 1, x1:x2], corridors[y2 + 1, x1:x2])
         
         # Left wall
-        wall_x = room.x - 1
-        if wall_x >= 0:
-            for y in range(room.y, room.y + room.height):
-                if self.tiles[y][wall_x] == TILE_WALL:
-                    room_right = self.tiles[y][wall_x + 1] == TILE_FLOOR
-                    corridor_left = wall_x > 0 and self._is_corridor_floor(wall_x - 1, y)
-                    if room_right and corridor_left:
-                        self.tiles[y][wall_x] = TILE_DOOR_CLOSED
+        if x1 >= 2:
+            self._open_wall_doors(tiles[y1:y2, x1 - 1], tiles[y1:y2, x1], corridors[y1:y2, x1 - 2])
         
         # Right wall
-        wall_x = room.x + room.width
-        if wall_x < self.width:
-            for y in range(room.y, room.y + room.height):
-                if self.tiles[y][wall_x] == TILE_WALL:
-                    room_left = self.tiles[y][wall_x - 1] == TILE_FLOOR
-                    corridor_right = wall_x < self.width - 1 and self._is_corridor_floor(wall_x + 1, y)
-                    if room_left and corridor_right:
-                        self.tiles[y][wall_x] = TILE_DOOR_CLOSED
+        if x2 + 1 < self.width:
+            self._open_wall_doors(tiles[y1:y2, x2], tiles[y1:y2, x2 - 1], corridors[y1:y2, x2 + 1])
+    
+    @staticmethod
+    def _open_wall_doors(wall: np.ndarray, floor: np.ndarray, corridor: np.ndarray) -> None:
+        """Turn wall tiles into closed doors where room floor and corridor meet across them."""
+        wall[(wall == TILE_WALL) & (floor == TILE_FLOOR) & corridor] = TILE_DOOR_CLOSED
     
     def _place_chests(self) -> None:
         """Place treasure chests in some rooms."""
@@ -472,78 +609,36 @@ class DungeonGenerator:
         rooms_with_chests = self.rng.sample(self.rooms, k=min(num_chests, len(self.rooms)))
         
         for room in rooms_with_chests:
-            valid_positions = []
-            for y in range(room.y + 1, room.y + room.height - 1):
-                for x in range(room.x + 1, room.x + room.width - 1):
-                    if self.tiles[y][x] == TILE_FLOOR:
-                        valid_positions.append((x, y))
+            # Interior floor tiles, one tile away from the walls
+            interior = self.tiles[room.y + 1:room.y + room.height - 1, room.x + 1:room.x + room.width - 1]
+            ys, xs = np.where(interior == TILE_FLOOR)
             
-            if valid_positions:
-                x, y = self.rng.choice(valid_positions)
-                self.tiles[y][x] = TILE_CHEST
+            if ys.size:
+                k = self.rng.randrange(ys.size)
+                x, y = int(xs[k]) + room.x + 1, int(ys[k]) + room.y + 1
+                self.tiles[y, x] = TILE_CHEST
                 room.furniture.append((x, y, TILE_CHEST))
     
     def _place_torches(self) -> None:
         """Place torches on walls for atmosphere (1 per room)."""
         for room in self.rooms:
-            wall_positions = []
-            
-            for x in range(room.x, room.x + room.width):
-                wy = room.y - 1
-                if 0 <= wy < self.height and self.tiles[wy][x] == TILE_WALL:
-                    wall_positions.append((x, wy))
-                wy = room.y + room.height
-                if 0 <= wy < self.height and self.tiles[wy][x] == TILE_WALL:
-                    wall_positions.append((x, wy))
+            x1, y1 = room.x, room.y
+            x2, y2 = room.x + room.width, room.y + room.height
             
-            for y in range(room.y, room.y + room.height):
-                wx = room.x - 1
-                if 0 <= wx < self.width and self.tiles[y][wx] == TILE_WALL:
-                    wall_positions.append((wx, y))
-                wx = room.x + room.width
-                if 0 <= wx < self.width and self.tiles[y][wx] == TILE_WALL:
-                    wall_positions.append((wx, y))
+            # Wall line around the room: top/bottom pairs per column, then left/right pairs per row
+            # (rooms keep a margin from the map edge, so every position is in bounds)
+            xs = np.concatenate((np.repeat(np.arange(x1, x2), 2), np.tile((x1 - 1, x2), room.height)))
+            ys = np.concatenate((np.tile((y1 - 1, y2), room.width), np.repeat(np.arange(y1, y2), 2)))
+            walls = np.flatnonzero(self.tiles[ys, xs] == TILE_WALL)
             
-            if wall_positions:
-                pos = self.rng.choice(wall_positions)
-                x, y = pos
-                self.tiles[y][x] = TILE_TORCH
+            if walls.size:
+                k = walls[self.rng.randrange(walls.size)]
+                self.tiles[ys[k], xs[k]] = TILE_TORCH
     
     def _generate_room_name(self, room_type: str) -> str:
         """Generate a thematic name for a room."""
-        prefixes = {
-            "chamber": ["Ancient", "Dusty", "Forgotten", "Hidden", "Dark"],
-            "library": ["Ruined", "Arcane", "Silent", "Forbidden", "Lost"],
-            "armory": ["Old", "Royal", "Abandoned", "Guard's", "Knight's"],
-            "bedroom": ["Noble's", "Servant's", "Guest", "Master", "Dusty"],
-            "storage": ["Supply", "Old", "Forgotten", "Cluttered", "Dark"],
-            "throne_room": ["Grand", "Fallen", "Ancient", "Cursed", "Royal"],
-            "dining_hall": ["Great", "Abandoned", "Noble", "Feasting", "Old"],
-            "crypt": ["Silent", "Haunted", "Ancient", "Forgotten", "Dark"],
-            "treasury": ["Empty", "Looted", "Hidden", "Royal", "Forgotten"],
-            "dungeon_cell": ["Dark", "Damp", "Forgotten", "Torture", "Prison"],
-            "alchemy_lab": ["Abandoned", "Mysterious", "Arcane", "Ruined", "Secret"],
-            "guard_post": ["Abandoned", "Old", "Watchtower", "Patrol", "Empty"]
-        }
-        
-        type_names = {
-            "chamber": "Chamber",
-            "library": "Library",
-            "armory": "Armory",
-            "bedroom": "Bedroom",
-            "storage": "Storage Room",
-            "throne_room": "Throne Room",
-            "dining_hall": "Dining Hall",
-            "crypt": "Crypt",
-            "treasury": "Treasury",
-            "dungeon_cell": "Cell",
-            "alchemy_lab": "Laboratory",
-            "guard_post": "Guard Post"
-        }
-        
-        prefix = self.rng.choice(prefixes.get(room_type, ["Mysterious"]))
-        type_name = type_names.get(room_type, "Room")
-        return f"{prefix} {type_name}"
+        type_name, prefixes = _ROOM_NAMES.get(room_type, _DEFAULT_ROOM_NAME)
+        return f"{self.rng.choice(prefixes)} {type_name}"
 
 
 def generate_dungeon(
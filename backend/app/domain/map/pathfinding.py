@@ -19,16 +19,33 @@ if path:
 from __future__ import annotations
 
 import heapq
-from dataclasses import dataclass, field
+from array import array
+from functools import lru_cache
 from enum import IntEnum
 from typing import Dict, List, Optional, Set, Tuple, TYPE_CHECKING
 
-from .tiles import WALKABLE_TILES
+import numpy as np
+
+from .tiles import TILE_DOOR_OPEN, TILE_FLOOR, TileGrid, TileMap
 
 if TYPE_CHECKING:
     from ..entities import Room
 
 
+# The two WALKABLE_TILES values, compared directly on hot paths instead of
+# hashing into the set
+_WALKABLE_A = TILE_FLOOR
+_WALKABLE_B = TILE_DOOR_OPEN
+
+_INF = float("inf")
+
+# Move costs; the octile heuristic discounts each diagonal step by
+# (diagonal - 2 * cardinal) relative to Manhattan distance
+_CARDINAL_COST = 1.0
+_DIAGONAL_COST = 1.414
+_DIAGONAL_DISCOUNT = _DIAGONAL_COST - 2 * _CARDINAL_COST
+
+
 class Direction(IntEnum):
     """
     8 compass directions plus NONE for no threat visible.
@@ -58,39 +75,12 @@ class Direction(IntEnum):
         Returns:
             Direction enum value
         """
-        if dx == 0 and dy == 0:
-            return cls.NONE
-        
         # Normalize to -1, 0, or 1
-        dx = 0 if dx == 0 else (1 if dx > 0 else -1)
-        dy = 0 if dy == 0 else (1 if dy > 0 else -1)
-        
-        direction_map = {
-            (0, -1): cls.NORTH,
-            (1, -1): cls.NORTHEAST,
-            (1, 0): cls.EAST,
-            (1, 1): cls.SOUTHEAST,
-            (0, 1): cls.SOUTH,
-            (-1, 1): cls.SOUTHWEST,
-            (-1, 0): cls.WEST,
-            (-1, -1): cls.NORTHWEST,
-        }
-        return direction_map.get((dx, dy), cls.NONE)
+        return _DIR_BY_DELTA[((dx > 0) - (dx < 0), (dy > 0) - (dy < 0))]
 
     def to_delta(self) -> Tuple[int, int]:
         """Convert Direction to (dx, dy) delta."""
-        delta_map = {
-            Direction.NORTH: (0, -1),
-            Direction.NORTHEAST: (1, -1),
-            Direction.EAST: (1, 0),
-            Direction.SOUTHEAST: (1, 1),
-            Direction.SOUTH: (0, 1),
-            Direction.SOUTHWEST: (-1, 1),
-            Direction.WEST: (-1, 0),
-            Direction.NORTHWEST: (-1, -1),
-            Direction.NONE: (0, 0),
-        }
-        return delta_map[self]
+        return _DELTA_BY_DIR[self]
 
     def opposite(self) -> "Direction":
         """Get the opposite direction (for fleeing)."""
@@ -100,38 +90,368 @@ class Direction(IntEnum):
         return Direction((self.value + 4) % 8)
 
 
-@dataclass
-class AStarNode:
-    """Node in A* search graph."""
-    x: int
-    y: int
-    g: float = 0.0  # Cost from start
-    h: float = 0.0  # Heuristic to goal
-    parent: Optional["AStarNode"] = None
+# (dx, dy) per Direction value, and the reverse map (zero delta -> NONE)
+_DELTA_BY_DIR: Tuple[Tuple[int, int], ...] = (
+    (0, -1), (1, -1), (1, 0), (1, 1), (0, 1), (-1, 1), (-1, 0), (-1, -1), (0, 0),
+)
+_DIR_BY_DELTA: Dict[Tuple[int, int], Direction] = {
+    delta: Direction(value) for value, delta in enumerate(_DELTA_BY_DIR)
+}
 
-    @property
-    def f(self) -> float:
-        """Total estimated cost (g + h)."""
-        return self.g + self.h
 
-    def __lt__(self, other: "AStarNode") -> bool:
-        """For heap comparison."""
-        return self.f < other.f
+def _astar_search(
+    tiles: List[List[int]],
+    occupied: Set[Tuple[int, int]],
+    width: int,
+    height: int,
+    start: Tuple[int, int],
+    goal: Tuple[int, int],
+    allow_diagonal: bool,
+    max_iterations: int,
+    open_heap: List[Tuple[float, int, int]],
+    g_scores: "array[float]",
+    h_cache: "array[float]",
+    came_from: "array[int]",
+    closed: bytearray,
+    touched: List[int],
+) -> Optional[List[Tuple[int, int]]]:
+    """
+    A* search kernel over plain data.
+    
+    Takes no AStar instance so the hot loop only touches local variables
+    (no attribute loads or method dispatch per expansion). Endpoints must
+    already be validated by the caller.
+    
+    The per-cell tables are flat width * height buffers owned by the
+    caller: g_scores (inf when unseen), h_cache (heuristic, written on a
+    cell's first relaxation), came_from (-1 when unset) and closed flags.
+    touched records every cell written so the next search only resets
+    those instead of the whole map.
+    """
+    start_x, start_y = start
+    goal_x, goal_y = goal
+    heappush, heappop = heapq.heappush, heapq.heappop
+    walkable_a, walkable_b = _WALKABLE_A, _WALKABLE_B
+    inf = _INF
+    cardinal, diagonal = _CARDINAL_COST, _DIAGONAL_COST
+    discount = _DIAGONAL_DISCOUNT if allow_diagonal else 0.0
+
+    blocked = {oy * width + ox for ox, oy in occupied}
 
-    def __eq__(self, other: object) -> bool:
-        if not isinstance(other, AStarNode):
+    def is_open(x: int, y: int) -> bool:
+        if not (0 <= x < width and 0 <= y < height):
             return False
-        return self.x == other.x and self.y == other.y
+        tile = tiles[y][x]
+        return (tile == walkable_a or tile == walkable_b) and y * width + x not in blocked
+
+    # Reset cells written by the previous search
+    for pos in touched:
+        g_scores[pos] = inf
+        came_from[pos] = -1
+        closed[pos] = 0
+    touched.clear()
+
+    # Positions are packed as y * width + x; heap entries are
+    # (f, insertion counter, pos) so ties pop in insertion order
+    start_pos = start_y * width + start_x
+    goal_pos = goal_y * width + goal_x
+    open_heap.clear()
+    dx, dy = abs(start_x - goal_x), abs(start_y - goal_y)
+    open_heap.append((dx + dy + discount * (dx if dx < dy else dy), 0, start_pos))
+    pushed = 0
+    g_scores[start_pos] = 0.0
+    touched.append(start_pos)
+
+    iterations = 0
+    while open_heap and iterations < max_iterations:
+        iterations += 1
+        _, _, pos = heappop(open_heap)
+
+        # Goal reached
+        if pos == goal_pos:
+            return _reconstruct_path(came_from, pos, width)
+
+        if closed[pos]:
+            continue
+        closed[pos] = 1
+        cy, cx = divmod(pos, width)
+        g = g_scores[pos]
+
+        # Cardinal moves cost 1.0, diagonal moves cost 1.414. A diagonal
+        # needs both adjacent cardinals open (no corner cutting), so the
+        # cardinal checks are done once and reused
+        n_open = is_open(cx, cy - 1)
+        s_open = is_open(cx, cy + 1)
+        w_open = is_open(cx - 1, cy)
+        e_open = is_open(cx + 1, cy)
+
+        neighbors = []
+        if n_open:
+            neighbors.append((cx, cy - 1, cardinal))
+        if s_open:
+            neighbors.append((cx, cy + 1, cardinal))
+        if w_open:
+            neighbors.append((cx - 1, cy, cardinal))
+        if e_open:
+            neighbors.append((cx + 1, cy, cardinal))
+        if allow_diagonal:
+            if n_open and w_open and is_open(cx - 1, cy - 1):
+                neighbors.append((cx - 1, cy - 1, diagonal))
+            if n_open and e_open and is_open(cx + 1, cy - 1):
+                neighbors.append((cx + 1, cy - 1, diagonal))
+            if s_open and w_open and is_open(cx - 1, cy + 1):
+                neighbors.append((cx - 1, cy + 1, diagonal))
+            if s_open and e_open and is_open(cx + 1, cy + 1):
+                neighbors.append((cx + 1, cy + 1, diagonal))
+
+        for nx, ny, cost in neighbors:
+            npos = ny * width + nx
+            if closed[npos]:
+                continue
+
+            # Skip if we've found a better path to this neighbor
+            tentative_g = g + cost
+            best = g_scores[npos]
+            if tentative_g >= best:
+                continue
+            if best == inf:
+                # First visit this search: compute and remember h
+                touched.append(npos)
+                dx, dy = abs(nx - goal_x), abs(ny - goal_y)
+                h = dx + dy + discount * (dx if dx < dy else dy)
+                h_cache[npos] = h
+            else:
+                h = h_cache[npos]
+
+            g_scores[npos] = tentative_g
+            came_from[npos] = pos
+            pushed += 1
+            heappush(open_heap, (tentative_g + h, pushed, npos))
+
+    return None  # No path found
+
 
-    def __hash__(self) -> int:
-        return hash((self.x, self.y))
+def _reconstruct_path(came_from: "array[int]", pos: int, width: int) -> List[Tuple[int, int]]:
+    """Walk predecessors back from pos; the start position is not included."""
+    path = []
+    parent = came_from[pos]
+    while parent != -1:
+        y, x = divmod(pos, width)
+        path.append((x, y))
+        pos = parent
+        parent = came_from[pos]
+    path.reverse()
+    return path
+
+
+def _bidirectional_search(
+    tiles: List[List[int]],
+    occupied: Set[Tuple[int, int]],
+    width: int,
+    height: int,
+    start: Tuple[int, int],
+    goal: Tuple[int, int],
+    allow_diagonal: bool,
+    max_iterations: int,
+    forward: tuple,
+    backward: tuple,
+) -> Optional[List[Tuple[int, int]]]:
+    """
+    Bidirectional A* kernel (NBA*): one search from start, one from goal.
+    
+    Each iteration pops from the side with the smaller open list. mu is
+    the cheapest start-goal cost seen through a cell reached from both
+    sides. A popped cell is discarded without expansion when its f, or
+    its g plus the other side's lowest f minus its heuristic to the
+    other endpoint, cannot beat mu. The closed flags are shared, so no
+    cell is expanded twice. With a consistent heuristic mu is optimal
+    once either open list runs dry. max_iterations counts pops on both
+    sides together.
+    
+    forward and backward are buffer tuples from _search_buffers (slots 0
+    and 1). Both sides share the closed flags from backward. Moves are symmetric, so the
+    backward search uses the same neighbour rules.
+    """
+    start_x, start_y = start
+    goal_x, goal_y = goal
+    heappush, heappop = heapq.heappush, heapq.heappop
+    walkable_a, walkable_b = _WALKABLE_A, _WALKABLE_B
+    inf = _INF
+    cardinal, diagonal = _CARDINAL_COST, _DIAGONAL_COST
+    discount = _DIAGONAL_DISCOUNT if allow_diagonal else 0.0
+
+    start_pos = start_y * width + start_x
+    goal_pos = goal_y * width + goal_x
+    if start_pos == goal_pos:
+        return []
+
+    # The goal must be enterable, as in _astar_search. The start is never
+    # entered going forward, so it is left unblocked for the backward side
+    blocked = {oy * width + ox for ox, oy in occupied}
+    if goal_pos in blocked:
+        return None
+    blocked.discard(start_pos)
+
+    def is_open(x: int, y: int) -> bool:
+        if not (0 <= x < width and 0 <= y < height):
+            return False
+        tile = tiles[y][x]
+        return (tile == walkable_a or tile == walkable_b) and y * width + x not in blocked
+
+    # Both sides share the backward closed flags, so the forward buffers
+    # stay consistent for _astar_search runs on the same instance. Those
+    # runs clear the forward touched list, so the shared flags are reset
+    # in full rather than through the touched lists
+    closed = backward[4]
+    closed[:] = bytes(len(closed))
+    for open_heap, g_scores, _, came_from, side_closed, touched in (forward, backward):
+        for pos in touched:
+            g_scores[pos] = inf
+            came_from[pos] = -1
+            side_closed[pos] = 0
+        touched.clear()
+        open_heap.clear()
+
+    f_heap, f_g, _, f_came, _, f_touched = forward
+    b_heap, b_g, b_h, b_came, _, b_touched = backward
+    dx, dy = abs(start_x - goal_x), abs(start_y - goal_y)
+    h0 = dx + dy + discount * (dx if dx < dy else dy)
+    f_heap.append((h0, 0, start_pos))
+    b_heap.append((h0, 0, goal_pos))
+    f_g[start_pos] = 0.0
+    b_g[goal_pos] = 0.0
+    f_touched.append(start_pos)
+    b_touched.append(goal_pos)
+
+    mu = inf
+    meet = -1
+    pushed = 0
+    iterations = 0
+    while f_heap and b_heap and iterations < max_iterations:
+        iterations += 1
+
+        if len(f_heap) <= len(b_heap):
+            open_heap, g_scores, h_cache, came_from, _, touched = forward
+            other_heap, other_g = b_heap, b_g
+            target_x, target_y = goal_x, goal_y
+            source_x, source_y = start_x, start_y
+        else:
+            open_heap, g_scores, h_cache, came_from, _, touched = backward
+            other_heap, other_g = f_heap, f_g
+            target_x, target_y = start_x, start_y
+            source_x, source_y = goal_x, goal_y
+
+        f, _, pos = heappop(open_heap)
+        if closed[pos]:
+            continue
+        closed[pos] = 1
+        cy, cx = divmod(pos, width)
+        g = g_scores[pos]
+
+        # Prune: cannot lead to a route cheaper than mu
+        if f >= mu:
+            continue
+        dx, dy = abs(cx - source_x), abs(cy - source_y)
+        if other_heap and g + other_heap[0][0] - (dx + dy + discount * (dx if dx < dy else dy)) >= mu:
+            continue
+
+        n_open = is_open(cx, cy - 1)
+        s_open = is_open(cx, cy + 1)
+        w_open = is_open(cx - 1, cy)
+        e_open = is_open(cx + 1, cy)
+
+        neighbors = []
+        if n_open:
+            neighbors.append((cx, cy - 1, cardinal))
+        if s_open:
+            neighbors.append((cx, cy + 1, cardinal))
+        if w_open:
+            neighbors.append((cx - 1, cy, cardinal))
+        if e_open:
+            neighbors.append((cx + 1, cy, cardinal))
+        if allow_diagonal:
+            if n_open and w_open and is_open(cx - 1, cy - 1):
+                neighbors.append((cx - 1, cy - 1, diagonal))
+            if n_open and e_open and is_open(cx + 1, cy - 1):
+                neighbors.append((cx + 1, cy - 1, diagonal))
+            if s_open and w_open and is_open(cx - 1, cy + 1):
+                neighbors.append((cx - 1, cy + 1, diagonal))
+            if s_open and e_open and is_open(cx + 1, cy + 1):
+                neighbors.append((cx + 1, cy + 1, diagonal))
+
+        for nx, ny, cost in neighbors:
+            npos = ny * width + nx
+            if closed[npos]:
+                continue
+
+            tentative_g = g + cost
+            best = g_scores[npos]
+            if tentative_g >= best:
+                continue
+            if best == inf:
+                touched.append(npos)
+                dx, dy = abs(nx - target_x), abs(ny - target_y)
+                h = dx + dy + discount * (dx if dx < dy else dy)
+                h_cache[npos] = h
+            else:
+                h = h_cache[npos]
+
+            g_scores[npos] = tentative_g
+            came_from[npos] = pos
+            pushed += 1
+            heappush(open_heap, (tentative_g + h, pushed, npos))
+
+            # Reached from both sides: candidate start-goal route
+            total = tentative_g + other_g[npos]
+            if total < mu:
+                mu = total
+                meet = npos
+
+    if meet < 0:
+        return None  # No path found
+
+    # Forward half ends at the meeting cell; the backward half is walked
+    # from there to the goal
+    path = _reconstruct_path(f_came, meet, width)
+    pos = b_came[meet]
+    while pos != -1:
+        y, x = divmod(pos, width)
+        path.append((x, y))
+        pos = b_came[pos]
+    return path
+
+
+@lru_cache(maxsize=8)
+def _search_buffers(width: int, height: int, slot: int = 0) -> tuple:
+    """
+    Scratch buffers for _astar_search on a width x height map.
+    
+    Map dimensions are fixed for a game's lifetime while pathfinders are
+    rebuilt every tick, so buffers are allocated once per map size and
+    shared. Searches run one at a time on the event loop; the kernel
+    resets what the previous search touched. Slot 1 is a second set for
+    the backward side of _bidirectional_search.
+    
+    Returns:
+        (open_heap, g_scores, h_cache, came_from, closed, touched)
+    """
+    cells = width * height
+    return (
+        [],
+        array("d", [_INF]) * cells,
+        array("d", [0.0]) * cells,
+        array("i", [-1]) * cells,
+        bytearray(cells),
+        [],
+    )
 
 
 class AStar:
     """
     A* pathfinding algorithm for dungeon navigation.
     
-    Uses Manhattan distance heuristic (appropriate for grid-based movement).
+    Uses the octile distance heuristic, which is admissible for the
+    1.0 / 1.414 move costs (Manhattan when diagonals are disabled).
     Supports diagonal movement and respects occupied positions.
     
     Attributes:
@@ -150,59 +470,38 @@ class AStar:
         allow_diagonal: bool = True,
     ):
         self.tiles = tiles
-        self.occupied = occupied or set()
+        self.occupied = occupied if occupied is not None else set()
         self.height = len(tiles)
         self.width = len(tiles[0]) if tiles else 0
         self.allow_diagonal = allow_diagonal
 
+        # Search buffers shared by every pathfinder for this map size
+        self._buffers = _search_buffers(self.width, self.height)
+
     def _heuristic(self, x1: int, y1: int, x2: int, y2: int) -> float:
         """
-        Manhattan distance heuristic.
+        Octile distance heuristic (Manhattan without diagonals).
         
-        For diagonal movement, we could use Chebyshev distance,
-        but Manhattan is admissible and works well for our needs.
+        Manhattan overestimates when diagonal steps cost 1.414 instead of
+        2, which makes A* inadmissible; octile never overestimates. The
+        search kernel inlines the same formula.
         """
-        return abs(x1 - x2) + abs(y1 - y2)
+        dx, dy = abs(x1 - x2), abs(y1 - y2)
+        if not self.allow_diagonal:
+            return dx + dy
+        return dx + dy + _DIAGONAL_DISCOUNT * min(dx, dy)
 
     def _is_walkable(self, x: int, y: int, *, ignore_occupied: bool = False) -> bool:
         """Check if a position is walkable."""
         if x < 0 or x >= self.width or y < 0 or y >= self.height:
             return False
-        if self.tiles[y][x] not in WALKABLE_TILES:
+        tile = self.tiles[y][x]
+        if tile != _WALKABLE_A and tile != _WALKABLE_B:
             return False
         if not ignore_occupied and (x, y) in self.occupied:
             return False
         return True
 
-    def _get_neighbors(self, node: AStarNode) -> List[Tuple[int, int, float]]:
-        """
-        Get walkable neighbors with movement costs.
-        
-        Returns list of (x, y, cost) tuples.
-        Cardinal moves cost 1.0, diagonal moves cost 1.414.
-        """
-        neighbors = []
-        # Cardinal directions
-        cardinals = [(0, -1), (0, 1), (-1, 0), (1, 0)]
-        # Diagonal directions
-        diagonals = [(-1, -1), (1, -1), (-1, 1), (1, 1)]
-
-        for dx, dy in cardinals:
-            nx, ny = node.x + dx, node.y + dy
-            if self._is_walkable(nx, ny):
-                neighbors.append((nx, ny, 1.0))
-
-        if self.allow_diagonal:
-            for dx, dy in diagonals:
-                nx, ny = node.x + dx, node.y + dy
-                if self._is_walkable(nx, ny):
-                    # Check that we can actually move diagonally
-                    # (both cardinal neighbors must be walkable to prevent corner cutting)
-                    if self._is_walkable(node.x + dx, node.y) and self._is_walkable(node.x, node.y + dy):
-                        neighbors.append((nx, ny, 1.414))
-
-        return neighbors
-
     def find_path(
         self,
         start: Tuple[int, int],
@@ -231,67 +530,63 @@ class AStar:
         if not self._is_walkable(goal_x, goal_y, ignore_occupied=True):
             return None
 
-        # Initialize
-        start_node = AStarNode(
-            x=start_x,
-            y=start_y,
-            g=0.0,
-            h=self._heuristic(start_x, start_y, goal_x, goal_y),
+        return _astar_search(
+            self.tiles,
+            self.occupied,
+            self.width,
+            self.height,
+            start,
+            goal,
+            self.allow_diagonal,
+            max_iterations,
+            *self._buffers,
         )
 
-        open_set: List[AStarNode] = [start_node]
-        heapq.heapify(open_set)
+    def find_path_bidirectional(
+        self,
+        start: Tuple[int, int],
+        goal: Tuple[int, int],
+        *,
+        max_iterations: int = 1000,
+    ) -> Optional[List[Tuple[int, int]]]:
+        """
+        Find shortest path from start to goal, searching from both ends.
         
-        # Track visited positions and their best g-scores
-        g_scores: Dict[Tuple[int, int], float] = {(start_x, start_y): 0.0}
-        closed_set: Set[Tuple[int, int]] = set()
-
-        iterations = 0
-        while open_set and iterations < max_iterations:
-            iterations += 1
-            current = heapq.heappop(open_set)
-            current_pos = (current.x, current.y)
-
-            # Goal reached
-            if current.x == goal_x and current.y == goal_y:
-                return self._reconstruct_path(current)
-
-            if current_pos in closed_set:
-                continue
-            closed_set.add(current_pos)
-
-            for nx, ny, cost in self._get_neighbors(current):
-                if (nx, ny) in closed_set:
-                    continue
-
-                tentative_g = current.g + cost
-
-                # Skip if we've found a better path to this neighbor
-                if (nx, ny) in g_scores and tentative_g >= g_scores[(nx, ny)]:
-                    continue
-
-                g_scores[(nx, ny)] = tentative_g
-                neighbor = AStarNode(
-                    x=nx,
-                    y=ny,
-                    g=tentative_g,
-                    h=self._heuristic(nx, ny, goal_x, goal_y),
-                    parent=current,
-                )
-                heapq.heappush(open_set, neighbor)
+        Returns a path of the same cost as find_path. Worth using for long
+        routes across large maps and for goals sealed off in a small area,
+        where the goal-side search runs dry early instead of flooding the
+        start side. max_iterations counts expansions on both sides.
+        
+        Args:
+            start: Starting position (x, y)
+            goal: Goal position (x, y)
+            max_iterations: Maximum search iterations (prevents infinite loops)
+        
+        Returns:
+            List of (x, y) positions from start to goal (excluding start),
+            or None if no path exists.
+        """
+        start_x, start_y = start
+        goal_x, goal_y = goal
 
-        return None  # No path found
+        # Quick validity checks
+        if not self._is_walkable(start_x, start_y, ignore_occupied=True):
+            return None
+        if not self._is_walkable(goal_x, goal_y, ignore_occupied=True):
+            return None
 
-    def _reconstruct_path(self, node: AStarNode) -> List[Tuple[int, int]]:
-        """Reconstruct path from goal node back to start."""
-        path = []
-        current: Optional[AStarNode] = node
-        while current is not None:
-            path.append((current.x, current.y))
-            current = current.parent
-        path.reverse()
-        # Remove the starting position (monster is already there)
-        return path[1:] if len(path) > 1 else []
+        return _bidirectional_search(
+            self.tiles,
+            self.occupied,
+            self.width,
+            self.height,
+            start,
+            goal,
+            self.allow_diagonal,
+            max_iterations,
+            self._buffers,
+            _search_buffers(self.width, self.height, 1),
+        )
 
     def find_flee_position(
         self,
@@ -315,32 +610,233 @@ class AStar:
         """
         start_x, start_y = start
         threat_x, threat_y = threat
-        
+
+        if not self._is_walkable(start_x, start_y, ignore_occupied=True):
+            return None
+
+        # One BFS replaces a path search per candidate; detours may step
+        # just outside the search square
+        reachable = self._reachable_within(start, search_radius + 2)
+        width = self.width
+
         best_pos = None
         best_distance = 0
-        
+
         for dy in range(-search_radius, search_radius + 1):
             for dx in range(-search_radius, search_radius + 1):
                 if dx == 0 and dy == 0:
                     continue
-                    
+
                 nx, ny = start_x + dx, start_y + dy
-                if not self._is_walkable(nx, ny):
+                if ny * width + nx not in reachable:
                     continue
-                
-                # Calculate distance from threat
-                dist = abs(nx - threat_x) + abs(ny - threat_y)
-                
+
                 # Prefer positions farther from threat
+                dist = abs(nx - threat_x) + abs(ny - threat_y)
                 if dist > best_distance:
-                    # Verify we can actually reach this position
-                    path = self.find_path(start, (nx, ny), max_iterations=100)
-                    if path:
-                        best_distance = dist
-                        best_pos = (nx, ny)
-        
+                    best_distance = dist
+                    best_pos = (nx, ny)
+
         return best_pos
 
+    def _reachable_within(
+        self,
+        start: Tuple[int, int],
+        radius: int,
+    ) -> Set[int]:
+        """
+        Breadth-first search of positions reachable from start.
+        
+        Uses the same moves as find_path (diagonals without corner
+        cutting, occupied positions blocked) but never leaves the square
+        of the given radius around start.
+        
+        Returns:
+            Set of reachable positions in the square, packed as
+            y * width + x, excluding start.
+        """
+        start_x, start_y = start
+        width = self.width
+        min_x = max(start_x - radius, 0)
+        max_x = min(start_x + radius, width - 1)
+        min_y = max(start_y - radius, 0)
+        max_y = min(start_y + radius, self.height - 1)
+        tiles = self.tiles
+        blocked = {oy * width + ox for ox, oy in self.occupied}
+        allow_diagonal = self.allow_diagonal
+        start_pos = start_y * width + start_x
+        visited = {start_pos}
+        frontier = [start_pos]
+
+        def is_walkable(x: int, y: int) -> bool:
+            if not (min_x <= x <= max_x and min_y <= y <= max_y):
+                return False
+            tile = tiles[y][x]
+            return (tile == _WALKABLE_A or tile == _WALKABLE_B) and y * width + x not in blocked
+
+        while frontier:
+            next_frontier = []
+            for pos in frontier:
+                cy, cx = divmod(pos, width)
+                n_open = is_walkable(cx, cy - 1)
+                s_open = is_walkable(cx, cy + 1)
+                w_open = is_walkable(cx - 1, cy)
+                e_open = is_walkable(cx + 1, cy)
+                steps = []
+                if n_open:
+                    steps.append(pos - width)
+                if s_open:
+                    steps.append(pos + width)
+                if w_open:
+                    steps.append(pos - 1)
+                if e_open:
+                    steps.append(pos + 1)
+                if allow_diagonal:
+                    if n_open and w_open and is_walkable(cx - 1, cy - 1):
+                        steps.append(pos - width - 1)
+                    if n_open and e_open and is_walkable(cx + 1, cy - 1):
+                        steps.append(pos - width + 1)
+                    if s_open and w_open and is_walkable(cx - 1, cy + 1):
+                        steps.append(pos + width - 1)
+                    if s_open and e_open and is_walkable(cx + 1, cy + 1):
+                        steps.append(pos + width + 1)
+                for step in steps:
+                    if step not in visited:
+                        visited.add(step)
+                        next_frontier.append(step)
+            frontier = next_frontier
+
+        visited.discard(start_pos)
+        return visited
+
+
+class PathFollower:
+    """
+    A mover's path, kept between ticks and reused instead of re-searched.
+
+    Monsters ask for a path every few ticks from a start one step further
+    along and usually toward the same goal, then take only the first
+    step. find_path returns the rest of the previous path when it still
+    holds, and only falls back to a full A* search when it does not.
+
+    The previous path is reused when:
+    - the mover is where the path left it, or one step further along;
+    - the goal is unchanged, or moved one tile and the path can be
+      trimmed or extended to it (at most max_extensions times between
+      full searches);
+    - every remaining step is still walkable, unoccupied and not cutting
+      a corner, so doors and other movers are re-checked on each call.
+
+    A reused path is always valid but may be longer than a fresh search
+    would give if a shorter route opened up since it was planned.
+
+    Attributes:
+        goal: Goal of the current path, or None before the first search
+        max_extensions: Goal moves absorbed before searching again
+    """
+
+    __slots__ = ("goal", "max_extensions", "_start", "_steps", "_extensions")
+
+    def __init__(self, *, max_extensions: int = 4):
+        self.goal: Optional[Tuple[int, int]] = None
+        self.max_extensions = max_extensions
+        self._start: Optional[Tuple[int, int]] = None
+        self._steps: List[Tuple[int, int]] = []
+        self._extensions = 0
+
+    def reset(self) -> None:
+        """Forget the current path; the next call runs a full search."""
+        self.goal = None
+        self._start = None
+        self._steps = []
+        self._extensions = 0
+
+    def find_path(
+        self,
+        astar: AStar,
+        start: Tuple[int, int],
+        goal: Tuple[int, int],
+        *,
+        max_iterations: int = 1000,
+    ) -> Optional[List[Tuple[int, int]]]:
+        """
+        Find a path from start to goal, reusing the previous one if it holds.
+
+        Args:
+            astar: Pathfinder for the current tiles and occupied positions
+            start: Starting position (x, y)
+            goal: Goal position (x, y)
+            max_iterations: Iteration limit for a full search
+
+        Returns:
+            List of (x, y) positions from start to goal (excluding start),
+            or None if no path exists.
+        """
+        if self._reuse(astar, start, goal):
+            return list(self._steps)
+
+        path = astar.find_path(start, goal, max_iterations=max_iterations)
+        if path is None:
+            self.reset()
+            return None
+
+        self.goal = goal
+        self._start = start
+        self._steps = path
+        self._extensions = 0
+        return list(path)
+
+    def _reuse(self, astar: AStar, start: Tuple[int, int], goal: Tuple[int, int]) -> bool:
+        """Bring the stored path up to date for start and goal, if possible."""
+        if self.goal is None:
+            return False
+
+        steps = self._steps
+        if start != self._start:
+            if not steps or start != steps[0]:
+                return False
+            del steps[0]
+            self._start = start
+
+        if goal != self.goal:
+            gx, gy = goal
+            ox, oy = self.goal
+            if max(abs(gx - ox), abs(gy - oy)) != 1 or self._extensions >= self.max_extensions:
+                return False
+            if goal == start:
+                steps.clear()
+            elif goal in steps:
+                del steps[steps.index(goal) + 1:]
+            elif self._step_open(astar, self.goal, goal):
+                steps.append(goal)
+            else:
+                return False
+            self.goal = goal
+            self._extensions += 1
+
+        previous = start
+        for step in steps:
+            if not self._step_open(astar, previous, step):
+                return False
+            previous = step
+        return True
+
+    @staticmethod
+    def _step_open(astar: AStar, origin: Tuple[int, int], target: Tuple[int, int]) -> bool:
+        """Check one move with the same rules as the A* kernel."""
+        ox, oy = origin
+        tx, ty = target
+        if not astar._is_walkable(tx, ty):
+            return False
+        if ox == tx or oy == ty:
+            return True
+        # Diagonal: both orthogonal neighbours must be open (no corner cutting)
+        return (
+            astar.allow_diagonal
+            and astar._is_walkable(tx, oy)
+            and astar._is_walkable(ox, ty)
+        )
+
 
 def get_direction_to_target(
     from_x: int,
@@ -363,8 +859,61 @@ def get_direction_to_target(
     return Direction.from_delta(dx, dy)
 
 
+@lru_cache(maxsize=16)
+def _cached_room_mask(
+    shape: Tuple[int, int],
+    bounds: Tuple[Tuple[int, int, int, int], ...],
+) -> np.ndarray:
+    mask = np.zeros(shape, dtype=bool)
+    for x, y, width, height in bounds:
+        mask[y:y + height, x:x + width] = True
+    mask.flags.writeable = False
+    return mask
+
+
+def build_room_mask(
+    shape: Tuple[int, int],
+    rooms: List["Room"],
+) -> np.ndarray:
+    """
+    Build a boolean (height, width) mask that is True inside any room.
+    
+    Masks are cached by room bounds, so repeated calls for the same map
+    return the same read-only array.
+    
+    Args:
+        shape: (height, width) of the tile map
+        rooms: List of Room objects
+    
+    Returns:
+        Read-only boolean mask indexed as mask[y, x]
+    """
+    return _cached_room_mask(tuple(shape), tuple(room.bounds for room in rooms))
+
+
+def get_corridor_mask(
+    tiles: TileMap,
+    rooms: List["Room"],
+) -> np.ndarray:
+    """
+    Boolean (height, width) mask of corridor tiles.
+    
+    One vectorized pass: walkable tiles AND NOT inside any room.
+    
+    Args:
+        tiles: 2D tile array or TileGrid
+        rooms: List of Room objects
+    
+    Returns:
+        Boolean mask indexed as mask[y, x]
+    """
+    grid = tiles if isinstance(tiles, TileGrid) else TileGrid(tiles)
+    walkable = grid.walkable_mask()
+    return walkable & ~build_room_mask(walkable.shape, rooms)
+
+
 def get_corridor_positions(
-    tiles: List[List[int]],
+    tiles: TileMap,
     rooms: List["Room"],
 ) -> Set[Tuple[int, int]]:
     """
@@ -374,32 +923,14 @@ def get_corridor_positions(
     inside any room's bounds.
     
     Args:
-        tiles: 2D tile array
+        tiles: 2D tile array or TileGrid
         rooms: List of Room objects
     
     Returns:
         Set of (x, y) positions that are corridors
     """
-    corridors: Set[Tuple[int, int]] = set()
-    height = len(tiles)
-    width = len(tiles[0]) if tiles else 0
-
-    for y in range(height):
-        for x in range(width):
-            if tiles[y][x] not in WALKABLE_TILES:
-                continue
-            
-            # Check if this position is inside any room
-            in_room = False
-            for room in rooms:
-                if room.contains(x, y):
-                    in_room = True
-                    break
-            
-            if not in_room:
-                corridors.add((x, y))
-
-    return corridors
+    ys, xs = np.nonzero(get_corridor_mask(tiles, rooms))
+    return set(zip(xs.tolist(), ys.tolist()))
 
 
 def is_in_corridor(
@@ -407,6 +938,8 @@ def is_in_corridor(
     y: int,
     tiles: List[List[int]],
     rooms: List["Room"],
+    *,
+    room_mask: Optional[np.ndarray] = None,
 ) -> bool:
     """
     Check if a specific position is in a corridor.
@@ -417,6 +950,7 @@ def is_in_corridor(
         x, y: Position to check
         tiles: 2D tile array
         rooms: List of Room objects
+        room_mask: Precomputed mask from build_room_mask (built if omitted)
     
     Returns:
         True if position is a corridor tile
@@ -424,14 +958,13 @@ def is_in_corridor(
     if y < 0 or y >= len(tiles) or x < 0 or x >= len(tiles[0]):
         return False
     
-    if tiles[y][x] not in WALKABLE_TILES:
+    tile = tiles[y][x]
+    if tile != _WALKABLE_A and tile != _WALKABLE_B:
         return False
     
-    for room in rooms:
-        if room.contains(x, y):
-            return False
-    
-    return True
+    if room_mask is None:
+        room_mask = build_room_mask((len(tiles), len(tiles[0])), rooms)
+    return not room_mask[y, x]
 
 
 def find_nearest_corridor(
@@ -445,7 +978,8 @@ def find_nearest_corridor(
     """
     Find the nearest corridor position from a given point.
     
-    Uses BFS to find closest corridor for patrol waypoints.
+    Uses BFS to find closest corridor for patrol waypoints, after a
+    vectorized check that the search window contains any corridor.
     
     Args:
         x, y: Starting position
@@ -456,34 +990,50 @@ def find_nearest_corridor(
     Returns:
         Nearest corridor position (x, y), or None if not found
     """
-    from collections import deque
-    
     height = len(tiles)
     width = len(tiles[0]) if tiles else 0
+    if not (0 <= x < width and 0 <= y < height):
+        return None
     
-    visited: Set[Tuple[int, int]] = {(x, y)}
-    queue = deque([(x, y, 0)])  # (x, y, distance)
+    # Cells more than max_search steps away are never checked, so the
+    # whole search fits in this window; skip the BFS if it has no corridor
+    x0, x1 = max(0, x - max_search), min(width, x + max_search + 1)
+    y0, y1 = max(0, y - max_search), min(height, y + max_search + 1)
+    walkable = TileGrid([row[x0:x1] for row in tiles[y0:y1]]).walkable_mask()
+    corridor = walkable & ~build_room_mask((height, width), rooms)[y0:y1, x0:x1]
+    if not corridor.any():
+        return None
     
-    while queue:
-        cx, cy, dist = queue.popleft()
-        
-        if dist > max_search:
-            break
-        
-        if is_in_corridor(cx, cy, tiles, rooms):
-            return (cx, cy)
-        
-        # Expand to neighbors
-        for dx, dy in [(0, -1), (0, 1), (-1, 0), (1, 0)]:
-            nx, ny = cx + dx, cy + dy
-            if (nx, ny) in visited:
-                continue
-            if nx < 0 or nx >= width or ny < 0 or ny >= height:
-                continue
-            if tiles[ny][nx] not in WALKABLE_TILES:
-                continue
+    # Level-by-level BFS over window-packed positions (wy * window_w + wx)
+    window_w, window_h = x1 - x0, y1 - y0
+    is_walkable = walkable.ravel().tolist()
+    is_corridor = corridor.ravel().tolist()
+    start_pos = (y - y0) * window_w + (x - x0)
+    visited = bytearray(window_w * window_h)
+    visited[start_pos] = 1
+    frontier = [start_pos]
+    
+    for _ in range(max_search + 1):
+        next_frontier = []
+        for pos in frontier:
+            wy, wx = divmod(pos, window_w)
+            if is_corridor[pos]:
+                return (x0 + wx, y0 + wy)
             
-            visited.add((nx, ny))
-            queue.append((nx, ny, dist + 1))
+            # Expand to neighbors
+            neighbors = []
+            if wy > 0:
+                neighbors.append(pos - window_w)
+            if wy < window_h - 1:
+                neighbors.append(pos + window_w)
+            if wx > 0:
+                neighbors.append(pos - 1)
+            if wx < window_w - 1:
+                neighbors.append(pos + 1)
+            for npos in neighbors:
+                if is_walkable[npos] and not visited[npos]:
+                    visited[npos] = 1
+                    next_frontier.append(npos)
+        frontier = next_frontier
     
     return None
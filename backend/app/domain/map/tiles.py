@@ -1,6 +1,10 @@
 """
 Tile type constants and utilities for DungeonAI.
 """
+from typing import List, Sequence, Union
+
+import numpy as np
+
 
 # Tile type constants
 TILE_FLOOR = 0
@@ -66,3 +70,37 @@ def get_tile_name(tile: int) -> str:
         if value == tile:
             return name
     return "unknown"
+
+
+class TileGrid:
+    """
+    Contiguous uint8 view of a tile map.
+    
+    Game state keeps tiles as nested lists (doors are toggled in place),
+    so this is a read-only snapshot for bulk queries: one row-major
+    buffer instead of a list of row lists.
+    """
+
+    __slots__ = ("array",)
+
+    def __init__(self, tiles: Union[Sequence[Sequence[int]], np.ndarray]):
+        if len(tiles) == 0:
+            self.array = np.zeros((0, 0), dtype=np.uint8)
+        else:
+            self.array = np.ascontiguousarray(tiles, dtype=np.uint8)
+
+    @property
+    def height(self) -> int:
+        return self.array.shape[0]
+
+    @property
+    def width(self) -> int:
+        return self.array.shape[1]
+
+    def walkable_mask(self) -> np.ndarray:
+        """Boolean (height, width) mask of walkable tiles (WALKABLE_TILES)."""
+        array = self.array
+        return (array == TILE_FLOOR) | (array == TILE_DOOR_OPEN)
+
+
+TileMap = Union[List[List[int]], TileGrid]
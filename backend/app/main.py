@@ -2,36 +2,38 @@
 DungeonAI - Main FastAPI application entry point.
 Multi-game architecture with lobby system.
 """
+import logging
+
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import HTMLResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from contextlib import asynccontextmanager
-import asyncio
+from typing import Optional
 
 from .config import settings
-from .services import game_registry, player_registry, get_storage_backend_name
+from .services import ai_service, game_registry, player_registry, storage_service, get_storage_backend_name
 from .services.player_stats import player_stats_tracker
 from .services.monster_service import monster_service
 from .api import admin_router, game_router, websocket_router, auth_router
 from .db import mongodb_manager
 
 
-async def cleanup_task():
-    """Periodic cleanup of inactive and completed games."""
-    while True:
-        await asyncio.sleep(60)  # Check every minute
-        try:
-            await game_registry.cleanup_games()
-        except Exception as e:
-            print(f"[Main] Error during cleanup: {e}")
+def _read_index_html() -> Optional[bytes]:
+    """Read the built frontend entry page, if present."""
+    index_path = settings.static_dir / "index.html"
+    return index_path.read_bytes() if index_path.exists() else None
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Manage startup and shutdown events."""
     # Startup
+    # Route module loggers (services, db) to stderr; no-op if the root
+    # logger is already set up by the host process
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s:     %(name)s - %(message)s")
+    
     # Initialize MongoDB connection if configured
     if settings.mongodb.is_enabled:
         try:
@@ -44,7 +46,7 @@ async def lifespan(app: FastAPI):
             print(f"[Main] ✓ Storage backend: {get_storage_backend_name()}")
 
             # Initialize MonsterService with MongoDB species store
-            monster_service.initialize()
+            await monster_service.start()
 
         except Exception as e:
             error_msg = f"MongoDB connection failed: {e}"
@@ -58,11 +60,14 @@ async def lifespan(app: FastAPI):
                 # Fallback to JSON storage
                 print(f"[Main] ✗ Falling back to JSON storage (set MONGODB_REQUIRED=true to prevent this)")
                 print(f"[Main] ✗ Storage backend: {get_storage_backend_name()}")
-                monster_service.initialize()
+                await monster_service.start()
     else:
         print(f"[Main] MongoDB not configured, using JSON storage")
         print(f"[Main] Storage backend: {get_storage_backend_name()}")
-        monster_service.initialize()
+        await monster_service.start()
+
+    # The storage backend is settled now; stop re-resolving it per call
+    storage_service.bind()
 
     # Clean up legacy single-game save if it exists
     legacy_save = settings.storage.save_path / "current.json"
@@ -73,6 +78,9 @@ async def lifespan(app: FastAPI):
         except Exception as e:
             print(f"[Main] Warning: Could not remove legacy save: {e}")
 
+    # Cache the frontend entry page (re-read per request in debug mode)
+    app.state.index_html = _read_index_html()
+
     # Restore any saved games
     await game_registry.restore_games()
 
@@ -88,17 +96,13 @@ async def lifespan(app: FastAPI):
     print(f"[Main] STORAGE BACKEND: {get_storage_backend_name()}")
     print(f"[Main] ════════════════════════════════════════════════════")
 
-    # Start cleanup background task
-    cleanup_handle = asyncio.create_task(cleanup_task())
+    # Start the registry's cleanup background task
+    await game_registry.start()
 
     yield
 
     # Shutdown
-    cleanup_handle.cancel()
-    try:
-        await cleanup_handle
-    except asyncio.CancelledError:
-        pass
+    await game_registry.stop()
 
     # Save all active games
     for game_id, game in game_registry.games.items():
@@ -110,6 +114,12 @@ async def lifespan(app: FastAPI):
     # Save player registry
     await player_registry.save()
 
+    # Finish pending species knowledge saves
+    await monster_service.stop()
+
+    # Close pooled Azure OpenAI connections
+    await ai_service.close()
+
     # Disconnect MongoDB
     if mongodb_manager.is_connected:
         await mongodb_manager.disconnect()
@@ -156,10 +166,10 @@ def create_app() -> FastAPI:
     @app.get("/", response_class=HTMLResponse)
     async def read_root(request: Request):
         """Serve the main game page."""
-        index_path = settings.static_dir / "index.html"
-        if index_path.exists():
-            with open(index_path, 'r') as f:
-                html_content = f.read()
+        html_content = getattr(request.app.state, "index_html", None)
+        if html_content is None or settings.debug:
+            html_content = _read_index_html()
+        if html_content is not None:
             return HTMLResponse(
                 content=html_content,
                 headers={"Cache-Control": "no-cache, no-store, must-revalidate"}
@@ -37,18 +37,34 @@ def get_storage_backend_name() -> str:
 
 # Create a property-based accessor for storage_service
 class _StorageServiceProxy:
-    """Proxy that dynamically selects the appropriate storage backend."""
+    """
+    Proxy that selects the appropriate storage backend.
+
+    Until bind() is called the backend is resolved on every attribute
+    access. Once startup has settled the MongoDB connection, bind() pins
+    the backend and its methods are cached on the proxy, so later calls
+    skip the lookup entirely.
+    """
+
+    def __init__(self):
+        self._service = None
+
+    def bind(self) -> None:
+        """Pin the backend chosen at startup and drop cached methods."""
+        self.__dict__.clear()
+        self._service = _get_storage_service()
 
     def __getattr__(self, name):
-        service = _get_storage_service()
-        backend = "MongoDB" if service is _mongodb_storage else "JSON"
-        # Debug logging to track which backend is being used
-        if name in ['save_player_registry', 'load_player_registry', 'save_game_by_id', 'load_game_by_id']:
-            print(f"[StorageProxy] Routing {name} to {backend} backend")
-        return getattr(service, name)
+        service = self._service
+        if service is None:
+            return getattr(_get_storage_service(), name)
+        value = getattr(service, name)
+        if callable(value):
+            self.__dict__[name] = value
+        return value
 
     def __call__(self, *args, **kwargs):
-        service = _get_storage_service()
+        service = self._service or _get_storage_service()
         return service(*args, **kwargs)
 
 
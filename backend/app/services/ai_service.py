@@ -3,14 +3,26 @@ AI service for generating room descriptions using Azure OpenAI.
 Generates atmospheric, immersive descriptions for dungeon rooms.
 """
 import asyncio
+import heapq
+import importlib.util
+import json
+import logging
 import random
+from collections import OrderedDict
+from operator import itemgetter
 from typing import Optional
 
 from ..config import settings
 
+logger = logging.getLogger(__name__)
+
+# Private generator for flavor-text picks, independent of the global
+# random state. Not for anything security-sensitive.
+_rng = random.Random()
+
 
 # Fallback game names for when Azure OpenAI is not available
-FALLBACK_GAME_NAMES = [
+FALLBACK_GAME_NAMES = (
     "The Sunken Crypt", "Halls of the Forgotten", "Shadowmere Depths",
     "The Obsidian Labyrinth", "Caverns of Despair", "The Iron Tombs",
     "Whisperwind Dungeon", "The Crimson Vault", "Abyssal Corridors",
@@ -28,11 +40,11 @@ FALLBACK_GAME_NAMES = [
     "Wraithwood Dungeon", "The Gilded Prison", "Nightfall Caverns",
     "The Screaming Halls", "Ironhold Depths", "The Petrified Forest",
     "Soulreaver Dungeon", "The Endless Maze"
-]
+)
 
 
 # Fallback nicknames for players when Azure OpenAI is not available
-FALLBACK_NICKNAMES = [
+FALLBACK_NICKNAMES = (
     "The Monster Slayer", "The Dungeon Champion", "The Fearless",
     "The Bane of Beasts", "The Undaunted", "The Relentless",
     "The Shadow Walker", "The Brave", "The Victorious",
@@ -42,130 +54,231 @@ FALLBACK_NICKNAMES = [
     "The Orc Slayer", "The Skeleton Crusher", "The Undead Scourge",
     "The Spider Squasher", "The Ghost Whisperer", "The Rat King",
     "The Cultist Hunter", "The Mimic Finder", "The Slime Destroyer"
-]
+)
 
 
 # Monster type specific nickname templates
 MONSTER_NICKNAME_TEMPLATES = {
-    "goblin": ["The Goblin Slayer", "Bane of Goblinkind", "The Green Menace's End"],
-    "orc": ["The Orc Crusher", "Scourge of Orcs", "The Tusked Terror's Bane"],
-    "skeleton": ["The Bone Breaker", "Scourge of the Undead", "The Skeleton Smasher"],
-    "zombie": ["The Zombie Hunter", "Slayer of the Risen", "The Undead's End"],
-    "ghost": ["The Ghost Hunter", "The Spirit Banisher", "The Spectral Slayer"],
-    "giant_spider": ["The Spider Slayer", "Arachnid's Bane", "The Web Cutter"],
-    "kobold": ["The Kobold Crusher", "Terror of Kobolds", "The Scaled Scourge"],
-    "rat_swarm": ["The Rat King", "The Vermin Vanquisher", "The Plague Stopper"],
-    "dark_cultist": ["The Cultist Hunter", "The Heretic Slayer", "Bane of Dark Cults"],
-    "mimic": ["The Mimic Finder", "The Treasure True", "The Chest Checker"],
-    "slime": ["The Slime Destroyer", "The Ooze Obliterator", "The Gelatinous Nemesis"],
-    "bandit": ["The Bandit Hunter", "Scourge of Thieves", "The Outlaw's End"],
+    "goblin": ("The Goblin Slayer", "Bane of Goblinkind", "The Green Menace's End"),
+    "orc": ("The Orc Crusher", "Scourge of Orcs", "The Tusked Terror's Bane"),
+    "skeleton": ("The Bone Breaker", "Scourge of the Undead", "The Skeleton Smasher"),
+    "zombie": ("The Zombie Hunter", "Slayer of the Risen", "The Undead's End"),
+    "ghost": ("The Ghost Hunter", "The Spirit Banisher", "The Spectral Slayer"),
+    "giant_spider": ("The Spider Slayer", "Arachnid's Bane", "The Web Cutter"),
+    "kobold": ("The Kobold Crusher", "Terror of Kobolds", "The Scaled Scourge"),
+    "rat_swarm": ("The Rat King", "The Vermin Vanquisher", "The Plague Stopper"),
+    "dark_cultist": ("The Cultist Hunter", "The Heretic Slayer", "Bane of Dark Cults"),
+    "mimic": ("The Mimic Finder", "The Treasure True", "The Chest Checker"),
+    "slime": ("The Slime Destroyer", "The Ooze Obliterator", "The Gelatinous Nemesis"),
+    "bandit": ("The Bandit Hunter", "Scourge of Thieves", "The Outlaw's End"),
 }
 
 
 # Fallback descriptions for when Azure OpenAI is not available
 FALLBACK_DESCRIPTIONS = {
-    "chamber": [
+    "chamber": (
         "A dusty chamber with ancient stone walls. Cobwebs hang from the corners, and the air smells of age and forgotten secrets.",
         "The chamber is cold and damp. Water drips somewhere in the darkness, echoing off the stone walls.",
         "An empty chamber lit only by the faint glow seeping through cracks in the ceiling. Dust motes dance in the dim light."
-    ],
-    "library": [
+    ),
+    "library": (
         "Towering bookshelves line the walls, though most books have crumbled to dust. A few tomes remain, their leather covers worn but intact.",
         "The library is silent save for the rustling of ancient pages. Knowledge of ages past lies scattered across dusty tables.",
         "Faded manuscripts and scrolls litter the floor. The scent of old parchment fills the air."
-    ],
-    "armory": [
+    ),
+    "armory": (
         "Weapons racks line the walls, though most are empty. A few rusted swords and dented shields remain as reminders of past battles.",
         "The armory has been thoroughly looted. Only broken weapon handles and shattered armor pieces remain.",
         "Dust-covered weapon stands hold ancient armaments. The metal has long since lost its shine."
-    ],
-    "bedroom": [
+    ),
+    "bedroom": (
         "A decrepit bed frame stands against the wall, its mattress long rotted away. Personal belongings lie scattered across the floor.",
         "The bedroom's furnishings have decayed, but traces of its former occupant remain: a faded portrait, a broken mirror.",
         "Moth-eaten curtains hang by the bed. The room feels strangely personal despite its abandonment."
-    ],
-    "storage": [
+    ),
+    "storage": (
         "Broken crates and empty barrels fill this storage room. Whatever was kept here was taken long ago.",
         "The storage room smells of mold and decay. Rotted sacks spill their contents across the floor.",
         "Shelves sag under the weight of forgotten supplies. Most have spoiled beyond recognition."
-    ],
-    "throne_room": [
+    ),
+    "throne_room": (
         "A grand throne sits upon a raised dais, its gold plating tarnished and gems pried from their settings. The room still holds an air of faded majesty.",
         "The throne room's former splendor is evident in the crumbling murals and shattered chandeliers. Power once resided here.",
         "Dust covers the throne like a burial shroud. The room echoes with the ghosts of courtly proceedings."
-    ],
-    "dining_hall": [
+    ),
+    "dining_hall": (
         "A long table dominates the hall, still set with tarnished plates and goblets. The feast was abandoned mid-meal, it seems.",
         "The dining hall's grandeur has faded. Rotted tapestries hang from the walls, depicting feasts and celebrations.",
         "Overturned chairs and scattered utensils suggest the diners left in haste. The table still bears the stains of ancient meals."
-    ],
-    "crypt": [
+    ),
+    "crypt": (
         "Stone sarcophagi line the walls of this crypt. The air is thick with the scent of decay and ancient burial spices.",
         "The crypt is silent as the grave. Carved names on the tombs have worn away to illegibility.",
         "Bones peek from disturbed graves. Something has been here before you, disturbing the eternal rest of the dead."
-    ],
-    "treasury": [
+    ),
+    "treasury": (
         "The treasury has been picked clean. Empty chests and scattered coins suggest vast wealth once stored here.",
         "A few gold coins glint in the darkness—overlooked perhaps, or bait for the unwary. The treasury's true riches are long gone.",
         "Broken locks and empty strongboxes tell the tale of thorough looting. Yet the room may still hold secrets."
-    ],
-    "dungeon_cell": [
+    ),
+    "dungeon_cell": (
         "Rusted chains hang from the walls of this cramped cell. The stone floor is worn smooth by generations of prisoners.",
         "The cell reeks of despair. Scratched marks on the walls count days that stretched into eternity for someone.",
         "A tiny barred window lets in a sliver of light. The cell has held many, and freed few."
-    ],
-    "alchemy_lab": [
+    ),
+    "alchemy_lab": (
         "Shattered beakers and stained workbenches fill this laboratory. Strange residues coat every surface.",
         "The alchemy lab still holds the acrid smell of experiments gone wrong. Bubbling residue drips from overturned vessels.",
         "Arcane symbols cover the walls and floor. Whatever experiments were conducted here touched upon forbidden knowledge."
-    ],
-    "guard_post": [
+    ),
+    "guard_post": (
         "Weapon racks and a simple cot mark this as a guard post. The guards are long gone, but their vigilance lingers in the room's layout.",
         "The guard post offers a clear view of approaching corridors. Someone once stood watch here for dangers that eventually came.",
         "A duty roster hangs on the wall, names faded beyond reading. The guards who served here have passed into history."
-    ]
+    )
+}
+
+
+# Static system messages, built once and shared by every request
+_ROOM_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": "You are a dungeon master. Generate only the room description, nothing else.",
+}
+_GAME_NAME_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": "You are a creative fantasy name generator.",
+}
+_GAME_NAME_MESSAGES = (
+    _GAME_NAME_SYSTEM_MESSAGE,
+    {
+        "role": "user",
+        "content": """Generate a single creative, evocative name for a dark fantasy dungeon.
+The name should be 2-4 words, mysterious, and hint at danger or ancient secrets.
+Examples: "The Sunken Crypt", "Halls of the Forgotten", "Shadowmere Depths"
+
+Generate ONLY the name, nothing else. No quotes, no explanation.""",
+    },
+)
+_NICKNAME_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": "You are a fantasy title generator for warrior heroes.",
 }
 
+# (upper bound, label) tables for the room description prompt; the last
+# bound is open-ended
+_ROOM_SIZE_LABELS = ((39, "small"), (80, "modest-sized"), (float("inf"), "spacious"))
+_FURNITURE_LABELS = ((2, "sparse"), (4, "moderate"), (float("inf"), "rich"))
+
+
+# Rooms described per API request, and batch requests in flight at once
+ROOM_DESCRIPTION_BATCH_SIZE = 8
+_ROOM_BATCH_CONCURRENCY = 2
+# Per-room requests (fallback path) in flight at once, per AIService
+_ROOM_CONCURRENCY = 5
+# Distinct prompts whose descriptions are remembered (LRU)
+_DESCRIPTION_CACHE_SIZE = 2048
+
+_ROOM_BATCH_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": (
+        "You are a dungeon master. Reply with a JSON object only, in the form "
+        '{"descriptions": [{"index": <room index>, "description": "<text>"}]}.'
+    ),
+}
+
+
+def _bucket_label(value: int, buckets: tuple) -> str:
+    """Label of the first bucket whose upper bound is >= value."""
+    return next(label for bound, label in buckets if value <= bound)
+
+
+# Shuffled FALLBACK_GAME_NAMES, dealt from the end; refilled when empty so
+# every name is used once before any repeats
+_game_name_deck: list[str] = []
+
+
+def _next_fallback_game_name() -> str:
+    """Deal the next fallback game name from the shuffled deck."""
+    if not _game_name_deck:
+        _game_name_deck.extend(FALLBACK_GAME_NAMES)
+        _rng.shuffle(_game_name_deck)
+    return _game_name_deck.pop()
+
+
+def _description_key(room_type: str, room_name: str, area: int, furniture_count: int) -> tuple:
+    """Everything the room description prompt depends on."""
+    return (
+        room_type,
+        room_name,
+        _bucket_label(area, _ROOM_SIZE_LABELS),
+        _bucket_label(furniture_count, _FURNITURE_LABELS),
+    )
+
+
+def _room_description_key(room: dict) -> tuple:
+    """_description_key for a room dict, with the same defaults as the prompts."""
+    return _description_key(
+        room.get("room_type", "chamber"),
+        room.get("name", "Unknown Room"),
+        room.get("width", 10) * room.get("height", 10),
+        len(room.get("furniture", [])),
+    )
+
 
 class AIService:
-    """Service for AI-powered content generation."""
-    
-    _instance: Optional["AIService"] = None
-    _initialized: bool = False
+    """
+    Service for AI-powered content generation.
     
-    def __new__(cls) -> "AIService":
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-        return cls._instance
+    Use the module-level ai_service instance; each AIService() builds its
+    own client.
+    """
     
     def __init__(self):
-        if self._initialized:
-            return
-        
         self._client = None
         self._enabled = False
+        # Prompt inputs -> Future of the generated description. Requests in
+        # flight are shared; only successful descriptions stay cached.
+        self._description_cache: OrderedDict[tuple, asyncio.Future] = OrderedDict()
+        # Bounds single-room API requests only; prompt building, parsing and
+        # cache waits happen outside it
+        self._room_semaphore = asyncio.Semaphore(_ROOM_CONCURRENCY)
         self._initialize_client()
-        self._initialized = True
     
     def _initialize_client(self) -> None:
         """Initialize Azure OpenAI client if configured."""
         if not settings.azure_openai.is_enabled:
-            print("[AIService] Azure OpenAI not configured, using fallback descriptions")
+            logger.info("[AIService] Azure OpenAI not configured, using fallback descriptions")
             return
         
         try:
-            from openai import AzureOpenAI
-            self._client = AzureOpenAI(
+            import httpx
+            from openai import AsyncAzureOpenAI, DefaultAsyncHttpxClient
+            
+            # One pooled client for every request, so description batches,
+            # names and nicknames reuse warm TLS connections. HTTP/2 (one
+            # connection, many streams) needs the optional h2 package.
+            http_client = DefaultAsyncHttpxClient(
+                http2=importlib.util.find_spec("h2") is not None,
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=50),
+                timeout=60.0,
+            )
+            self._client = AsyncAzureOpenAI(
                 api_key=settings.azure_openai.api_key,
                 api_version=settings.azure_openai.api_version,
-                azure_endpoint=settings.azure_openai.endpoint
+                azure_endpoint=settings.azure_openai.endpoint,
+                http_client=http_client,
             )
             self._enabled = True
-            print("[AIService] Azure OpenAI client initialized successfully")
+            logger.info("[AIService] Azure OpenAI client initialized successfully")
         except Exception as e:
-            print(f"[AIService] Failed to initialize Azure OpenAI client: {e}")
+            logger.error("[AIService] Failed to initialize Azure OpenAI client: %s", e)
             self._enabled = False
     
+    async def close(self) -> None:
+        """Close the client's pooled HTTP connections (called on shutdown)."""
+        if self._client is not None:
+            await self._client.close()
+    
     @property
     def is_enabled(self) -> bool:
         """Check if AI service is available."""
@@ -201,39 +314,85 @@ class AIService:
         
         Returns:
             Atmospheric room description
+        
+        Identical prompts are only sent once: the description is cached on
+        the prompt inputs, and concurrent callers wait for the same request.
         """
         if self._enabled and self._client:
-            try:
-                size_desc = "small" if room_width * room_height < 40 else "spacious" if room_width * room_height > 80 else "modest-sized"
-                furniture_desc = "sparse" if furniture_count <= 2 else "moderate" if furniture_count <= 4 else "rich"
-                
-                # Simplified prompt for reasoning models that use many tokens internally
-                prompt = f"""Generate a 2-3 sentence atmospheric description for a dungeon {room_type} called "{room_name}". 
+            key = _description_key(room_type, room_name, room_width * room_height, furniture_count)
+            future = self._description_cache.get(key)
+            if future is None:
+                future = asyncio.get_running_loop().create_future()
+                self._cache_description(key, future)
+                description = None
+                try:
+                    description = await self._request_room_description(*key)
+                finally:
+                    # Failures are not cached, so the next caller retries
+                    if not description and self._description_cache.get(key) is future:
+                        del self._description_cache[key]
+                    future.set_result(description)
+            else:
+                self._description_cache.move_to_end(key)
+                # shield: a cancelled waiter must not cancel the shared request
+                description = await asyncio.shield(future)
+            if description:
+                return description
+        
+        # Use fallback descriptions
+        descriptions = FALLBACK_DESCRIPTIONS.get(room_type) or FALLBACK_DESCRIPTIONS["chamber"]
+        return descriptions[_rng.randrange(len(descriptions))]
+    
+    async def _request_room_description(
+        self, room_type: str, room_name: str, size_desc: str, furniture_desc: str
+    ) -> Optional[str]:
+        """Ask the model for one room description; None on error."""
+        try:
+            # Simplified prompt for reasoning models that use many tokens internally
+            prompt = f"""Generate a 2-3 sentence atmospheric description for a dungeon {room_type} called "{room_name}". 
 It's {size_desc} with {furniture_desc} furnishings. Use second person. Be immersive and evocative."""
 
-                response = await asyncio.to_thread(
-                    self._client.chat.completions.create,
+            async with self._room_semaphore:
+                response = await self._client.chat.completions.create(
                     model=settings.azure_openai.deployment,
                     messages=[
-                        {"role": "system", "content": "You are a dungeon master. Generate only the room description, nothing else."},
+                        _ROOM_SYSTEM_MESSAGE,
                         {"role": "user", "content": prompt}
                     ],
                     max_completion_tokens=2000  # High limit needed for reasoning models (GPT-5/o1/o3) that use ~500+ tokens internally
                 )
-                
-                return response.choices[0].message.content.strip()
-                
-            except Exception as e:
-                print(f"[AIService] Error generating description: {e}")
-        
-        # Use fallback descriptions
-        descriptions = FALLBACK_DESCRIPTIONS.get(room_type, FALLBACK_DESCRIPTIONS["chamber"])
-        return random.choice(descriptions)
-    
+            
+            return response.choices[0].message.content.strip()
+            
+        except Exception as e:
+            logger.error("[AIService] Error generating description: %s", e)
+            return None
+
+    def _cache_description(self, key: tuple, future: asyncio.Future) -> None:
+        """Remember a description future, evicting the least recently used."""
+        self._description_cache[key] = future
+        self._description_cache.move_to_end(key)
+        if len(self._description_cache) > _DESCRIPTION_CACHE_SIZE:
+            self._description_cache.popitem(last=False)
+
+    def _cached_description(self, key: tuple) -> Optional[str]:
+        """A finished, successful cached description, if any."""
+        future = self._description_cache.get(key)
+        if future is None or not future.done() or not future.result():
+            return None
+        self._description_cache.move_to_end(key)
+        return future.result()
+
     async def generate_room_descriptions(self, rooms: list[dict]) -> list[dict]:
         """
         Generate descriptions for multiple rooms.
-        Uses batching for efficiency when using Azure OpenAI.
+        
+        With Azure OpenAI enabled, rooms are described ROOM_DESCRIPTION_BATCH_SIZE
+        at a time in one JSON-mode request each. Rooms missing from a batch
+        reply (or from a batch that failed) are retried one request per room,
+        which also falls back to canned descriptions on error. Rooms whose
+        prompt was already answered are served from the description cache,
+        and rooms sharing a prompt are only sent once.
         
         Args:
             rooms: List of room dictionaries with id, room_type, name, width, height, furniture
@@ -241,28 +400,107 @@ It's {size_desc} with {furniture_desc} furnishings. Use second person. Be immers
         Returns:
             Same list of rooms with 'description' field populated
         """
-        print(f"[AIService] Generating descriptions for {len(rooms)} rooms...")
+        logger.info("[AIService] Generating descriptions for %d rooms...", len(rooms))
         
-        # Process rooms with some concurrency but not too much to avoid rate limits
-        semaphore = asyncio.Semaphore(5)
+        pending = rooms
+        if self._enabled and self._client and rooms:
+            groups: dict[tuple, list[dict]] = {}
+            for room in rooms:
+                groups.setdefault(_room_description_key(room), []).append(room)
+            unique = [
+                group[0] for key, group in groups.items()
+                if self._cached_description(key) is None
+            ]
+
+            batch_semaphore = asyncio.Semaphore(_ROOM_BATCH_CONCURRENCY)
+
+            async def describe_batch_with_limit(batch: list[dict]) -> list[dict]:
+                async with batch_semaphore:
+                    return await self._describe_room_batch(batch)
+
+            batches = [
+                unique[i:i + ROOM_DESCRIPTION_BATCH_SIZE]
+                for i in range(0, len(unique), ROOM_DESCRIPTION_BATCH_SIZE)
+            ]
+            await asyncio.gather(*(describe_batch_with_limit(b) for b in batches))
+
+            pending = []
+            for key, group in groups.items():
+                description = self._cached_description(key)
+                if description is None:
+                    pending.extend(group)
+                    continue
+                for room in group:
+                    room["description"] = description
+
+        # Requests are rate limited by self._room_semaphore around the API call
+        async def generate(room: dict) -> dict:
+            room["description"] = await self.generate_room_description(
+                room_type=room.get("room_type", "chamber"),
+                room_name=room.get("name", "Unknown Room"),
+                room_width=room.get("width", 10),
+                room_height=room.get("height", 10),
+                furniture_count=len(room.get("furniture", []))
+            )
+            return room
         
-        async def generate_with_limit(room: dict) -> dict:
-            async with semaphore:
-                description = await self.generate_room_description(
-                    room_type=room.get("room_type", "chamber"),
-                    room_name=room.get("name", "Unknown Room"),
-                    room_width=room.get("width", 10),
-                    room_height=room.get("height", 10),
-                    furniture_count=len(room.get("furniture", []))
-                )
-                room["description"] = description
-                return room
+        await asyncio.gather(*(generate(room) for room in pending))
         
-        tasks = [generate_with_limit(room) for room in rooms]
-        results = await asyncio.gather(*tasks)
+        logger.info("[AIService] Finished generating %d room descriptions", len(rooms))
+        return rooms
+
+    async def _describe_room_batch(self, batch: list[dict]) -> list[dict]:
+        """
+        Describe a batch of rooms with a single request.
+        
+        Rooms are keyed by their index in the batch, so missing or duplicate
+        room ids cannot mix descriptions up. Descriptions are stored in the
+        description cache; rooms the reply left out are not.
         
-        print(f"[AIService] Finished generating {len(results)} room descriptions")
-        return results
+        Returns:
+            Rooms from the batch that did not get a description
+        """
+        keys = [_room_description_key(room) for room in batch]
+        listing = [
+            {"index": index, "type": room_type, "name": name, "size": size, "furnishings": furnishings}
+            for index, (room_type, name, size, furnishings) in enumerate(keys)
+        ]
+        prompt = f"""For each dungeon room below, write a 2-3 sentence atmospheric description. Use second person. Be immersive and evocative.
+Rooms: {json.dumps(listing)}"""
+
+        try:
+            response = await self._client.chat.completions.create(
+                model=settings.azure_openai.deployment,
+                messages=[
+                    _ROOM_BATCH_SYSTEM_MESSAGE,
+                    {"role": "user", "content": prompt}
+                ],
+                response_format={"type": "json_object"},
+                # Reasoning models use ~500+ tokens internally, plus ~100 per room
+                max_completion_tokens=2000 + 300 * len(batch)
+            )
+            entries = json.loads(response.choices[0].message.content)["descriptions"]
+        except Exception as e:
+            logger.error("[AIService] Error generating batch descriptions: %s", e)
+            return batch
+
+        described = set()
+        for entry in entries:
+            if not isinstance(entry, dict):
+                continue
+            index = entry.get("index")
+            description = entry.get("description")
+            if (
+                isinstance(index, int) and 0 <= index < len(batch)
+                and isinstance(description, str) and description.strip()
+            ):
+                batch[index]["description"] = description.strip()
+                described.add(index)
+                future = asyncio.get_running_loop().create_future()
+                future.set_result(batch[index]["description"])
+                self._cache_description(keys[index], future)
+
+        return [room for index, room in enumerate(batch) if index not in described]
     
     async def generate_game_name(self) -> str:
         """
@@ -274,19 +512,9 @@ It's {size_desc} with {furniture_desc} furnishings. Use second person. Be immers
         """
         if self._enabled and self._client:
             try:
-                prompt = """Generate a single creative, evocative name for a dark fantasy dungeon.
-The name should be 2-4 words, mysterious, and hint at danger or ancient secrets.
-Examples: "The Sunken Crypt", "Halls of the Forgotten", "Shadowmere Depths"
-
-Generate ONLY the name, nothing else. No quotes, no explanation."""
-
-                response = await asyncio.to_thread(
-                    self._client.chat.completions.create,
+                response = await self._client.chat.completions.create(
                     model=settings.azure_openai.deployment,
-                    messages=[
-                        {"role": "system", "content": "You are a creative fantasy name generator."},
-                        {"role": "user", "content": prompt}
-                    ],
+                    messages=_GAME_NAME_MESSAGES,
                     max_completion_tokens=200  # Higher limit needed for reasoning models (GPT-5/o1/o3)
                 )
                 
@@ -295,10 +523,10 @@ Generate ONLY the name, nothing else. No quotes, no explanation."""
                     return name
                     
             except Exception as e:
-                print(f"[AIService] Error generating game name: {e}")
+                logger.error("[AIService] Error generating game name: %s", e)
         
         # Use fallback name
-        return random.choice(FALLBACK_GAME_NAMES)
+        return _next_fallback_game_name()
     
     async def generate_player_nickname(
         self,
@@ -320,11 +548,9 @@ Generate ONLY the name, nothing else. No quotes, no explanation."""
                 # Build kill summary for the prompt
                 kill_summary = ", ".join([
                     f"{count} {monster_type}{'s' if count > 1 else ''}"
-                    for monster_type, count in sorted(
-                        kills_by_type.items(),
-                        key=lambda x: x[1],
-                        reverse=True
-                    )[:5]  # Top 5 monster types
+                    for monster_type, count in heapq.nlargest(
+                        5, kills_by_type.items(), key=itemgetter(1)
+                    )  # Top 5 monster types
                 ])
                 
                 prompt = f"""Generate a short warrior title (2-4 words, starting with "The") for a dungeon hero who has killed:
@@ -336,11 +562,10 @@ Examples: "The Goblin Slayer", "The Undead Scourge", "The Fearless Hunter", "The
 
 Generate ONLY the title, nothing else. No quotes, no explanation. Must start with "The"."""
 
-                response = await asyncio.to_thread(
-                    self._client.chat.completions.create,
+                response = await self._client.chat.completions.create(
                     model=settings.azure_openai.deployment,
                     messages=[
-                        {"role": "system", "content": "You are a fantasy title generator for warrior heroes."},
+                        _NICKNAME_SYSTEM_MESSAGE,
                         {"role": "user", "content": prompt}
                     ],
                     max_completion_tokens=200  # Higher limit needed for reasoning models (GPT-5/o1/o3)
@@ -354,16 +579,17 @@ Generate ONLY the title, nothing else. No quotes, no explanation. Must start wit
                     return nickname
                     
             except Exception as e:
-                print(f"[AIService] Error generating player nickname: {e}")
+                logger.error("[AIService] Error generating player nickname: %s", e)
         
         # Use fallback nickname based on top kill type
         if kills_by_type:
-            top_type = max(kills_by_type.keys(), key=lambda k: kills_by_type[k])
-            if top_type in MONSTER_NICKNAME_TEMPLATES:
-                return random.choice(MONSTER_NICKNAME_TEMPLATES[top_type])
+            top_type = max(kills_by_type.items(), key=itemgetter(1))[0]
+            templates = MONSTER_NICKNAME_TEMPLATES.get(top_type)
+            if templates:
+                return templates[_rng.randrange(len(templates))]
         
         # Generic fallback
-        return random.choice(FALLBACK_NICKNAMES)
+        return _rng.choice(FALLBACK_NICKNAMES)
 
 
 # Global AI service instance
@@ -1,10 +1,14 @@
 """
 Authentication service for user management, password hashing, and JWT tokens.
 """
+import asyncio
+import time
+from collections import OrderedDict
+from dataclasses import fields
 from datetime import datetime, timedelta
-from typing import Optional
-from passlib.context import CryptContext
-from jose import JWTError, jwt
+from typing import Any, Hashable, Optional
+import bcrypt
+import jwt
 from fastapi import Response, HTTPException, status
 
 from app.config.settings import settings
@@ -12,8 +16,75 @@ from app.domain.entities.user import User
 from app.db.mongodb import mongodb_manager
 
 
-# Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Fields User.from_dict reads; lookups fetch only these (and never _id).
+# Both lookup keys are covered by the unique indexes created in
+# MongoDBManager._create_indexes.
+_USER_PROJECTION = {"_id": 0, **{f.name: 1 for f in fields(User)}}
+
+
+# Shared set_cookie options for the access and player token cookies; they
+# live as long as the JWT.
+_COOKIE_KWARGS = {
+    "httponly": True,
+    "secure": False,  # Set to True in production with HTTPS
+    "samesite": "lax",
+    "max_age": settings.auth.jwt_expire_days * 24 * 60 * 60,  # Convert days to seconds
+    "path": "/",
+}
+
+
+def _normalize_email(email: str) -> str:
+    """Canonical form used to store and look up email addresses."""
+    return email.lower().strip()
+
+
+class _TTLCache:
+    """
+    Bounded LRU cache whose entries expire ttl seconds after being set.
+    
+    Expired entries are dropped when looked up; the least recently used
+    entry is evicted once maxsize is exceeded.
+    """
+
+    __slots__ = ("maxsize", "ttl", "_data")
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict = OrderedDict()
+
+    def get(self, key: Hashable) -> Any:
+        """Return the cached value, or None if missing or expired."""
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Cache a value, evicting the least recently used entry if full."""
+        self._data[key] = (value, time.monotonic() + self.ttl)
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: Hashable) -> Any:
+        """Remove and return a cached value (None if missing)."""
+        entry = self._data.pop(key, None)
+        return entry[0] if entry is not None else None
+
+    def clear(self) -> None:
+        self._data.clear()
+
+
+# Verified JWT payloads keyed by raw token (see AuthService.decode_token)
+_token_cache = _TTLCache(
+    settings.auth.token_cache_size, settings.auth.token_cache_ttl_seconds
+)
 
 
 class AuthService:
@@ -22,17 +93,36 @@ class AuthService:
     def __init__(self):
         self.db = mongodb_manager
         self.collection_name = "users"
+        # User documents keyed by ("id", user_id) and ("email", email).
+        # Documents rather than User objects are cached, so callers can
+        # mutate what they get back.
+        self._user_cache = _TTLCache(
+            settings.auth.user_cache_size, settings.auth.user_cache_ttl_seconds
+        )
 
     # Password Hashing
+    # bcrypt takes tens of milliseconds per call, so it runs in a worker
+    # thread to keep the event loop serving other requests
+    @staticmethod
+    def _hash_password_sync(password: str) -> str:
+        salt = bcrypt.gensalt(rounds=settings.auth.bcrypt_rounds)
+        return bcrypt.hashpw(password.encode("utf-8"), salt).decode("ascii")
+
+    @staticmethod
+    def _verify_password_sync(plain_password: str, hashed_password: str) -> bool:
+        return bcrypt.checkpw(plain_password.encode("utf-8"), hashed_password.encode("ascii"))
+
     @staticmethod
-    def hash_password(password: str) -> str:
+    async def hash_password(password: str) -> str:
         """Hash a password using bcrypt."""
-        return pwd_context.hash(password)
+        return await asyncio.to_thread(AuthService._hash_password_sync, password)
 
     @staticmethod
-    def verify_password(plain_password: str, hashed_password: str) -> bool:
-        """Verify a password against its hash."""
-        return pwd_context.verify(plain_password, hashed_password)
+    async def verify_password(plain_password: str, hashed_password: str) -> bool:
+        """Verify a password against its bcrypt hash ($2a$, $2b$ or $2y$)."""
+        return await asyncio.to_thread(
+            AuthService._verify_password_sync, plain_password, hashed_password
+        )
 
     # JWT Token Management
     @staticmethod
@@ -53,46 +143,44 @@ class AuthService:
 
     @staticmethod
     def decode_token(token: str) -> dict:
-        """Decode and validate a JWT token."""
+        """
+        Decode and validate a JWT token.
+        
+        Clients send the same cookie token with every request, so verified
+        payloads are cached by token string. A cached payload is only
+        returned while its exp claim is in the future; otherwise the token
+        goes through full verification again (which rejects it).
+        """
+        payload = _token_cache.get(token)
+        if payload is not None and payload.get("exp", 0) > time.time():
+            return dict(payload)
+
         try:
             payload = jwt.decode(
                 token,
                 settings.auth.jwt_secret_key,
                 algorithms=[settings.auth.jwt_algorithm]
             )
-            return payload
-        except JWTError:
+        except jwt.InvalidTokenError:
+            _token_cache.pop(token)
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid authentication token"
             )
+        if "exp" in payload:
+            _token_cache.set(token, payload)
+        return dict(payload)
 
     # Cookie Management
     @staticmethod
     def set_auth_cookie(response: Response, token: str):
         """Set httpOnly authentication cookie."""
-        response.set_cookie(
-            key="access_token",
-            value=token,
-            httponly=True,
-            secure=False,  # Set to True in production with HTTPS
-            samesite="lax",
-            max_age=settings.auth.jwt_expire_days * 24 * 60 * 60,  # Convert days to seconds
-            path="/"
-        )
+        response.set_cookie(key="access_token", value=token, **_COOKIE_KWARGS)
 
     @staticmethod
     def set_player_token_cookie(response: Response, player_token: str):
         """Set httpOnly player token cookie."""
-        response.set_cookie(
-            key="player_token",
-            value=player_token,
-            httponly=True,
-            secure=False,  # Set to True in production with HTTPS
-            samesite="lax",
-            max_age=settings.auth.jwt_expire_days * 24 * 60 * 60,
-            path="/"
-        )
+        response.set_cookie(key="player_token", value=player_token, **_COOKIE_KWARGS)
 
     @staticmethod
     def clear_auth_cookies(response: Response):
@@ -109,6 +197,9 @@ class AuthService:
                 detail="Database not available"
             )
 
+        # Normalize once for both the duplicate check and the stored record
+        email = _normalize_email(email)
+
         # Check if email already exists
         existing_user = await self.get_user_by_email(email)
         if existing_user:
@@ -118,7 +209,7 @@ class AuthService:
             )
 
         # Create user
-        password_hash = self.hash_password(password)
+        password_hash = await self.hash_password(password)
         user = User.create(email=email, password_hash=password_hash, role=role)
 
         # Insert into database
@@ -132,8 +223,15 @@ class AuthService:
         if not self.db.is_connected:
             return None
 
-        collection = self.db.get_collection(self.collection_name)
-        user_data = await collection.find_one({"email": email.lower().strip()})
+        email = _normalize_email(email)
+        user_data = self._user_cache.get(("email", email))
+        if user_data is None:
+            collection = self.db.get_collection(self.collection_name)
+            user_data = await collection.find_one(
+                {"email": email}, projection=_USER_PROJECTION
+            )
+            if user_data:
+                self._cache_user(user_data)
 
         if user_data:
             return User.from_dict(user_data)
@@ -144,19 +242,36 @@ class AuthService:
         if not self.db.is_connected:
             return None
 
-        collection = self.db.get_collection(self.collection_name)
-        user_data = await collection.find_one({"user_id": user_id})
+        user_data = self._user_cache.get(("id", user_id))
+        if user_data is None:
+            collection = self.db.get_collection(self.collection_name)
+            user_data = await collection.find_one(
+                {"user_id": user_id}, projection=_USER_PROJECTION
+            )
+            if user_data:
+                self._cache_user(user_data)
 
         if user_data:
             return User.from_dict(user_data)
         return None
 
+    def _cache_user(self, user_data: dict) -> None:
+        """Cache a user document under both lookup keys."""
+        self._user_cache.set(("id", user_data["user_id"]), user_data)
+        self._user_cache.set(("email", user_data["email"]), user_data)
+
+    def invalidate_user(self, user_id: str) -> None:
+        """Drop a user from the lookup cache after it changes in the database."""
+        user_data = self._user_cache.pop(("id", user_id))
+        if user_data is not None:
+            self._user_cache.pop(("email", user_data["email"]))
+
     async def authenticate_user(self, email: str, password: str) -> Optional[User]:
         """Authenticate user with email and password."""
         user = await self.get_user_by_email(email)
         if not user:
             return None
-        if not self.verify_password(password, user.password_hash):
+        if not await self.verify_password(password, user.password_hash):
             return None
         if not user.is_active:
             return None
@@ -170,8 +285,10 @@ class AuthService:
         collection = self.db.get_collection(self.collection_name)
         await collection.update_one(
             {"user_id": user_id},
-            {"$set": {"last_login": datetime.utcnow().isoformat()}}
+            # Server-side clock; stored as a BSON date
+            {"$currentDate": {"last_login": True}}
         )
+        self.invalidate_user(user_id)
 
 
 # Global auth service instance
@@ -3,76 +3,186 @@ MongoDB-based species knowledge persistence for learning monsters.
 Provides the same API as SpeciesKnowledgeStore but uses MongoDB for storage.
 """
 import asyncio
-from datetime import datetime
-from typing import Dict, Optional
+import time
+from typing import Callable, Dict, List, Optional, Tuple
 import logging
 
 import numpy as np
+import zstandard
 from bson import Binary
+from pymongo import UpdateOne
 
-from ..db import mongodb_manager
+from ..config import settings
+from ..db import CollectionHandles, mongodb_manager
 from ..domain.intelligence.learning import SCHEMA_VERSION
 from ..domain.intelligence.generations import (
     SpeciesKnowledgeRecord,
     LearningHistoryEntry,
-    HISTORY_LIMIT
+    HISTORY_LIMIT,
+    resize_q_table,
 )
 
 logger = logging.getLogger(__name__)
 
+# Fields _async_load reads from species_knowledge (skips _id and timestamps)
+_SPECIES_PROJECTION = {
+    "_id": 0,
+    "monster_type": 1,
+    "schema_version": 1,
+    "generation": 1,
+    "encounters": 1,
+    "total_learning_steps": 1,
+    "q_table": 1,
+    "q_table_shape": 1,
+    "q_table_deltas": 1,
+    "q_table_compression": 1,
+    "q_table_quantization": 1,
+    "q_table_scales": 1,
+}
+
+# Fields _migrate_legacy_history reads from the old species_history documents
+_HISTORY_PROJECTION = {"_id": 0, "schema_version": 1, "history": 1}
+# species_history_events documents minus these are LearningHistoryEntry fields
+_EVENT_PROJECTION = {"_id": 0, "monster_type": 0, "schema_version": 0}
+# Trim a species' stored events back to HISTORY_LIMIT after this many inserts
+_HISTORY_TRIM_EVERY = 100
+# Changed Q-table cells pushed as deltas before the full table is rewritten
+_Q_DELTA_LIMIT = 1000
+# Stored Q-table bytes are zstd-compressed (mostly zeros early in training);
+# documents without q_table_compression hold raw float32 bytes
+_Q_TABLE_COMPRESSION = "zstd"
+_ZSTD_COMPRESSOR = zstandard.ZstdCompressor(level=3)
+_ZSTD_DECOMPRESSOR = zstandard.ZstdDecompressor()
+# With settings.ai.quantize_q_tables, q_table holds int8 values and
+# q_table_scales one float32 scale per state
+_Q_TABLE_QUANTIZATION = "int8"
+
+
+def _event_doc(monster_type: str, entry: LearningHistoryEntry) -> dict:
+    """species_history_events document for one learning event."""
+    return {
+        "monster_type": monster_type,
+        "schema_version": SCHEMA_VERSION,
+        "timestamp": entry.timestamp,
+        "generation": entry.generation,
+        "reward": entry.reward,
+        "state_index": entry.state_index,
+        "action": entry.action,
+        "q_value_before": entry.q_value_before,
+        "q_value_after": entry.q_value_after,
+    }
+
+
+def _now_ms() -> int:
+    """Current time as epoch milliseconds, the stored timestamp format."""
+    return time.time_ns() // 1_000_000
+
+
+def _quantize_q_table(q_table: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """int8 values and per-state float32 scales approximating q_table."""
+    scales = (np.abs(q_table).max(axis=1) / 127).astype(np.float32)
+    # All-zero states keep scale 0; divide them by 1 instead
+    divisors = np.where(scales > 0, scales, 1)[:, None]
+    return np.round(q_table / divisors).astype(np.int8), scales
+
+
+def _decode_q_table(doc: dict, shape: tuple) -> np.ndarray:
+    """Writable float32 Q-table from a species_knowledge document."""
+    data = doc["q_table"]
+    if doc.get("q_table_compression") == _Q_TABLE_COMPRESSION:
+        data = _ZSTD_DECOMPRESSOR.decompress(data)
+    if doc.get("q_table_quantization") == _Q_TABLE_QUANTIZATION:
+        scales = np.frombuffer(doc["q_table_scales"], dtype=np.float32)
+        values = np.frombuffer(data, dtype=np.int8).reshape(shape)
+        return values.astype(np.float32) * scales[:, None]
+    # Copy: learning updates the table in place
+    return np.frombuffer(data, dtype=np.float32).reshape(shape).copy()
+
+
+def _apply_q_deltas(q_table: np.ndarray, deltas: List[dict]) -> None:
+    """Replay stored {"s", "a", "v"} cell updates onto a Q-table, in order."""
+    for delta in deltas:
+        q_table[delta["s"], delta["a"]] = delta["v"]
+
 
 class MongoDBSpeciesKnowledgeStore:
     """
     MongoDB-based species knowledge store.
     Maintains compatibility with file-based SpeciesKnowledgeStore API.
+
+    Unlike the file store, records are not loaded on construction: await
+    load() once (MonsterService.start does this at startup). The sync
+    save() and history-loading entry points schedule work on the running
+    event loop; saves run one at a time and flush() waits for them.
+
+    Learning history is stored one document per event in
+    species_history_events; saves insert only the events recorded since
+    the previous save.
+
+    Q-tables are written whole only when a species is first saved, its
+    table is resized, or _Q_DELTA_LIMIT changed cells have piled up.
+    Other saves push just the cells that differ from the stored table
+    onto q_table_deltas, which load replays over the snapshot. Species
+    with nothing changed since the last save are left out of it.
     """
 
     def __init__(self) -> None:
         self.records: Dict[str, SpeciesKnowledgeRecord] = {}
         self._schema_version: int = SCHEMA_VERSION
         self._loaded = False
+        self._db_handles: Optional[CollectionHandles] = None
+        # Save loop task, and whether another pass was requested meanwhile
+        self._save_task: Optional[asyncio.Task] = None
+        self._save_requested = False
+        # In-flight lazy history loads by monster type
+        self._history_loads: Dict[str, asyncio.Task] = {}
+        # Newest history entry known to be stored, and inserts since the
+        # last trim, by monster type
+        self._last_saved_event: Dict[str, LearningHistoryEntry] = {}
+        self._events_since_trim: Dict[str, int] = {}
+        # Q-table as stored (snapshot plus deltas), and deltas pushed since
+        # the last full write, by monster type
+        self._saved_q_tables: Dict[str, np.ndarray] = {}
+        self._q_delta_counts: Dict[str, int] = {}
+        # (generation, encounters, total_learning_steps) as last stored;
+        # species with no changes since are left out of the save, and
+        # species missing here have no document yet
+        self._saved_counters: Dict[str, Tuple[int, int, int]] = {}
         logger.info("[MongoDBSpeciesStore] Initialized")
-        # Load existing knowledge from MongoDB
-        self._load()
 
     @property
-    def db(self):
-        """Get MongoDB database instance."""
-        return mongodb_manager.db
+    def db(self) -> CollectionHandles:
+        """Collection handles for the connected MongoDB database."""
+        db = mongodb_manager.db
+        # Rebuilt only if the manager reconnected to a new database object
+        if self._db_handles is None or self._db_handles.database is not db:
+            self._db_handles = CollectionHandles(db)
+        return self._db_handles
 
     @property
     def _data(self) -> Dict[str, SpeciesKnowledgeRecord]:
         """For compatibility with existing code."""
         return self.records
 
-    def _load(self) -> None:
+    async def load(self) -> None:
         """
-        Load species knowledge from MongoDB (synchronous wrapper).
-        Called during initialization.
+        Load species knowledge from MongoDB; later calls are no-ops.
+
+        A failed load leaves the store unloaded, so saves stay disabled
+        (they would overwrite the stored knowledge) and load() can retry.
         """
         if self._loaded:
             return
+        self._loaded = await self._async_load()
 
+    async def _async_load(self) -> bool:
+        """Load all species knowledge from MongoDB. Returns True on success."""
         try:
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                # If called from async context, schedule it
-                asyncio.create_task(self._async_load())
-            else:
-                loop.run_until_complete(self._async_load())
-        except Exception as e:
-            logger.error(f"[MongoDBSpeciesStore] Error in _load: {e}")
-        finally:
-            self._loaded = True
-
-    async def _async_load(self) -> None:
-        """Load all species knowledge from MongoDB."""
-        try:
-            cursor = self.db.species_knowledge.find()
-            count = 0
+            docs = await self.db.species_knowledge.find(
+                {}, projection=_SPECIES_PROJECTION
+            ).to_list(length=None)
 
-            async for doc in cursor:
-                count += 1
+            for doc in docs:
                 monster_type = doc.get("monster_type")
                 if not monster_type:
                     continue
@@ -87,6 +197,7 @@ class MongoDBSpeciesKnowledgeStore:
                     # Delete outdated record
                     await self.db.species_knowledge.delete_one({"monster_type": monster_type})
                     await self.db.species_history.delete_one({"monster_type": monster_type})
+                    await self.db.species_history_events.delete_many({"monster_type": monster_type})
                     continue
 
                 # Deserialize Q-table from Binary
@@ -94,13 +205,16 @@ class MongoDBSpeciesKnowledgeStore:
                 q_table_shape = tuple(doc.get("q_table_shape", [0, 0]))
 
                 if q_table_binary and q_table_shape[0] > 0:
-                    q_table = np.frombuffer(q_table_binary, dtype=np.float32)
-                    q_table = q_table.reshape(q_table_shape).copy()  # Create writable copy
+                    q_table = _decode_q_table(doc, q_table_shape)
+                    deltas = doc.get("q_table_deltas") or []
+                    _apply_q_deltas(q_table, deltas)
+                    self._saved_q_tables[monster_type] = q_table.copy()
+                    self._q_delta_counts[monster_type] = len(deltas)
                 else:
                     q_table = np.zeros(q_table_shape, dtype=np.float32)
 
                 # Create record (history loaded lazily)
-                self.records[monster_type] = SpeciesKnowledgeRecord(
+                record = self.records[monster_type] = SpeciesKnowledgeRecord(
                     monster_type=monster_type,
                     generation=int(doc.get("generation", 0)),
                     encounters=int(doc.get("encounters", 0)),
@@ -109,69 +223,74 @@ class MongoDBSpeciesKnowledgeStore:
                     history=[],  # Loaded lazily
                     _history_loaded=False,
                 )
+                self._saved_counters[monster_type] = (
+                    record.generation, record.encounters, record.total_learning_steps
+                )
 
             print(f"[MongoDBSpeciesStore] ✓ Loaded {len(self.records)} species knowledge records from MongoDB")
             logger.info(f"[MongoDBSpeciesStore] Loaded {len(self.records)} species records")
+            return True
 
         except Exception as e:
             print(f"[MongoDBSpeciesStore] ✗ Error loading species knowledge: {e}")
             logger.error(f"[MongoDBSpeciesStore] Error loading species knowledge: {e}")
+            return False
 
     def _load_history(self, record: SpeciesKnowledgeRecord) -> None:
-        """Lazily load history for a species from MongoDB (synchronous wrapper)."""
+        """
+        Start loading history for a species without waiting for it.
+
+        Entries recorded before the load finishes are kept after the
+        stored ones. Without a running loop the load runs to completion.
+        """
         if record._history_loaded:
             return
 
         try:
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                # In async context - need to run synchronously using create_task and wait
-                # Create new event loop in thread for synchronous loading
-                import asyncio
-                try:
-                    # Try to run in current loop if possible
-                    asyncio.run_coroutine_threadsafe(self._async_load_history(record), loop).result(timeout=5)
-                except:
-                    # Fallback: schedule task but mark as loaded to avoid infinite loop
-                    asyncio.create_task(self._async_load_history(record))
-            else:
-                loop.run_until_complete(self._async_load_history(record))
-        except Exception as e:
-            logger.error(f"[MongoDBSpeciesStore] Error in _load_history: {e}")
-            record._history_loaded = True
+            self._history_load_task(record)
+        except RuntimeError:
+            asyncio.run(self._async_load_history(record))
+
+    def _history_load_task(self, record: SpeciesKnowledgeRecord) -> asyncio.Task:
+        """The in-flight history load for a species, started if needed."""
+        task = self._history_loads.get(record.monster_type)
+        if task is None:
+            task = asyncio.get_running_loop().create_task(self._fetch_history(record))
+            task.add_done_callback(lambda _: self._history_loads.pop(record.monster_type, None))
+            self._history_loads[record.monster_type] = task
+        return task
 
     async def _async_load_history(self, record: SpeciesKnowledgeRecord) -> None:
-        """Internal async implementation of history loading."""
+        """Load history for a species, sharing any load already in flight."""
         if record._history_loaded:
             return
 
         try:
-            doc = await self.db.species_history.find_one({"monster_type": record.monster_type})
-
-            if not doc:
-                record._history_loaded = True
-                return
+            task = self._history_load_task(record)
+        except RuntimeError:
+            await self._fetch_history(record)
+        else:
+            await task
+
+    async def _fetch_history(self, record: SpeciesKnowledgeRecord) -> None:
+        """Read stored history and put it before any entries recorded since."""
+        if record._history_loaded:
+            return
 
-            # Check schema version
-            if doc.get("schema_version", 1) != SCHEMA_VERSION:
-                logger.warning(
-                    f"[MongoDBSpeciesStore] History schema mismatch for {record.monster_type}, clearing"
-                )
-                await self.db.species_history.delete_one({"monster_type": record.monster_type})
-                record._history_loaded = True
-                return
-
-            # Load history entries
-            for h in doc.get("history", []):
-                record.history.append(LearningHistoryEntry(
-                    timestamp=h.get("timestamp", ""),
-                    generation=h.get("generation", 0),
-                    reward=h.get("reward", 0.0),
-                    state_index=h.get("state_index", 0),
-                    action=h.get("action", ""),
-                    q_value_before=h.get("q_value_before", 0.0),
-                    q_value_after=h.get("q_value_after", 0.0),
-                ))
+        try:
+            docs = await self.db.species_history_events.find(
+                {"monster_type": record.monster_type, "schema_version": SCHEMA_VERSION},
+                projection=_EVENT_PROJECTION,
+            ).sort("timestamp", -1).limit(HISTORY_LIMIT).to_list(length=None)
+            docs.reverse()
+            stored = [LearningHistoryEntry(**doc) for doc in docs]
+            if not stored:
+                stored = await self._migrate_legacy_history(record.monster_type)
+
+            if stored:
+                # Entries recorded before the load finished are still unsaved
+                self._last_saved_event.setdefault(record.monster_type, stored[-1])
+                record.history = (stored + record.history)[-HISTORY_LIMIT:]
 
             record._history_loaded = True
             logger.info(f"[MongoDBSpeciesStore] Loaded {len(record.history)} history entries for {record.monster_type}")
@@ -180,101 +299,235 @@ class MongoDBSpeciesKnowledgeStore:
             logger.error(f"[MongoDBSpeciesStore] Failed to load history for {record.monster_type}: {e}")
             record._history_loaded = True
 
-    def _save_history(self, record: SpeciesKnowledgeRecord) -> None:
-        """Save history for a species to MongoDB (synchronous wrapper)."""
-        if not record._history_dirty:
-            return
+    async def _migrate_legacy_history(self, monster_type: str) -> List[LearningHistoryEntry]:
+        """Move a species' embedded species_history array into events."""
+        doc = await self.db.species_history.find_one(
+            {"monster_type": monster_type},
+            projection=_HISTORY_PROJECTION,
+        )
+        if not doc:
+            return []
 
-        try:
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                asyncio.create_task(self._async_save_history(record))
-            else:
-                loop.run_until_complete(self._async_save_history(record))
-        except Exception as e:
-            logger.error(f"[MongoDBSpeciesStore] Error in _save_history: {e}")
+        if doc.get("schema_version", 1) != SCHEMA_VERSION:
+            logger.warning(
+                f"[MongoDBSpeciesStore] History schema mismatch for {monster_type}, clearing"
+            )
+            await self.db.species_history.delete_one({"monster_type": monster_type})
+            return []
 
-    async def _async_save_history(self, record: SpeciesKnowledgeRecord) -> None:
-        """Internal async implementation of history saving."""
-        try:
-            history_data = {
-                "monster_type": record.monster_type,
-                "schema_version": SCHEMA_VERSION,
-                "history": [
-                    {
-                        "timestamp": h.timestamp,
-                        "generation": h.generation,
-                        "reward": h.reward,
-                        "state_index": h.state_index,
-                        "action": h.action,
-                        "q_value_before": h.q_value_before,
-                        "q_value_after": h.q_value_after,
-                    }
-                    for h in record.history[-HISTORY_LIMIT:]  # Limit history size
-                ],
-                "last_updated": datetime.now()
-            }
-
-            await self.db.species_history.update_one(
-                {"monster_type": record.monster_type},
-                {"$set": history_data},
-                upsert=True
+        entries = [
+            LearningHistoryEntry(
+                timestamp=h.get("timestamp", ""),
+                generation=h.get("generation", 0),
+                reward=h.get("reward", 0.0),
+                state_index=h.get("state_index", 0),
+                action=h.get("action", ""),
+                q_value_before=h.get("q_value_before", 0.0),
+                q_value_after=h.get("q_value_after", 0.0),
+            )
+            for h in doc.get("history", [])[-HISTORY_LIMIT:]
+        ]
+        if entries:
+            await self.db.species_history_events.insert_many(
+                [_event_doc(monster_type, h) for h in entries]
             )
+        await self.db.species_history.delete_one({"monster_type": monster_type})
+        logger.info(f"[MongoDBSpeciesStore] Migrated {len(entries)} history entries for {monster_type}")
+        return entries
+
+    def _unsaved_history(self, record: SpeciesKnowledgeRecord) -> List[LearningHistoryEntry]:
+        """Entries recorded after the newest stored one, oldest first."""
+        last_saved = self._last_saved_event.get(record.monster_type)
+        history = record.history
+        for i in range(len(history) - 1, -1, -1):
+            if history[i] is last_saved:
+                return history[i + 1:]
+        # Never saved, or trimmed out of memory: everything held is new
+        return list(history)
+
+    async def _async_save_history(self, record: SpeciesKnowledgeRecord) -> None:
+        """Insert the history entries recorded since the last save."""
+        await self._save_histories([record])
 
-            record._history_dirty = False
-            logger.debug(f"[MongoDBSpeciesStore] Saved history for {record.monster_type}")
+    async def _save_histories(self, records: List[SpeciesKnowledgeRecord]) -> None:
+        """Insert new history entries for several species in one request."""
+        try:
+            pending = [(record, self._unsaved_history(record)) for record in records]
+            docs = [
+                _event_doc(record.monster_type, h)
+                for record, entries in pending
+                for h in entries
+            ]
+            if docs:
+                await self.db.species_history_events.insert_many(docs, ordered=False)
+
+            for record, entries in pending:
+                monster_type = record.monster_type
+                if entries:
+                    self._last_saved_event[monster_type] = entries[-1]
+                    inserted = self._events_since_trim.get(monster_type, 0) + len(entries)
+                    if inserted >= _HISTORY_TRIM_EVERY:
+                        await self._trim_history(monster_type)
+                        inserted = 0
+                    self._events_since_trim[monster_type] = inserted
+
+                # Entries may have been recorded while the insert was in flight
+                record._history_dirty = bool(record.history) and (
+                    record.history[-1] is not self._last_saved_event.get(monster_type)
+                )
+            logger.debug(f"[MongoDBSpeciesStore] Saved {len(docs)} history entries")
 
         except Exception as e:
-            logger.error(f"[MongoDBSpeciesStore] Error saving history for {record.monster_type}: {e}")
+            logger.error(f"[MongoDBSpeciesStore] Error saving history: {e}")
+
+    async def _trim_history(self, monster_type: str) -> None:
+        """Delete stored events older than the newest HISTORY_LIMIT."""
+        cutoff = await self.db.species_history_events.find(
+            {"monster_type": monster_type},
+            projection={"_id": 0, "timestamp": 1},
+        ).sort("timestamp", -1).skip(HISTORY_LIMIT).limit(1).to_list(length=1)
+        if cutoff:
+            await self.db.species_history_events.delete_many({
+                "monster_type": monster_type,
+                "timestamp": {"$lte": cutoff[0]["timestamp"]},
+            })
 
     def save(self) -> None:
-        """Persist all species knowledge to MongoDB (synchronous wrapper)."""
+        """
+        Persist all species knowledge to MongoDB.
+
+        Schedules a save on the running event loop and returns. Saves run
+        one at a time; calls made while one is in flight are coalesced
+        into a single follow-up save. Without a running loop the save
+        runs to completion.
+        """
+        self._save_requested = True
+        if self._save_task is not None and not self._save_task.done():
+            return
         try:
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                asyncio.create_task(self._async_save())
-            else:
-                loop.run_until_complete(self._async_save())
-        except Exception as e:
-            logger.error(f"[MongoDBSpeciesStore] Error in save: {e}")
+            self._save_task = asyncio.get_running_loop().create_task(self._save_loop())
+        except RuntimeError:
+            asyncio.run(self._save_loop())
+
+    async def _save_loop(self) -> None:
+        """Run saves until no further save has been requested."""
+        while self._save_requested:
+            self._save_requested = False
+            await self._async_save()
+
+    async def flush(self) -> None:
+        """Wait until all requested saves have been written."""
+        while self._save_task is not None and not self._save_task.done():
+            await self._save_task
+
+    def _q_table_update(
+        self, monster_type: str, q_table: np.ndarray
+    ) -> Tuple[dict, Callable[[], None]]:
+        """
+        Update operators that bring the stored Q-table up to date.
+
+        Returns the operators and a callback that records them as stored;
+        call it only once the write has succeeded, so a failed save is
+        retried in full by the next one.
+        """
+        saved = self._saved_q_tables.get(monster_type)
+        pushed = self._q_delta_counts.get(monster_type, 0)
+
+        if saved is not None and saved.shape == q_table.shape:
+            changed = np.flatnonzero(q_table != saved)
+            if not changed.size:
+                return {}, lambda: None
+            if pushed + changed.size <= _Q_DELTA_LIMIT:
+                # Fancy indexing copies, so later learning can't alter these
+                values = q_table.flat[changed]
+                states, actions = np.unravel_index(changed, q_table.shape)
+                deltas = [
+                    {"s": s, "a": a, "v": v}
+                    for s, a, v in zip(states.tolist(), actions.tolist(), values.tolist())
+                ]
+
+                def commit() -> None:
+                    saved.flat[changed] = values
+                    self._q_delta_counts[monster_type] = pushed + changed.size
+
+                return {"$push": {"q_table_deltas": {"$each": deltas}}}, commit
+
+        # Full rewrite. The snapshot becomes the stored reference for
+        # later diffs, so it must not share memory with the live table.
+        # When quantized it stays exact: diffing against the rounded table
+        # would report every rounded cell as changed.
+        snapshot = np.array(q_table, dtype=np.float32, order="C")
+
+        def commit() -> None:
+            self._saved_q_tables[monster_type] = snapshot
+            self._q_delta_counts[monster_type] = 0
+
+        fields = {
+            "q_table_shape": list(snapshot.shape),
+            "q_table_compression": _Q_TABLE_COMPRESSION,
+            "q_table_deltas": [],
+        }
+        if settings.ai.quantize_q_tables:
+            values, scales = _quantize_q_table(snapshot)
+            fields["q_table"] = Binary(_ZSTD_COMPRESSOR.compress(values))
+            fields["q_table_quantization"] = _Q_TABLE_QUANTIZATION
+            fields["q_table_scales"] = Binary(scales.tobytes())
+            return {"$set": fields}, commit
+
+        fields["q_table"] = Binary(_ZSTD_COMPRESSOR.compress(snapshot))
+        return {
+            "$set": fields,
+            "$unset": {"q_table_quantization": "", "q_table_scales": ""},
+        }, commit
 
     async def _async_save(self) -> None:
         """Internal async implementation of save."""
+        if not self._loaded:
+            # Saving before load() would overwrite stored records with fresh ones
+            logger.warning("[MongoDBSpeciesStore] Skipping save: knowledge not loaded yet")
+            return
         try:
-            from pymongo import UpdateOne
-
             ops = []
+            commits = []
 
             for monster_type, record in self.records.items():
-                # Serialize Q-table to Binary
-                q_table_binary = Binary(record.q_table.tobytes())
+                counters = (record.generation, record.encounters, record.total_learning_steps)
+                # Only the Q-table cells changed since the last save
+                q_update, commit = self._q_table_update(monster_type, record.q_table)
+                if not q_update and self._saved_counters.get(monster_type) == counters:
+                    continue  # Nothing to write for this species
 
+                now = _now_ms()
                 doc = {
                     "monster_type": monster_type,
                     "generation": record.generation,
                     "encounters": record.encounters,
                     "total_learning_steps": record.total_learning_steps,
-                    "q_table_shape": list(record.q_table.shape),
-                    "q_table": q_table_binary,
                     "schema_version": SCHEMA_VERSION,
-                    "last_updated": datetime.now()
+                    "last_updated": now
                 }
-
-                ops.append(UpdateOne(
-                    {"monster_type": monster_type},
-                    {
-                        "$set": doc,
-                        "$setOnInsert": {"created_at": datetime.now()}
-                    },
-                    upsert=True
-                ))
-
-                # Save history if dirty
-                if record._history_dirty:
-                    await self._async_save_history(record)
-
+                update = {"$set": doc}
+                for operator, fields in q_update.items():
+                    update.setdefault(operator, {}).update(fields)
+                commits.append((monster_type, counters, commit))
+
+                # Species loaded or saved before are plain updates; only new
+                # ones pay for the upsert and its created_at stamp
+                stored = monster_type in self._saved_counters
+                if not stored:
+                    update["$setOnInsert"] = {"created_at": now}
+                ops.append(UpdateOne({"monster_type": monster_type}, update, upsert=not stored))
+
+            # Q-tables and new history events are written concurrently
+            dirty = [record for record in self.records.values() if record._history_dirty]
+            writes = [self._save_histories(dirty)]
+            if ops:
+                writes.append(self.db.species_knowledge.bulk_write(ops, ordered=False))
+            await asyncio.gather(*writes)
+            for monster_type, counters, commit in commits:
+                commit()
+                self._saved_counters[monster_type] = counters
             if ops:
-                await self.db.species_knowledge.bulk_write(ops)
                 print(f"[MongoDBSpeciesStore] ✓ Saved {len(ops)} species knowledge records to MongoDB")
                 logger.info(f"[MongoDBSpeciesStore] Saved {len(ops)} species records")
 
@@ -283,36 +536,17 @@ class MongoDBSpeciesKnowledgeStore:
             logger.error(f"[MongoDBSpeciesStore] Error saving species knowledge: {e}")
 
     def save_history(self, monster_type: str) -> None:
-        """Save history for a specific species."""
+        """Save history for a specific species (written by the next save)."""
         record = self.records.get(monster_type)
         if record and record._history_dirty:
-            self._save_history(record)
+            self.save()
 
-    def get_history(self, monster_type: str, limit: int = 0):
+    async def get_history_async(self, monster_type: str, limit: int = 0):
         """
         Get learning history for a species.
 
-        Args:
-            monster_type: Species to get history for
-            limit: If > 0, return only the last N entries
-
-        Returns:
-            List of history entries (newest last)
-        """
-        record = self.records.get(monster_type)
-        if not record:
-            return []
-
-        # Lazy load history from MongoDB
-        self._load_history(record)
-
-        if limit > 0:
-            return record.history[-limit:]
-        return record.history
-
-    async def get_history_async(self, monster_type: str, limit: int = 0):
-        """
-        Get learning history for a species (async version for API endpoints).
+        There is no sync get_history here: it could only start the load
+        and return whatever was in memory, silently missing stored history.
 
         Args:
             monster_type: Species to get history for
@@ -344,27 +578,23 @@ class MongoDBSpeciesKnowledgeStore:
 
         Automatically resizes Q-table if state space changed.
         """
-        if monster_type not in self.records:
+        # Called per monster decision: one lookup on the common path
+        record = self.records.get(monster_type)
+        if record is None:
             table = np.zeros((state_space, action_count), dtype=np.float32)
-            self.records[monster_type] = SpeciesKnowledgeRecord(
+            record = self.records[monster_type] = SpeciesKnowledgeRecord(
                 monster_type=monster_type,
                 generation=0,
                 q_table=table,
             )
 
-        record = self.records[monster_type]
-
         # Resize table if needed
-        if record.q_table.shape != (state_space, action_count):
+        elif record.q_table.shape != (state_space, action_count):
             logger.info(
                 f"[MongoDBSpeciesStore] Resizing {monster_type} Q-table: "
                 f"{record.q_table.shape} -> ({state_space}, {action_count})"
             )
-            padded = np.zeros((state_space, action_count), dtype=np.float32)
-            min_states = min(state_space, record.q_table.shape[0])
-            min_actions = min(action_count, record.q_table.shape[1])
-            padded[:min_states, :min_actions] = record.q_table[:min_states, :min_actions]
-            record.q_table = padded
+            record.q_table = resize_q_table(record.q_table, state_space, action_count)
 
         return record
 
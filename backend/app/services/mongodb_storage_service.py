@@ -3,19 +3,42 @@ MongoDB-based game persistence service.
 Provides the same API interface as StorageService but uses MongoDB instead of JSON files.
 """
 import asyncio
+import time
 from datetime import datetime
 from typing import Optional
 import logging
 
-from ..db import mongodb_manager
+from pymongo import UpdateOne
+
+from ..db import CollectionHandles, mongodb_manager
 
 logger = logging.getLogger(__name__)
 
+# Player and stats documents minus the fields the registry does not keep
+_REGISTRY_PROJECTION = {"_id": 0, "updated_at": 0}
+# Game documents hold the whole game state; list_game_saves needs only these
+_SAVE_LISTING_PROJECTION = {"_id": 0, "game_id": 1, "saved_at": 1, "name": 1}
+# Save bookkeeping fields that load_game_by_id leaves out of the game state
+_GAME_STATE_PROJECTION = {"_id": 0, "game_id": 0, "saved_at": 0, "save_reason": 0}
+
+
+def _now_ms() -> int:
+    """Current time as epoch milliseconds, the stored timestamp format."""
+    return time.time_ns() // 1_000_000
+
+
+def _saved_at_ms(saved_at) -> int:
+    """Epoch milliseconds of a stored saved_at (older saves hold a datetime)."""
+    if isinstance(saved_at, datetime):
+        return int(saved_at.timestamp() * 1000)
+    return saved_at or 0
+
 
 class MongoDBStorageService:
     """MongoDB-based storage service maintaining compatibility with JSON-based API."""
 
     _instance: Optional["MongoDBStorageService"] = None
+    _db_handles: Optional[CollectionHandles] = None
 
     def __new__(cls) -> "MongoDBStorageService":
         if cls._instance is None:
@@ -32,9 +55,13 @@ class MongoDBStorageService:
         logger.info("[MongoDBStorageService] Initialized")
 
     @property
-    def db(self):
-        """Get MongoDB database instance."""
-        return mongodb_manager.db
+    def db(self) -> CollectionHandles:
+        """Collection handles for the connected MongoDB database."""
+        db = mongodb_manager.db
+        # Rebuilt only if the manager reconnected to a new database object
+        if self._db_handles is None or self._db_handles.database is not db:
+            self._db_handles = CollectionHandles(db)
+        return self._db_handles
 
     # ============== Per-Game Save Methods ==============
 
@@ -59,7 +86,7 @@ class MongoDBStorageService:
             try:
                 save_data = {
                     "game_id": game_id,
-                    "saved_at": datetime.now(),
+                    "saved_at": _now_ms(),
                     "save_reason": reason,
                     **game_state  # Flatten game state into document
                 }
@@ -90,18 +117,15 @@ class MongoDBStorageService:
             Game state dictionary, or None if not found
         """
         try:
-            doc = await self.db.games.find_one({"game_id": game_id})
+            # MongoDB-specific fields are projected away server-side
+            doc = await self.db.games.find_one(
+                {"game_id": game_id}, projection=_GAME_STATE_PROJECTION
+            )
 
             if not doc:
                 logger.info(f"[MongoDBStorage] No save found for game {game_id}")
                 return None
 
-            # Remove MongoDB-specific fields
-            doc.pop("_id", None)
-            doc.pop("game_id", None)
-            doc.pop("saved_at", None)
-            doc.pop("save_reason", None)
-
             logger.info(f"[MongoDBStorage] Loaded game {game_id}")
             return doc
 
@@ -132,43 +156,30 @@ class MongoDBStorageService:
             logger.error(f"[MongoDBStorage] Error deleting game {game_id}: {e}")
             return False
 
-    def list_game_saves(self) -> list[dict]:
+    async def list_game_saves(self) -> list[dict]:
         """
-        List all game saves from MongoDB (synchronous wrapper).
+        List all game saves from MongoDB, newest first.
 
         Returns:
             List of save metadata dictionaries
         """
-        # This method is called synchronously in some places, so we need to handle it
-        try:
-            import asyncio
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                # If we're in an async context, we can't use run_until_complete
-                # Return empty list and log warning
-                logger.warning("[MongoDBStorage] list_game_saves called from async context")
-                return []
-            return loop.run_until_complete(self._async_list_game_saves())
-        except Exception as e:
-            logger.error(f"[MongoDBStorage] Error in list_game_saves: {e}")
-            return []
-
-    async def _async_list_game_saves(self) -> list[dict]:
-        """Internal async implementation of list_game_saves."""
         try:
             saves = []
-            cursor = self.db.games.find().sort("saved_at", -1)
-
-            async for doc in cursor:
-                saves.append({
+            # Sorted here, not by the query: saves written before saved_at
+            # became epoch milliseconds still hold BSON dates, which MongoDB
+            # orders apart from numbers
+            async for doc in self.db.games.find({}, projection=_SAVE_LISTING_PROJECTION):
+                saved_at = _saved_at_ms(doc.get("saved_at"))
+                saves.append((saved_at, {
                     "game_id": doc.get("game_id"),
                     "file": f"mongodb://{doc.get('game_id')}",  # Virtual path
                     "version": "2.0",
-                    "saved_at": doc.get("saved_at").isoformat() if doc.get("saved_at") else None,
+                    "saved_at": datetime.fromtimestamp(saved_at / 1000).isoformat() if saved_at else None,
                     "name": doc.get("name", "Unknown")
-                })
+                }))
 
-            return saves
+            saves.sort(key=lambda save: save[0], reverse=True)
+            return [save for _, save in saves]
 
         except Exception as e:
             logger.error(f"[MongoDBStorage] Error listing game saves: {e}")
@@ -192,15 +203,15 @@ class MongoDBStorageService:
                 players_data = registry_data.get("players", {})
                 stats_data = registry_data.get("stats", {})
                 print(f"[MongoDBStorage] Players: {len(players_data)}, Stats: {len(stats_data)}")
+                # One timestamp for the whole save
+                now = _now_ms()
 
                 # Bulk upsert players
                 if players_data:
-                    from pymongo import UpdateOne
-
                     player_ops = [
                         UpdateOne(
                             {"token": token},
-                            {"$set": {**data, "token": token, "updated_at": datetime.now()}},
+                            {"$set": {**data, "token": token, "updated_at": now}},
                             upsert=True
                         )
                         for token, data in players_data.items()
@@ -211,16 +222,15 @@ class MongoDBStorageService:
 
                 # Bulk upsert player stats
                 if stats_data:
-                    from pymongo import UpdateOne
-
                     # Debug: Show what we're saving
-                    for token, data in stats_data.items():
-                        print(f"[MongoDBStorage] Saving stats for {token[:8]}: {data.get('monsters_killed', 0)} kills, {data.get('damage_dealt', 0)} damage")
+                    if logger.isEnabledFor(logging.DEBUG):
+                        for token, data in stats_data.items():
+                            logger.debug(f"[MongoDBStorage] Saving stats for {token[:8]}: {data.get('monsters_killed', 0)} kills, {data.get('damage_dealt', 0)} damage")
 
                     stat_ops = [
                         UpdateOne(
                             {"token": token},
-                            {"$set": {**data, "token": token, "updated_at": datetime.now()}},
+                            {"$set": {**data, "token": token, "updated_at": now}},
                             upsert=True
                         )
                         for token, data in stats_data.items()
@@ -248,27 +258,13 @@ class MongoDBStorageService:
             Registry dictionary with 'players' and 'stats', or None if error
         """
         try:
-            # Load all players
-            players = {}
-            cursor = self.db.players.find()
-            async for doc in cursor:
-                token = doc.get("token")
-                if token:
-                    doc.pop("_id", None)
-                    doc.pop("token", None)
-                    doc.pop("updated_at", None)
-                    players[token] = doc
-
-            # Load all player stats
-            stats = {}
-            cursor = self.db.player_stats.find()
-            async for doc in cursor:
-                token = doc.get("token")
-                if token:
-                    doc.pop("_id", None)
-                    doc.pop("token", None)
-                    doc.pop("updated_at", None)
-                    stats[token] = doc
+            # Players and stats are independent; fetch both at once
+            player_docs, stat_docs = await asyncio.gather(
+                self.db.players.find({}, projection=_REGISTRY_PROJECTION).to_list(length=None),
+                self.db.player_stats.find({}, projection=_REGISTRY_PROJECTION).to_list(length=None),
+            )
+            players = {doc.pop("token"): doc for doc in player_docs if doc.get("token")}
+            stats = {doc.pop("token"): doc for doc in stat_docs if doc.get("token")}
 
             logger.info(f"[MongoDBStorage] Loaded player registry: {len(players)} players, {len(stats)} stats")
 
@@ -315,14 +311,14 @@ class MongoDBStorageService:
         """
         return await self.load_game_by_id(save_id)
 
-    def list_saves(self) -> list[dict]:
+    async def list_saves(self) -> list[dict]:
         """
         List all available saves (legacy method).
 
         Returns:
             List of save metadata dictionaries
         """
-        return self.list_game_saves()
+        return await self.list_game_saves()
 
     async def delete_save(self, save_id: str) -> bool:
         """
@@ -1,4 +1,7 @@
 """Monster service for spawning, AI behavior, and configuration management."""
+import asyncio
+import bisect
+import itertools
 import json
 import random
 import uuid
@@ -6,6 +9,8 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Callable, List, Optional, Set, Tuple
 
+import numpy as np
+
 from ..config import settings
 from ..core.events import event_bus, EventType, GameEvent
 from ..domain.entities import (
@@ -28,7 +33,7 @@ from ..domain.intelligence import (
 from ..domain.intelligence.learning import AIAction
 from ..domain.map import (
     TILE_DOOR_CLOSED, TILE_DOOR_OPEN, TILE_FLOOR,
-    AStar, Direction, get_direction_to_target, is_in_corridor, find_nearest_corridor,
+    AStar, Direction, PathFollower, get_direction_to_target, is_in_corridor, find_nearest_corridor,
 )
 from ..db import mongodb_manager
 from .mongodb_species_store import MongoDBSpeciesKnowledgeStore
@@ -48,6 +53,10 @@ class MonsterService:
     """Service for monster spawning, configuration, and AI behavior."""
     
     _instance: Optional["MonsterService"] = None
+    # room_type -> (monster types, cumulative weights), valid for the
+    # spawn_rates/monster_types objects in _room_weight_sources
+    _room_weight_cache: Optional[dict[str, tuple[list[str], list[int]]]] = None
+    _room_weight_sources: tuple = (None, None)
     
     def __new__(cls) -> "MonsterService":
         if cls._instance is None:
@@ -68,16 +77,37 @@ class MonsterService:
         print("[MonsterService] Initializing MonsterService (deferred species store setup)")
         
         self.monster_memories: dict[str, ThreatMemory] = {}
+        self._astar: Optional[AStar] = None
+        self.monster_paths: dict[str, PathFollower] = {}
         # Don't load configs yet - will be done in initialize()
         event_bus.subscribe_async(EventType.DAMAGE_DEALT, self._handle_damage_event)
         event_bus.subscribe_async(EventType.MONSTER_DIED, self._handle_monster_death)
         self._initialized = True
 
     def initialize(self) -> None:
-        """Initialize the species store and load configurations."""
+        """Initialize the species store and load configurations from JSON."""
+        if self.species_store is not None:
+            return  # Already initialized
+
+        self._init_species_store()
+        self._load_configs()
+
+    async def initialize_async(self) -> None:
+        """Initialize the species store and load configurations, from MongoDB when connected."""
         if self.species_store is not None:
             return  # Already initialized
 
+        self._init_species_store()
+        if settings.mongodb.is_enabled and mongodb_manager.is_connected:
+            self.monster_types, self.spawn_rates = await asyncio.gather(
+                self._async_load_monsters(),
+                self._async_load_spawn_rates(),
+            )
+            self._build_ai_profiles()
+        else:
+            self._load_configs()
+
+    def _init_species_store(self) -> None:
         print(f"[MonsterService] Initializing species store - MongoDB enabled: {settings.mongodb.is_enabled}, connected: {mongodb_manager.is_connected}")
         if settings.mongodb.is_enabled and mongodb_manager.is_connected:
             self.species_store = MongoDBSpeciesKnowledgeStore()
@@ -86,56 +116,45 @@ class MonsterService:
             self.species_store = SpeciesKnowledgeStore()
             print("[MonsterService] Using JSON species knowledge store")
 
-        self._load_configs()
+    async def start(self) -> None:
+        """Initialize and wait for the species store to load its knowledge."""
+        await self.initialize_async()
+        if isinstance(self.species_store, MongoDBSpeciesKnowledgeStore):
+            await self.species_store.load()
+
+    async def stop(self) -> None:
+        """Wait for pending species knowledge saves to finish."""
+        if isinstance(self.species_store, MongoDBSpeciesKnowledgeStore):
+            await self.species_store.flush()
 
     def _ensure_initialized(self) -> None:
         """Ensure the service is fully initialized."""
         if self.species_store is None:
             self.initialize()
 
-    def reinitialize_species_store(self) -> None:
+    async def reinitialize_species_store(self) -> None:
         """Reinitialize the species store based on current MongoDB connection status."""
         print(f"[MonsterService] Reinitializing species store - MongoDB connected: {mongodb_manager.is_connected}")
         if settings.mongodb.is_enabled and mongodb_manager.is_connected:
             self.species_store = MongoDBSpeciesKnowledgeStore()
+            await self.species_store.load()
             print("[MonsterService] Switched to MongoDB species knowledge store")
         else:
             self.species_store = SpeciesKnowledgeStore()
             print("[MonsterService] Switched to JSON species knowledge store")
         
         # Reload spawn rates with the new store
-        self.spawn_rates = self._load_spawn_rates_sync()
+        if settings.mongodb.is_enabled and mongodb_manager.is_connected:
+            self.spawn_rates = await self._async_load_spawn_rates()
+        else:
+            self.spawn_rates = self._load_spawn_rates_from_json()
     
     def _load_configs(self) -> None:
-        """Load monster and spawn rate configurations."""
-        # Load monster types - try MongoDB first, fallback to JSON
-        self.monster_types = self._load_monsters_sync()
-
-        # Load spawn rates - try MongoDB first, fallback to JSON
-        self.spawn_rates = self._load_spawn_rates_sync()
+        """Load monster and spawn rate configurations from JSON."""
+        self.monster_types = self._load_monsters_from_json()
+        self.spawn_rates = self._load_spawn_rates_from_json()
         self._build_ai_profiles()
 
-    def _load_monsters_sync(self) -> dict:
-        """Load monster types configuration (synchronous)."""
-        # Try MongoDB first if available
-        if settings.mongodb.is_enabled and mongodb_manager.is_connected:
-            try:
-                import asyncio
-                loop = asyncio.get_event_loop()
-                if loop.is_running():
-                    # In async context, schedule task
-                    asyncio.create_task(self._async_load_monsters_to_cache())
-                    # Return from JSON for now
-                    return self._load_monsters_from_json()
-                else:
-                    # Can use run_until_complete
-                    return loop.run_until_complete(self._async_load_monsters())
-            except Exception as e:
-                print(f"[MonsterService] Error loading monsters from MongoDB: {e}")
-
-        # Fallback to JSON
-        return self._load_monsters_from_json()
-
     async def _async_load_monsters(self) -> dict:
         """Load monster types from MongoDB (async)."""
         try:
@@ -150,13 +169,6 @@ class MonsterService:
         # Fallback to JSON
         return self._load_monsters_from_json()
 
-    async def _async_load_monsters_to_cache(self) -> None:
-        """Load monsters from MongoDB and update cache (async helper)."""
-        monsters = await self._async_load_monsters()
-        if monsters:
-            self.monster_types = monsters
-            self._build_ai_profiles()
-
     def _load_monsters_from_json(self) -> dict:
         """Load monster types from JSON file (fallback)."""
         monsters_file = self.config_path / "monsters.json"
@@ -169,27 +181,6 @@ class MonsterService:
             print(f"[MonsterService] Warning: {monsters_file} not found")
             return {}
 
-    def _load_spawn_rates_sync(self) -> dict:
-        """Load spawn rates configuration (synchronous)."""
-        # Try MongoDB first if available
-        if settings.mongodb.is_enabled and mongodb_manager.is_connected:
-            try:
-                import asyncio
-                loop = asyncio.get_event_loop()
-                if loop.is_running():
-                    # In async context, schedule task
-                    asyncio.create_task(self._async_load_spawn_rates_to_cache())
-                    # Return from JSON for now
-                    return self._load_spawn_rates_from_json()
-                else:
-                    # Can use run_until_complete
-                    return loop.run_until_complete(self._async_load_spawn_rates())
-            except Exception as e:
-                print(f"[MonsterService] Error loading spawn rates from MongoDB: {e}")
-
-        # Fallback to JSON
-        return self._load_spawn_rates_from_json()
-
     async def _async_load_spawn_rates(self) -> dict:
         """Load spawn rates from MongoDB (async)."""
         try:
@@ -208,10 +199,6 @@ class MonsterService:
         # Fallback to JSON
         return self._load_spawn_rates_from_json()
 
-    async def _async_load_spawn_rates_to_cache(self) -> None:
-        """Async helper to load spawn rates and update cache."""
-        self.spawn_rates = await self._async_load_spawn_rates()
-
     def _load_spawn_rates_from_json(self) -> dict:
         """Load spawn rates from JSON file."""
         spawn_file = self.config_path / "spawn_rates.json"
@@ -261,28 +248,35 @@ class MonsterService:
     
     def get_monster_weights(self, room_type: str) -> dict[str, int]:
         """Get monster type weights for a room type."""
-        default_weights = {mt: 5 for mt in self.monster_types.keys()}
-        return self.spawn_rates.get("room_monster_weights", {}).get(room_type, default_weights)
+        weights = self.spawn_rates.get("room_monster_weights", {}).get(room_type)
+        if weights is None:
+            # Only build the equal-weight default for unconfigured rooms
+            weights = {mt: 5 for mt in self.monster_types}
+        return weights
     
     def select_monster_type(self, room_type: str) -> Optional[str]:
         """Select a random monster type based on room weights."""
-        weights = self.get_monster_weights(room_type)
-        if not weights:
-            return None
-        
-        valid_weights = {k: v for k, v in weights.items() if k in self.monster_types}
-        if not valid_weights:
+        types, cumulative = self._room_weights(room_type)
+        if not types:
             return None
-        
-        total = sum(valid_weights.values())
-        r = random.random() * total
-        cumulative = 0
-        for monster_type, weight in valid_weights.items():
-            cumulative += weight
-            if r <= cumulative:
-                return monster_type
-        
-        return list(valid_weights.keys())[0]
+        return types[bisect.bisect_left(cumulative, random.random() * cumulative[-1])]
+
+    def _room_weights(self, room_type: str) -> tuple[list[str], list[int]]:
+        """Spawnable monster types and their cumulative weights for a room type."""
+        sources = (self.spawn_rates, self.monster_types)
+        cache = self._room_weight_cache
+        if cache is None or any(a is not b for a, b in zip(sources, self._room_weight_sources)):
+            # Configs are replaced wholesale on reload, so identity is enough
+            cache = self._room_weight_cache = {}
+            self._room_weight_sources = sources
+
+        entry = cache.get(room_type)
+        if entry is None:
+            weights = self.get_monster_weights(room_type) or {}
+            types = [k for k in weights if k in self.monster_types]
+            cumulative = list(itertools.accumulate(weights[k] for k in types))
+            entry = cache[room_type] = (types, cumulative)
+        return entry
     
     def create_monster(
         self,
@@ -338,6 +332,47 @@ class MonsterService:
         """Get minimum room area required for monster spawns."""
         return self.spawn_rates.get("min_room_area_for_spawn", 36)
     
+    @staticmethod
+    def _spawn_positions(
+        room: Room,
+        tiles: list[list[int]],
+        occupied_positions: set[tuple[int, int]],
+        map_width: int,
+        map_height: int,
+    ) -> list[tuple[int, int]]:
+        """
+        Free floor tiles inside the room walls, not next to a door.
+
+        Works on an array copy of the room plus a one-tile ring (clamped to
+        the map) instead of checking each tile's 3x3 neighbourhood in Python.
+        Positions come back in row-major order.
+        """
+        x0, x1 = room.x + 1, room.x + room.width - 1
+        y0, y1 = room.y + 1, room.y + room.height - 1
+        if x1 <= x0 or y1 <= y0:
+            return []
+
+        wx0, wx1 = max(x0 - 1, 0), min(x1 + 1, map_width)
+        wy0, wy1 = max(y0 - 1, 0), min(y1 + 1, map_height)
+        window = np.array([row[wx0:wx1] for row in tiles[wy0:wy1]], dtype=np.uint8)
+
+        # Tiles with a door anywhere in their 3x3 neighbourhood
+        door = np.pad((window == TILE_DOOR_CLOSED) | (window == TILE_DOOR_OPEN), 1)
+        height, width = window.shape
+        near_door = np.zeros(window.shape, dtype=bool)
+        for dy in range(3):
+            for dx in range(3):
+                near_door |= door[dy:dy + height, dx:dx + width]
+
+        interior = (slice(y0 - wy0, y1 - wy0), slice(x0 - wx0, x1 - wx0))
+        valid = (window[interior] == TILE_FLOOR) & ~near_door[interior]
+        for x, y in occupied_positions:
+            if x0 <= x < x1 and y0 <= y < y1:
+                valid[y - y0, x - x0] = False
+
+        ys, xs = np.nonzero(valid)
+        return list(zip((xs + x0).tolist(), (ys + y0).tolist()))
+
     def spawn_monsters_in_room(
         self,
         room: Room,
@@ -377,23 +412,7 @@ class MonsterService:
         monster_count = min(max_monsters, max(1, room.area // 50))
         
         # Get valid spawn positions
-        valid_positions = []
-        for y in range(room.y + 1, room.y + room.height - 1):
-            for x in range(room.x + 1, room.x + room.width - 1):
-                if tiles[y][x] == TILE_FLOOR and (x, y) not in occupied_positions:
-                    # Check not adjacent to door
-                    near_door = False
-                    for dy in [-1, 0, 1]:
-                        for dx in [-1, 0, 1]:
-                            nx, ny = x + dx, y + dy
-                            if 0 <= nx < map_width and 0 <= ny < map_height:
-                                if tiles[ny][nx] in (TILE_DOOR_CLOSED, TILE_DOOR_OPEN):
-                                    near_door = True
-                                    break
-                        if near_door:
-                            break
-                    if not near_door:
-                        valid_positions.append((x, y))
+        valid_positions = self._spawn_positions(room, tiles, occupied_positions, map_width, map_height)
         
         if not valid_positions:
             return spawned
@@ -454,13 +473,7 @@ class MonsterService:
         """
         profile = self.ai_profiles.get(monster.monster_type)
         if not profile:
-            if monster.behavior == MonsterBehavior.STATIC:
-                return False
-            if monster.behavior == MonsterBehavior.PATROL:
-                return self._update_patrol(monster, room_bounds, tiles, occupied_positions, current_tick)
-            if monster.behavior == MonsterBehavior.SEARCHING:
-                return self._update_searching(monster, room_bounds, tiles, occupied_positions)
-            return False
+            return self._update_without_profile(monster, room_bounds, tiles, occupied_positions, current_tick)
 
         world = self._prepare_world_state(world_state)
         decision, species_record, _ = self._evaluate_decision(
@@ -482,6 +495,94 @@ class MonsterService:
             rooms=rooms,
         )
 
+    def update_monsters_batch(
+        self,
+        entries: list[tuple[Monster, tuple[int, int, int, int], Optional[dict[str, object]]]],
+        tiles: list[list[int]],
+        occupied_positions: set[tuple[int, int]],
+        current_tick: int,
+        *,
+        rooms: Optional[list[Room]] = None,
+    ) -> bool:
+        """
+        Update many monsters' AI behavior in one tick.
+        
+        Decisions for monsters of the same species are made together in one
+        vectorized pass over the shared Q-table; movement then runs one
+        monster at a time, each vacating its tile in occupied_positions while
+        it moves.
+        
+        The world states are one snapshot taken before any monster moves and
+        are not rebuilt as earlier monsters move. Callers must only put
+        inputs in them that monster moves cannot change (player positions,
+        room membership), or decisions will lag a tick behind.
+        
+        Args:
+            entries: (monster, room_bounds, world_state) for each monster
+            tiles: 2D tile array
+            occupied_positions: Set of occupied positions, including the monsters
+            current_tick: Current game tick
+            rooms: Optional list of all rooms (for corridor detection/patrol)
+        
+        Returns:
+            True if any monster moved
+        """
+        self._ensure_initialized()
+
+        worlds = [self._prepare_world_state(world_state) for _, _, world_state in entries]
+        groups: dict[str, list[int]] = {}
+        for i, (monster, _, _) in enumerate(entries):
+            if monster.monster_type in self.ai_profiles:
+                groups.setdefault(monster.monster_type, []).append(i)
+
+        actions: list[Optional[AIAction]] = [None] * len(entries)
+        for monster_type, indices in groups.items():
+            decisions = self._evaluate_decisions(
+                monsters=[entries[i][0] for i in indices],
+                profile=self.ai_profiles[monster_type],
+                world_states=[worlds[i] for i in indices],
+                current_tick=current_tick,
+            )
+            for i, decision in zip(indices, decisions):
+                actions[i] = decision.action
+
+        any_moved = False
+        for (monster, room_bounds, _), world, action in zip(entries, worlds, actions):
+            occupied_positions.discard((monster.x, monster.y))
+            if action is None:
+                moved = self._update_without_profile(monster, room_bounds, tiles, occupied_positions, current_tick)
+            else:
+                moved = self._execute_action(
+                    action,
+                    monster,
+                    room_bounds,
+                    tiles,
+                    occupied_positions,
+                    current_tick,
+                    world_state=world,
+                    rooms=rooms,
+                )
+            occupied_positions.add((monster.x, monster.y))
+            any_moved = any_moved or moved
+        return any_moved
+
+    def _update_without_profile(
+        self,
+        monster: Monster,
+        room_bounds: tuple[int, int, int, int],
+        tiles: list[list[int]],
+        occupied_positions: set[tuple[int, int]],
+        current_tick: int,
+    ) -> bool:
+        """Fixed behavior for monster types without an AI profile."""
+        if monster.behavior == MonsterBehavior.STATIC:
+            return False
+        if monster.behavior == MonsterBehavior.PATROL:
+            return self._update_patrol(monster, room_bounds, tiles, occupied_positions, current_tick)
+        if monster.behavior == MonsterBehavior.SEARCHING:
+            return self._update_searching(monster, room_bounds, tiles, occupied_positions)
+        return False
+
     def decide_combat_action(
         self,
         monster: Monster,
@@ -542,11 +643,7 @@ class MonsterService:
             world_state=world_state,
         )
         decision = profile.decision_engine.decide(context)
-        monster.intelligence_state.last_state_index = decision.state_index
-        monster.intelligence_state.last_action = decision.action.name
-        monster.intelligence_state.last_decision_tick = current_tick
-        monster.intelligence_state.q_table_version = species_record.q_table.shape[0]
-        monster.intelligence_state.last_world_state = dict(world_state)
+        self._record_decision(monster, decision, species_record, world_state, current_tick)
         
         # Call log callback if provided
         if log_callback:
@@ -575,6 +672,54 @@ class MonsterService:
         
         return decision, species_record, memory
 
+    def _evaluate_decisions(
+        self,
+        *,
+        monsters: list[Monster],
+        profile: MonsterAIProfile,
+        world_states: list[dict],
+        current_tick: int,
+    ) -> list[DecisionResult]:
+        """Batched _evaluate_decision for monsters of one species."""
+        species_record = self.species_store.get_or_create(
+            monsters[0].monster_type,
+            state_space=profile.decision_engine.encoder.state_space,
+            action_count=len(AIAction),
+        )
+        contexts = []
+        for monster, world_state in zip(monsters, world_states):
+            memory = self._get_memory(monster.id, profile)
+            memory.decay(current_tick)
+            contexts.append(DecisionContext(
+                monster=monster,
+                memory=memory,
+                personality=profile.personality,
+                q_table=species_record.q_table,
+                current_tick=current_tick,
+                world_state=world_state,
+            ))
+        decisions = profile.decision_engine.decide_batch(contexts)
+        for monster, world_state, decision in zip(monsters, world_states, decisions):
+            self._record_decision(monster, decision, species_record, world_state, current_tick)
+        return decisions
+
+    @staticmethod
+    def _record_decision(
+        monster: Monster,
+        decision: DecisionResult,
+        species_record: SpeciesKnowledgeRecord,
+        world_state: dict,
+        current_tick: int,
+    ) -> None:
+        """Store a decision on the monster for the learning step that follows."""
+        monster.intelligence_state.last_state_index = decision.state_index
+        monster.intelligence_state.last_action = decision.action.name
+        monster.intelligence_state.last_decision_tick = current_tick
+        monster.intelligence_state.q_table_version = species_record.q_table.shape[0]
+        # world_state comes fresh from _prepare_world_state and is never
+        # mutated afterwards, so it is kept as is rather than copied
+        monster.intelligence_state.last_world_state = world_state
+
     def _get_memory(self, monster_id: str, profile: MonsterAIProfile) -> ThreatMemory:
         memory = self.monster_memories.get(monster_id)
         if not memory:
@@ -653,7 +798,7 @@ class MonsterService:
     ) -> bool:
         """Patrol behavior: move randomly within room bounds."""
         # Only move every 2-4 ticks
-        move_interval = 2 + (hash(monster.id) % 3)
+        move_interval = 2 + (monster.move_jitter % 3)
         if current_tick - monster.last_move_tick < move_interval:
             return False
         
@@ -723,6 +868,42 @@ class MonsterService:
             return True
         return False
 
+    def _pathfinder(
+        self,
+        tiles: list[list[int]],
+        occupied_positions: set[tuple[int, int]],
+    ) -> AStar:
+        """
+        Get an AStar for these tiles and occupied set.
+        
+        Games pass the same occupied set to every monster in a tick, so
+        the instance is reused until either object changes.
+        """
+        astar = self._astar
+        if astar is None or astar.tiles is not tiles or astar.occupied is not occupied_positions:
+            astar = AStar(tiles, occupied_positions)
+            self._astar = astar
+        return astar
+
+    def _follow_path(
+        self,
+        monster: Monster,
+        astar: AStar,
+        goal: tuple[int, int],
+        max_iterations: int,
+    ) -> Optional[list[tuple[int, int]]]:
+        """Path for a monster, reusing its path from earlier ticks when it still holds."""
+        follower = self.monster_paths.get(monster.id)
+        if follower is None:
+            follower = PathFollower()
+            self.monster_paths[monster.id] = follower
+        return follower.find_path(
+            astar,
+            (monster.x, monster.y),
+            goal,
+            max_iterations=max_iterations,
+        )
+
     def _move_toward_threat(
         self,
         monster: Monster,
@@ -739,7 +920,7 @@ class MonsterService:
         Movement is rate-limited to prevent jittery behavior.
         """
         # Rate limit movement
-        move_interval = 2 + (hash(monster.id) % 2)  # 2-3 ticks between moves
+        move_interval = 2 + (monster.move_jitter % 2)  # 2-3 ticks between moves
         if current_tick - monster.last_move_tick < move_interval:
             return False
         
@@ -756,12 +937,8 @@ class MonsterService:
             return False
         
         # Use A* to find path to threat
-        astar = AStar(tiles, occupied_positions)
-        path = astar.find_path(
-            start=(monster.x, monster.y),
-            goal=(threat_x, threat_y),
-            max_iterations=200,
-        )
+        astar = self._pathfinder(tiles, occupied_positions)
+        path = self._follow_path(monster, astar, (threat_x, threat_y), max_iterations=200)
         
         if not path:
             return False
@@ -794,7 +971,7 @@ class MonsterService:
         a safer position while maintaining visibility/engagement.
         """
         # Rate limit movement
-        move_interval = 2 + (hash(monster.id) % 2)
+        move_interval = 2 + (monster.move_jitter % 2)
         if current_tick - monster.last_move_tick < move_interval:
             return False
         
@@ -806,7 +983,7 @@ class MonsterService:
         threat_x, threat_y = threat_pos
         
         # Use A* to find best flee position
-        astar = AStar(tiles, occupied_positions)
+        astar = self._pathfinder(tiles, occupied_positions)
         flee_pos = astar.find_flee_position(
             start=(monster.x, monster.y),
             threat=(threat_x, threat_y),
@@ -828,11 +1005,7 @@ class MonsterService:
             return False
         
         # Find path to flee position
-        path = astar.find_path(
-            start=(monster.x, monster.y),
-            goal=flee_pos,
-            max_iterations=100,
-        )
+        path = self._follow_path(monster, astar, flee_pos, max_iterations=100)
         
         if not path:
             return False
@@ -862,7 +1035,7 @@ class MonsterService:
         not just within their current room bounds.
         """
         # Rate limit movement (patrol is slower)
-        move_interval = 3 + (hash(monster.id) % 3)  # 3-5 ticks between moves
+        move_interval = 3 + (monster.move_jitter % 3)  # 3-5 ticks between moves
         if current_tick - monster.last_move_tick < move_interval:
             return False
         
@@ -882,12 +1055,8 @@ class MonsterService:
             return False
         
         # Use A* to find path to waypoint
-        astar = AStar(tiles, occupied_positions)
-        path = astar.find_path(
-            start=(monster.x, monster.y),
-            goal=current_waypoint,
-            max_iterations=150,
-        )
+        astar = self._pathfinder(tiles, occupied_positions)
+        path = self._follow_path(monster, astar, current_waypoint, max_iterations=150)
         
         if not path:
             # Can't reach waypoint, clear it and try again next tick
@@ -989,6 +1158,7 @@ class MonsterService:
 
     async def _handle_monster_death(self, event: GameEvent) -> None:
         self._ensure_initialized()
+        self.monster_paths.pop(event.source_id, None)
         
         snapshot = event.data.get("ai_snapshot") if isinstance(event.data, dict) else None
         if not snapshot:
@@ -111,22 +111,26 @@ class StorageService:
             print(f"[StorageService] Error deleting game {game_id}: {e}")
             return False
     
-    def list_game_saves(self) -> list[dict]:
+    async def list_game_saves(self) -> list[dict]:
         """List all per-game save files."""
-        saves = []
-        for save_file in self.games_path.glob("*.json"):
-            try:
-                with open(save_file, "r") as f:
-                    save_data = json.load(f)
-                saves.append({
-                    "game_id": save_file.stem,
-                    "file": str(save_file),
-                    "version": save_data.get("version"),
-                    "saved_at": save_data.get("saved_at"),
-                    "name": save_data.get("game_state", {}).get("name", "Unknown")
-                })
-            except Exception:
-                continue
+        def read_saves():
+            saves = []
+            for save_file in self.games_path.glob("*.json"):
+                try:
+                    with open(save_file, "r") as f:
+                        save_data = json.load(f)
+                    saves.append({
+                        "game_id": save_file.stem,
+                        "file": str(save_file),
+                        "version": save_data.get("version"),
+                        "saved_at": save_data.get("saved_at"),
+                        "name": save_data.get("game_state", {}).get("name", "Unknown")
+                    })
+                except Exception:
+                    continue
+            return saves
+        
+        saves = await asyncio.to_thread(read_saves)
         return sorted(saves, key=lambda x: x.get("saved_at", ""), reverse=True)
     
     # ============== Player Registry Methods ==============
@@ -258,34 +262,37 @@ class StorageService:
             print(f"[StorageService] Error loading game: {e}")
             return None
     
-    def list_saves(self) -> list[dict]:
+    async def list_saves(self) -> list[dict]:
         """
         List all available save files.
         
         Returns:
             List of save metadata dictionaries
         """
-        saves = []
-        
-        for save_file in self.save_path.glob("*.json"):
-            try:
-                with open(save_file, "r") as f:
-                    save_data = json.load(f)
-                
-                saves.append({
-                    "id": save_file.stem,
-                    "file": str(save_file),
-                    "version": save_data.get("version"),
-                    "saved_at": save_data.get("saved_at"),
-                    "save_reason": save_data.get("save_reason"),
-                    "map_width": save_data.get("game_state", {}).get("map", {}).get("width"),
-                    "map_height": save_data.get("game_state", {}).get("map", {}).get("height"),
-                    "room_count": len(save_data.get("game_state", {}).get("rooms", []))
-                })
-            except Exception as e:
-                print(f"[StorageService] Error reading save file {save_file}: {e}")
-                continue
+        def read_saves():
+            saves = []
+            
+            for save_file in self.save_path.glob("*.json"):
+                try:
+                    with open(save_file, "r") as f:
+                        save_data = json.load(f)
+                    
+                    saves.append({
+                        "id": save_file.stem,
+                        "file": str(save_file),
+                        "version": save_data.get("version"),
+                        "saved_at": save_data.get("saved_at"),
+                        "save_reason": save_data.get("save_reason"),
+                        "map_width": save_data.get("game_state", {}).get("map", {}).get("width"),
+                        "map_height": save_data.get("game_state", {}).get("map", {}).get("height"),
+                        "room_count": len(save_data.get("game_state", {}).get("rooms", []))
+                    })
+                except Exception as e:
+                    print(f"[StorageService] Error reading save file {save_file}: {e}")
+                    continue
+            return saves
         
+        saves = await asyncio.to_thread(read_saves)
         saves.sort(key=lambda x: x.get("saved_at", ""), reverse=True)
         return saves
     
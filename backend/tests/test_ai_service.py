@@ -2,7 +2,7 @@
 Tests for AI Service.
 
 Tests cover:
-- Singleton pattern
+- Shared module instance
 - Fallback content when AI is disabled
 - Game name generation
 - Player nickname generation
@@ -12,6 +12,8 @@ Tests cover:
 """
 import pytest
 import asyncio
+import json
+from collections import OrderedDict
 from unittest.mock import patch, MagicMock, AsyncMock
 
 from app.services.ai_service import (
@@ -19,7 +21,10 @@ from app.services.ai_service import (
     FALLBACK_GAME_NAMES,
     FALLBACK_NICKNAMES,
     FALLBACK_DESCRIPTIONS,
-    MONSTER_NICKNAME_TEMPLATES
+    MONSTER_NICKNAME_TEMPLATES,
+    _FURNITURE_LABELS,
+    _ROOM_SIZE_LABELS,
+    _bucket_label,
 )
 
 
@@ -33,7 +38,7 @@ def disabled_ai_service():
     service = object.__new__(AIService)
     service._client = None
     service._enabled = False
-    service._initialized = True
+    service._description_cache = OrderedDict()
     return service
 
 
@@ -48,18 +53,36 @@ def mock_ai_response():
 
 
 # ============================================================================
-# SINGLETON TESTS
+# MODULE INSTANCE TESTS
 # ============================================================================
 
-class TestAIServiceSingleton:
-    """Tests for singleton behavior."""
+class TestAIServiceInstance:
+    """Tests for the shared module-level instance."""
     
-    def test_ai_service_is_singleton(self):
-        """Multiple AIService() calls should return same instance."""
-        service1 = AIService()
-        service2 = AIService()
+    def test_module_instance_is_shared(self):
+        """The package re-exports the single module-level instance."""
+        from app.services import ai_service as exported
+        from app.services.ai_service import ai_service
         
-        assert service1 is service2
+        assert isinstance(ai_service, AIService)
+        assert exported is ai_service
+
+    @pytest.mark.asyncio
+    async def test_close_releases_client(self):
+        """close() should close the OpenAI client's connection pool."""
+        service = object.__new__(AIService)
+        service._client = MagicMock()
+        service._client.close = AsyncMock()
+        service._enabled = True
+        
+        await service.close()
+        
+        service._client.close.assert_awaited_once()
+    
+    @pytest.mark.asyncio
+    async def test_close_without_client(self, disabled_ai_service):
+        """close() is a no-op when AI is disabled."""
+        await disabled_ai_service.close()
 
 
 # ============================================================================
@@ -109,6 +132,17 @@ class TestFallbackGameName:
         
         # With 50 fallback names and 20 trials, very likely to get at least 5 unique
         assert len(names) > 1
+    
+    @pytest.mark.asyncio
+    async def test_fallback_names_do_not_repeat_until_exhausted(self, disabled_ai_service):
+        """Every fallback name is dealt once before any name repeats."""
+        from app.services.ai_service import _game_name_deck
+        _game_name_deck.clear()
+        
+        names = [await disabled_ai_service.generate_game_name() for _ in FALLBACK_GAME_NAMES]
+        
+        assert sorted(names) == sorted(FALLBACK_GAME_NAMES)
+        assert await disabled_ai_service.generate_game_name() in FALLBACK_GAME_NAMES
 
 
 # ============================================================================
@@ -252,70 +286,216 @@ class TestAIEnabledGeneration:
         """Create an AI service with mocked client."""
         service = object.__new__(AIService)
         service._client = MagicMock()
-        service._client.chat.completions.create = MagicMock(return_value=mock_ai_response)
+        service._client.chat.completions.create = AsyncMock(return_value=mock_ai_response)
         service._enabled = True
-        service._initialized = True
+        service._description_cache = OrderedDict()
+        service._room_semaphore = asyncio.Semaphore(5)
         return service
     
     @pytest.mark.asyncio
     async def test_game_name_uses_ai_when_enabled(self, enabled_ai_service):
         """When AI enabled, should call OpenAI API."""
-        with patch('asyncio.to_thread', new_callable=AsyncMock) as mock_thread:
-            mock_response = MagicMock()
-            mock_response.choices = [MagicMock(message=MagicMock(content="The Dark Depths"))]
-            mock_thread.return_value = mock_response
-            
-            name = await enabled_ai_service.generate_game_name()
-            
-            mock_thread.assert_called_once()
-            assert name == "The Dark Depths"
+        mock_create = enabled_ai_service._client.chat.completions.create
+        mock_response = MagicMock()
+        mock_response.choices = [MagicMock(message=MagicMock(content="The Dark Depths"))]
+        mock_create.return_value = mock_response
+        
+        name = await enabled_ai_service.generate_game_name()
+        
+        mock_create.assert_awaited_once()
+        assert name == "The Dark Depths"
     
     @pytest.mark.asyncio
     async def test_nickname_uses_ai_when_enabled(self, enabled_ai_service):
         """When AI enabled, should call OpenAI for nickname."""
-        with patch('asyncio.to_thread', new_callable=AsyncMock) as mock_thread:
-            mock_response = MagicMock()
-            mock_response.choices = [MagicMock(message=MagicMock(content="The Brave Hunter"))]
-            mock_thread.return_value = mock_response
-            
-            kills = {"goblin": 5}
-            nickname = await enabled_ai_service.generate_player_nickname(kills, 5)
-            
-            mock_thread.assert_called_once()
-            assert nickname == "The Brave Hunter"
+        mock_create = enabled_ai_service._client.chat.completions.create
+        mock_response = MagicMock()
+        mock_response.choices = [MagicMock(message=MagicMock(content="The Brave Hunter"))]
+        mock_create.return_value = mock_response
+        
+        kills = {"goblin": 5}
+        nickname = await enabled_ai_service.generate_player_nickname(kills, 5)
+        
+        mock_create.assert_awaited_once()
+        assert nickname == "The Brave Hunter"
     
     @pytest.mark.asyncio
     async def test_nickname_adds_the_prefix(self, enabled_ai_service):
         """Nickname should start with 'The' even if AI omits it."""
-        with patch('asyncio.to_thread', new_callable=AsyncMock) as mock_thread:
-            mock_response = MagicMock()
-            mock_response.choices = [MagicMock(message=MagicMock(content="Brave Hunter"))]
-            mock_thread.return_value = mock_response
-            
-            nickname = await enabled_ai_service.generate_player_nickname({"orc": 3}, 3)
-            
-            assert nickname.startswith("The ")
+        mock_create = enabled_ai_service._client.chat.completions.create
+        mock_response = MagicMock()
+        mock_response.choices = [MagicMock(message=MagicMock(content="Brave Hunter"))]
+        mock_create.return_value = mock_response
+        
+        nickname = await enabled_ai_service.generate_player_nickname({"orc": 3}, 3)
+        
+        assert nickname.startswith("The ")
+    
+    @pytest.mark.asyncio
+    async def test_nickname_prompt_lists_top_kills(self, enabled_ai_service):
+        """The prompt should summarize the five most-killed types, most first."""
+        kills = {"rat_swarm": 1, "goblin": 9, "orc": 4, "slime": 2, "ghost": 7, "kobold": 3, "mimic": 1}
+        
+        await enabled_ai_service.generate_player_nickname(kills, sum(kills.values()))
+        
+        prompt = enabled_ai_service._client.chat.completions.create.call_args[1]["messages"][1]["content"]
+        assert "9 goblins, 7 ghosts, 4 orcs, 3 kobolds, 2 slimes" in prompt
+        assert "rat_swarm" not in prompt
     
     @pytest.mark.asyncio
     async def test_room_description_uses_ai_when_enabled(self, enabled_ai_service):
         """When AI enabled, should call OpenAI for room description."""
-        with patch('asyncio.to_thread', new_callable=AsyncMock) as mock_thread:
-            mock_response = MagicMock()
-            mock_response.choices = [MagicMock(message=MagicMock(
-                content="You enter a magnificent library filled with ancient tomes."
-            ))]
-            mock_thread.return_value = mock_response
-            
-            description = await enabled_ai_service.generate_room_description(
-                room_type="library",
-                room_name="Grand Library",
-                room_width=15,
-                room_height=12,
-                furniture_count=4
-            )
-            
-            mock_thread.assert_called_once()
-            assert "library" in description.lower()
+        mock_create = enabled_ai_service._client.chat.completions.create
+        mock_response = MagicMock()
+        mock_response.choices = [MagicMock(message=MagicMock(
+            content="You enter a magnificent library filled with ancient tomes."
+        ))]
+        mock_create.return_value = mock_response
+        
+        description = await enabled_ai_service.generate_room_description(
+            room_type="library",
+            room_name="Grand Library",
+            room_width=15,
+            room_height=12,
+            furniture_count=4
+        )
+        
+        mock_create.assert_awaited_once()
+        assert "library" in description.lower()
+    
+    @pytest.mark.asyncio
+    async def test_identical_room_prompts_share_one_request(self, enabled_ai_service):
+        """Same type, name and size/furniture labels reuse one description."""
+        mock_create = enabled_ai_service._client.chat.completions.create
+        
+        first, second = await asyncio.gather(
+            enabled_ai_service.generate_room_description("crypt", "Ancient Crypt", 6, 6, 1),
+            enabled_ai_service.generate_room_description("crypt", "Ancient Crypt", 5, 7, 2),
+        )
+        third = await enabled_ai_service.generate_room_description("crypt", "Ancient Crypt", 6, 5, 0)
+        
+        mock_create.assert_awaited_once()
+        assert first == second == third == "AI Generated Content"
+    
+    @pytest.mark.asyncio
+    async def test_different_room_prompts_are_not_shared(self, enabled_ai_service):
+        """A different name or size label needs its own request."""
+        mock_create = enabled_ai_service._client.chat.completions.create
+        
+        await enabled_ai_service.generate_room_description("crypt", "Ancient Crypt", 6, 6, 1)
+        await enabled_ai_service.generate_room_description("crypt", "Dark Crypt", 6, 6, 1)
+        await enabled_ai_service.generate_room_description("crypt", "Ancient Crypt", 10, 10, 1)
+        
+        assert mock_create.await_count == 3
+    
+    @pytest.mark.asyncio
+    async def test_room_requests_are_bounded(self, enabled_ai_service, mock_ai_response):
+        """At most _ROOM_CONCURRENCY single-room requests run at once."""
+        in_flight = peak = 0
+        
+        async def create(**kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return mock_ai_response
+        
+        enabled_ai_service._client.chat.completions.create.side_effect = create
+        await asyncio.gather(*(
+            enabled_ai_service.generate_room_description("crypt", f"Crypt {i}", 6, 6, 1)
+            for i in range(12)
+        ))
+        
+        assert peak == 5
+
+
+def _chat_response(content: str) -> MagicMock:
+    """Mock chat completion response with the given message content."""
+    response = MagicMock()
+    response.choices = [MagicMock(message=MagicMock(content=content))]
+    return response
+
+
+class TestBatchedAIRoomDescriptions:
+    """Tests for batched room descriptions when AI is enabled."""
+
+    @pytest.fixture
+    def rooms(self):
+        return [
+            {"id": f"r{i}", "room_type": "library", "name": f"Room {i}", "width": 8, "height": 8}
+            for i in range(10)
+        ]
+
+    @pytest.fixture
+    def batch_ai_service(self):
+        """AI service whose client answers each batch with JSON descriptions."""
+        service = object.__new__(AIService)
+        service._client = MagicMock()
+        service._enabled = True
+        service._description_cache = OrderedDict()
+        service._room_semaphore = asyncio.Semaphore(5)
+
+        async def create(**kwargs):
+            if "response_format" not in kwargs:
+                return _chat_response("A single room.")
+            listing = kwargs["messages"][1]["content"].split("Rooms: ", 1)[1]
+            return _chat_response(json.dumps({"descriptions": [
+                {"index": room["index"], "description": f"You see {room['name']}."}
+                for room in json.loads(listing)
+            ]}))
+
+        service._client.chat.completions.create = AsyncMock(side_effect=create)
+        return service
+
+    @pytest.mark.asyncio
+    async def test_rooms_are_described_in_batches(self, batch_ai_service, rooms):
+        """Ten rooms need two requests with a batch size of eight."""
+        results = await batch_ai_service.generate_room_descriptions(rooms)
+
+        assert batch_ai_service._client.chat.completions.create.await_count == 2
+        assert [room["description"] for room in results] == [
+            f"You see Room {i}." for i in range(10)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_missing_rooms_fall_back_to_single_requests(self, batch_ai_service, rooms):
+        """Rooms left out of a batch reply get their own request."""
+        create = batch_ai_service._client.chat.completions.create
+        batch_reply = json.dumps({"descriptions": [{"index": 0, "description": "Only one."}]})
+        create.side_effect = [_chat_response(batch_reply)] + [_chat_response("A single room.")] * 2
+
+        results = await batch_ai_service.generate_room_descriptions(rooms[:3])
+
+        assert create.await_count == 3
+        assert [room["description"] for room in results] == [
+            "Only one.", "A single room.", "A single room."
+        ]
+
+    @pytest.mark.asyncio
+    async def test_unparseable_batch_falls_back(self, batch_ai_service, rooms):
+        """A batch reply that is not JSON is retried room by room."""
+        create = batch_ai_service._client.chat.completions.create
+        create.side_effect = [_chat_response("not json")] + [_chat_response("A single room.")] * 2
+
+        results = await batch_ai_service.generate_room_descriptions(rooms[:2])
+
+        assert all(room["description"] == "A single room." for room in results)
+
+    @pytest.mark.asyncio
+    async def test_repeated_prompts_are_sent_once(self, batch_ai_service, rooms):
+        """Rooms sharing a prompt, or already described, skip the API."""
+        create = batch_ai_service._client.chat.completions.create
+        for room in rooms:
+            room["name"] = "Room 0" if room["id"] in ("r0", "r1", "r2") else room["name"]
+
+        await batch_ai_service.generate_room_descriptions(rooms[:4])
+        listing = create.call_args[1]["messages"][1]["content"].split("Rooms: ", 1)[1]
+        assert len(json.loads(listing)) == 2
+
+        results = await batch_ai_service.generate_room_descriptions(rooms[:4])
+        assert create.await_count == 1
+        assert [room["description"] for room in results] == ["You see Room 0."] * 3 + ["You see Room 3."]
 
 
 # ============================================================================
@@ -330,48 +510,60 @@ class TestAIServiceErrorHandling:
         """Create an AI service that fails on API calls."""
         service = object.__new__(AIService)
         service._client = MagicMock()
-        service._client.chat.completions.create = MagicMock(side_effect=Exception("API Error"))
+        service._client.chat.completions.create = AsyncMock(side_effect=Exception("API Error"))
         service._enabled = True
-        service._initialized = True
+        service._description_cache = OrderedDict()
+        service._room_semaphore = asyncio.Semaphore(5)
         return service
     
     @pytest.mark.asyncio
     async def test_game_name_falls_back_on_error(self, failing_ai_service):
         """Should fall back to default names on API error."""
-        with patch('asyncio.to_thread', new_callable=AsyncMock) as mock_thread:
-            mock_thread.side_effect = Exception("API Error")
-            
-            name = await failing_ai_service.generate_game_name()
-            
-            assert name in FALLBACK_GAME_NAMES
+        mock_create = failing_ai_service._client.chat.completions.create
+        
+        name = await failing_ai_service.generate_game_name()
+        
+        mock_create.assert_awaited_once()
+        assert name in FALLBACK_GAME_NAMES
     
     @pytest.mark.asyncio
     async def test_nickname_falls_back_on_error(self, failing_ai_service):
         """Should fall back to default nicknames on API error."""
-        with patch('asyncio.to_thread', new_callable=AsyncMock) as mock_thread:
-            mock_thread.side_effect = Exception("API Error")
-            
-            kills = {"goblin": 10}
-            nickname = await failing_ai_service.generate_player_nickname(kills, 10)
-            
-            # Should use goblin template
-            assert nickname in MONSTER_NICKNAME_TEMPLATES["goblin"]
+        mock_create = failing_ai_service._client.chat.completions.create
+        
+        kills = {"goblin": 10}
+        nickname = await failing_ai_service.generate_player_nickname(kills, 10)
+        
+        mock_create.assert_awaited_once()
+        # Should use goblin template
+        assert nickname in MONSTER_NICKNAME_TEMPLATES["goblin"]
     
     @pytest.mark.asyncio
     async def test_description_falls_back_on_error(self, failing_ai_service):
         """Should fall back to default descriptions on API error."""
-        with patch('asyncio.to_thread', new_callable=AsyncMock) as mock_thread:
-            mock_thread.side_effect = Exception("API Error")
-            
-            description = await failing_ai_service.generate_room_description(
-                room_type="armory",
-                room_name="Weapons Room",
-                room_width=10,
-                room_height=10,
-                furniture_count=3
-            )
-            
-            assert description in FALLBACK_DESCRIPTIONS["armory"]
+        mock_create = failing_ai_service._client.chat.completions.create
+        
+        description = await failing_ai_service.generate_room_description(
+            room_type="armory",
+            room_name="Weapons Room",
+            room_width=10,
+            room_height=10,
+            furniture_count=3
+        )
+        
+        mock_create.assert_awaited_once()
+        assert description in FALLBACK_DESCRIPTIONS["armory"]
+    
+    @pytest.mark.asyncio
+    async def test_failed_descriptions_are_not_cached(self, failing_ai_service):
+        """A failed request is retried on the next call."""
+        mock_create = failing_ai_service._client.chat.completions.create
+        
+        for _ in range(2):
+            await failing_ai_service.generate_room_description("armory", "Weapons Room", 10, 10, 3)
+        
+        assert mock_create.await_count == 2
+        assert not failing_ai_service._description_cache
 
 
 # ============================================================================
@@ -406,3 +598,26 @@ class TestFallbackContentQuality:
             assert len(descriptions) > 0, f"No descriptions for {room_type}"
             for desc in descriptions:
                 assert len(desc) > 50, f"Description too short for {room_type}"
+
+
+# ============================================================================
+# PROMPT HELPER TESTS
+# ============================================================================
+
+class TestPromptLabels:
+    """Tests for the size/furniture labels used in room prompts."""
+
+    @pytest.mark.parametrize("area,label", [
+        (16, "small"), (39, "small"), (40, "modest-sized"),
+        (80, "modest-sized"), (81, "spacious"), (400, "spacious"),
+    ])
+    def test_room_size_labels(self, area, label):
+        """Area thresholds match the original prompt wording."""
+        assert _bucket_label(area, _ROOM_SIZE_LABELS) == label
+
+    @pytest.mark.parametrize("count,label", [
+        (0, "sparse"), (2, "sparse"), (3, "moderate"), (4, "moderate"), (5, "rich"),
+    ])
+    def test_furniture_labels(self, count, label):
+        """Furniture thresholds match the original prompt wording."""
+        assert _bucket_label(count, _FURNITURE_LABELS) == label
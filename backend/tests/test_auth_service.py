@@ -0,0 +1,255 @@
+"""
+Unit tests for the authentication service.
+
+Run with: pytest backend/tests/test_auth_service.py
+"""
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from app.config.settings import settings
+from app.domain.entities.user import User
+from app.services.auth_service import AuthService
+
+
+@pytest.fixture
+def mock_db():
+    """Mock MongoDB manager with a connected users collection."""
+    db = MagicMock()
+    db.is_connected = True
+    db.get_collection.return_value = MagicMock()
+    return db
+
+
+@pytest.fixture
+def service(mock_db):
+    """AuthService wired to the mock database."""
+    service = AuthService()
+    service.db = mock_db
+    return service
+
+
+@pytest.mark.asyncio
+async def test_hash_and_verify_password():
+    """Hashing runs off the event loop and verifies against the original."""
+    password_hash = await AuthService.hash_password("correct horse")
+
+    assert password_hash != "correct horse"
+    assert await AuthService.verify_password("correct horse", password_hash) is True
+    assert await AuthService.verify_password("wrong", password_hash) is False
+
+
+@pytest.mark.asyncio
+async def test_create_user_stores_hash(service, mock_db):
+    """create_user should insert a hashed password, never the plain one."""
+    collection = mock_db.get_collection.return_value
+    collection.find_one = AsyncMock(return_value=None)
+    collection.insert_one = AsyncMock()
+
+    user = await service.create_user("Hero@Example.com", "s3cret")
+
+    stored = collection.insert_one.call_args[0][0]
+    assert stored["password_hash"] == user.password_hash
+    assert stored["password_hash"] != "s3cret"
+    assert await AuthService.verify_password("s3cret", user.password_hash)
+
+
+@pytest.mark.asyncio
+async def test_authenticate_user(service, mock_db):
+    """authenticate_user accepts the right password and rejects others."""
+    password_hash = await AuthService.hash_password("s3cret")
+    user = User.create(email="hero@example.com", password_hash=password_hash)
+    collection = mock_db.get_collection.return_value
+    collection.find_one = AsyncMock(return_value=user.to_dict())
+
+    assert (await service.authenticate_user("hero@example.com", "s3cret")).user_id == user.user_id
+    assert await service.authenticate_user("hero@example.com", "nope") is None
+
+
+@pytest.mark.asyncio
+async def test_user_lookups_use_projection(service, mock_db):
+    """Lookups normalize the email and fetch only User fields."""
+    user = User.create(email="hero@example.com", password_hash="hash")
+    collection = mock_db.get_collection.return_value
+    collection.find_one = AsyncMock(return_value=user.to_dict())
+
+    found = await service.get_user_by_email("  Hero@Example.COM ")
+    query, = collection.find_one.call_args[0]
+    projection = collection.find_one.call_args[1]["projection"]
+
+    assert found.user_id == user.user_id
+    assert query == {"email": "hero@example.com"}
+    assert projection["_id"] == 0
+    assert set(projection) - {"_id"} == set(user.to_dict())
+
+    service.invalidate_user(user.user_id)
+    await service.get_user_by_id(user.user_id)
+    assert collection.find_one.await_count == 2
+    assert collection.find_one.call_args[1]["projection"] == projection
+
+
+@pytest.mark.asyncio
+async def test_user_lookups_are_cached(service, mock_db):
+    """A fetched user is served from cache under both id and email."""
+    user = User.create(email="hero@example.com", password_hash="hash")
+    collection = mock_db.get_collection.return_value
+    collection.find_one = AsyncMock(return_value=user.to_dict())
+
+    first = await service.get_user_by_id(user.user_id)
+    second = await service.get_user_by_id(user.user_id)
+    by_email = await service.get_user_by_email("HERO@example.com")
+
+    assert collection.find_one.await_count == 1
+    assert first.user_id == second.user_id == by_email.user_id
+    assert first is not second
+
+
+@pytest.mark.asyncio
+async def test_update_last_login_invalidates_cache(service, mock_db):
+    """Writes to a user drop it from the cache."""
+    user = User.create(email="hero@example.com", password_hash="hash")
+    collection = mock_db.get_collection.return_value
+    collection.find_one = AsyncMock(return_value=user.to_dict())
+    collection.update_one = AsyncMock()
+
+    await service.get_user_by_id(user.user_id)
+    await service.update_last_login(user.user_id)
+    await service.get_user_by_email(user.email)
+
+    assert collection.find_one.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_missing_users_are_not_cached(service, mock_db):
+    """Misses always go to the database so new signups are visible."""
+    collection = mock_db.get_collection.return_value
+    collection.find_one = AsyncMock(return_value=None)
+
+    assert await service.get_user_by_email("new@example.com") is None
+    assert await service.get_user_by_email("new@example.com") is None
+    assert collection.find_one.await_count == 2
+
+
+def test_ttl_cache_expiry_and_eviction(monkeypatch):
+    """Entries expire after ttl and the least recently used is evicted."""
+    from app.services import auth_service as module
+
+    now = [100.0]
+    monkeypatch.setattr(module.time, "monotonic", lambda: now[0])
+    cache = module._TTLCache(maxsize=2, ttl=10)
+
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    assert cache.get("b") is None  # evicted, "a" was used more recently
+
+    now[0] += 10
+    assert cache.get("a") is None
+    assert cache.get("c") is None
+
+
+def test_decode_token_roundtrip():
+    """A freshly issued token decodes to its claims."""
+    token = AuthService.create_access_token("user-1", "hero@example.com", "user")
+    payload = AuthService.decode_token(token)
+
+    assert payload["sub"] == "user-1"
+    assert payload["role"] == "user"
+
+
+def test_decode_token_is_cached(monkeypatch):
+    """Repeated decodes of one token skip JWT verification."""
+    from app.services import auth_service as module
+
+    token = AuthService.create_access_token("user-2", "hero@example.com", "user")
+    AuthService.decode_token(token)
+    monkeypatch.setattr(module.jwt, "decode", MagicMock(side_effect=AssertionError))
+
+    assert AuthService.decode_token(token)["sub"] == "user-2"
+
+
+def test_decode_token_rejects_expired_cached_token(monkeypatch):
+    """A cached payload is not returned once its exp has passed."""
+    from fastapi import HTTPException
+    from app.services import auth_service as module
+
+    token = AuthService.create_access_token("user-3", "hero@example.com", "user")
+    exp = AuthService.decode_token(token)["exp"]
+    monkeypatch.setattr(module.time, "time", lambda: exp + 1)
+    # PyJWT checks exp against its own clock; simulate it rejecting the token
+    monkeypatch.setattr(module.jwt, "decode", MagicMock(side_effect=module.jwt.ExpiredSignatureError("expired")))
+
+    with pytest.raises(HTTPException):
+        AuthService.decode_token(token)
+
+
+def test_decode_token_rejects_invalid_token():
+    """Tampered tokens raise 401."""
+    from fastapi import HTTPException
+
+    token = AuthService.create_access_token("user-4", "hero@example.com", "user")
+    with pytest.raises(HTTPException) as exc_info:
+        AuthService.decode_token(token[:-2] + "xx")
+    assert exc_info.value.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_verify_password_accepts_existing_hashes():
+    """Hashes written by the previous passlib setup still verify."""
+    # passlib CryptContext(["bcrypt"]) output for "s3cret" (cost 12, $2b$)
+    legacy_hash = "$2b$12$jA8IrJF8qs1GVLl5VUbmF.A.SsR9JHDniQEu4APSt6.65f/9r9hpy"
+
+    assert await AuthService.verify_password("s3cret", legacy_hash)
+    assert not await AuthService.verify_password("s3cret!", legacy_hash)
+
+
+@pytest.mark.asyncio
+async def test_hash_password_uses_configured_rounds(monkeypatch):
+    """New hashes use the bcrypt cost from settings."""
+    from app.services import auth_service as module
+
+    monkeypatch.setattr(module.settings.auth, "bcrypt_rounds", 4)
+    password_hash = await AuthService.hash_password("s3cret")
+
+    assert password_hash.startswith("$2b$04$")
+    assert await AuthService.verify_password("s3cret", password_hash)
+
+
+@pytest.mark.asyncio
+async def test_update_last_login_uses_server_clock(service, mock_db):
+    """Last login is stamped by MongoDB, not formatted client-side."""
+    collection = mock_db.get_collection.return_value
+    collection.update_one = AsyncMock()
+
+    await service.update_last_login("user-1")
+
+    query, update = collection.update_one.call_args[0]
+    assert query == {"user_id": "user-1"}
+    assert update == {"$currentDate": {"last_login": True}}
+
+
+def test_user_from_dict_accepts_bson_last_login():
+    """BSON dates read back from MongoDB become ISO strings."""
+    from datetime import datetime
+
+    user = User.create(email="hero@example.com", password_hash="hash")
+    data = {**user.to_dict(), "last_login": datetime(2024, 5, 1, 12, 30, 0, 123000)}
+
+    assert User.from_dict(data).last_login == "2024-05-01T12:30:00.123000"
+    assert User.from_dict(user.to_dict()).last_login is None
+
+
+def test_auth_cookies_share_options():
+    """Both token cookies are httpOnly, lax, and live as long as the JWT."""
+    from fastapi import Response
+
+    response = Response()
+    AuthService.set_auth_cookie(response, "jwt")
+    AuthService.set_player_token_cookie(response, "player")
+
+    cookies = [value for name, value in response.raw_headers if name == b"set-cookie"]
+    max_age = f"Max-Age={settings.auth.jwt_expire_days * 86400}".encode()
+    assert [cookie.split(b"=", 1)[0] for cookie in cookies] == [b"access_token", b"player_token"]
+    for cookie in cookies:
+        assert b"HttpOnly" in cookie and b"SameSite=lax" in cookie
+        assert b"Path=/" in cookie and max_age in cookie
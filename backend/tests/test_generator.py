@@ -0,0 +1,96 @@
+"""
+Tests for the procedural dungeon generator.
+
+Tests cover:
+- Deterministic generation from a seed
+- Map structure (dimensions, walls around floors, room counts)
+- Room reachability
+"""
+import pytest
+from app.domain.map import (
+    DungeonGenerator, generate_dungeon,
+    TILE_FLOOR, TILE_WALL, TILE_VOID,
+)
+
+
+@pytest.fixture
+def generated_map():
+    """A medium-sized map generated from a fixed seed."""
+    return generate_dungeon(width=120, height=100, room_count=20, seed=1234)
+
+
+class TestGeneratorDeterminism:
+    """Tests for seed-based reproducibility."""
+
+    def test_same_seed_same_map(self):
+        """Two generators with the same seed should produce identical maps."""
+        first = generate_dungeon(width=120, height=100, room_count=20, seed=42)
+        second = generate_dungeon(width=120, height=100, room_count=20, seed=42)
+
+        assert first.to_dict() == second.to_dict()
+
+    def test_seed_is_recorded(self, generated_map):
+        """Generated map should record the seed used."""
+        assert generated_map.seed == 1234
+
+
+class TestGeneratorStructure:
+    """Tests for the layout of generated maps."""
+
+    def test_dimensions(self, generated_map):
+        """Tiles should match the requested dimensions as plain lists."""
+        assert generated_map.width == 120
+        assert generated_map.height == 100
+        assert len(generated_map.tiles) == 100
+        assert all(len(row) == 120 for row in generated_map.tiles)
+        assert isinstance(generated_map.tiles[0][0], int)
+
+    def test_floor_never_touches_void(self, generated_map):
+        """Every floor tile should be surrounded by non-void tiles."""
+        tiles = generated_map.tiles
+        for y, row in enumerate(tiles):
+            for x, tile in enumerate(row):
+                if tile != TILE_FLOOR:
+                    continue
+                for dy in (-1, 0, 1):
+                    for dx in (-1, 0, 1):
+                        assert tiles[y + dy][x + dx] != TILE_VOID
+
+    def test_rooms_are_floor(self, generated_map):
+        """Room centers should be floor tiles."""
+        assert generated_map.rooms
+        for room in generated_map.rooms:
+            assert generated_map.get_tile(room.center_x, room.center_y) == TILE_FLOOR
+
+    def test_spawn_in_first_room(self, generated_map):
+        """Spawn point should be the center of the first room."""
+        first = generated_map.rooms[0]
+        assert (generated_map.spawn_x, generated_map.spawn_y) == first.center
+
+    @pytest.mark.parametrize("width,height,room_count,min_rooms", [
+        (80, 50, 10, 2),
+        (120, 80, 15, 7),
+        (150, 100, 20, 13),
+        (200, 200, 30, 30),
+    ])
+    def test_minimum_room_count(self, width, height, room_count, min_rooms):
+        """Room placement should fit as many rooms as rejection sampling did."""
+        for seed in range(10):
+            generated = generate_dungeon(
+                width=width, height=height, room_count=room_count, seed=seed
+            )
+            assert len(generated.rooms) >= min_rooms
+
+
+class TestGeneratorConnectivity:
+    """Tests for room reachability."""
+
+    @pytest.mark.parametrize("seed", range(10))
+    def test_all_rooms_reachable(self, seed):
+        """Every room center should be reachable from the spawn room."""
+        generator = DungeonGenerator(width=150, height=120, room_count=25, seed=seed)
+        generator.generate()
+
+        reachable = generator._flood_fill(*generator.rooms[0].center)
+        for room in generator.rooms:
+            assert reachable[room.center_y, room.center_x]
@@ -114,6 +114,24 @@ class TestStateEncoder:
         )
         assert multi[3] == 1  # defaults to 'safe' category
 
+    def test_encode_batch_matches_encode(self, encoder):
+        """Batch encoding should agree with encode() row by row."""
+        observations = [
+            dict(hp_ratio=hp, enemy_count=enemies, ally_count=allies, room_type=room,
+                 distance_to_threat=distance, threat_direction=direction, in_corridor=corridor)
+            for hp in (0.0, 0.33, 0.5, 0.66, 1.0)
+            for enemies, allies in ((0, 0), (1, 3), (5, 2))
+            for room in ("armory", "library", "crypt", "unknown_room")
+            for distance, direction in ((0, 0), (4, 8), (5, 12), (999, 3))
+            for corridor in (False, True)
+        ]
+        flat, multi = encoder.encode_batch(
+            **{name: [obs[name] for obs in observations] for name in observations[0]}
+        )
+
+        for obs, index, row in zip(observations, flat.tolist(), multi.tolist()):
+            assert (index, tuple(row)) == encoder.encode(**obs)
+
 
 # ---------- QLearningAgent Tests ----------
 
@@ -130,6 +148,45 @@ class TestQLearningAgent:
         action = agent.select_action(table, state_idx)
         assert action == AIAction.FLEE
 
+    def test_select_actions_matches_select_action(self, agent, sample_personality):
+        """Greedy batch selection should match per-state selection."""
+        table = agent.init_table()
+        rng = np.random.default_rng(3)
+        table[:50] = rng.normal(size=(50, table.shape[1]))
+        table[10:20] *= 0.01  # below the "learned" threshold
+        states = np.arange(60)
+
+        for personality in (None, sample_personality):
+            actions = agent.select_actions(table, states, personality=personality)
+            expected = [agent.select_action(table, s, personality=personality).value for s in states]
+            assert actions.tolist() == expected
+
+    def test_select_actions_explores(self, encoder):
+        """With full exploration, batch actions are random but valid."""
+        ag = QLearningAgent(QLearningConfig(exploration_rate=1.0), encoder)
+        table = ag.init_table()
+        table[:, AIAction.FLEE.value] = 100.0
+
+        actions = ag.select_actions(table, np.zeros(200, dtype=np.intp))
+        assert set(actions.tolist()) - {AIAction.FLEE.value}
+        assert all(0 <= a < len(AIAction) for a in actions.tolist())
+
+    def test_select_actions_seeded_matches_select_action(self, encoder, sample_personality):
+        """With exploration on, a seeded batch matches seeded per-state calls."""
+        import random
+
+        ag = QLearningAgent(QLearningConfig(exploration_rate=0.5), encoder)
+        table = ag.init_table()
+        table[:40] = np.random.default_rng(7).normal(size=(40, table.shape[1]))
+        states = np.arange(40)
+
+        random.seed(1234)
+        actions = ag.select_actions(table, states, personality=sample_personality)
+        random.seed(1234)
+        expected = [ag.select_action(table, s, personality=sample_personality).value for s in states]
+
+        assert actions.tolist() == expected
+
     def test_update_increases_q(self, agent, encoder):
         table = agent.init_table()
         state_idx = 0
@@ -206,6 +263,30 @@ class TestDecisionEngine:
         assert isinstance(result.action, AIAction)
         assert 0 <= result.state_index < encoder.state_space
 
+    def test_decide_batch_matches_decide(self, sample_monster, sample_personality, sample_memory, encoder, q_config):
+        engine = DecisionEngine(config=q_config, encoder=encoder)
+        q_table = engine.agent.init_table()
+        q_table[:] = np.random.default_rng(5).normal(size=q_table.shape)
+        contexts = [
+            DecisionContext(
+                monster=sample_monster,
+                memory=sample_memory,
+                personality=sample_personality,
+                q_table=q_table,
+                current_tick=100,
+                world_state={"nearby_enemies": enemies, "nearby_allies": 1, "room_type": room,
+                             "distance_to_threat": distance, "threat_direction": 2},
+            )
+            for enemies in (0, 1, 3)
+            for room in ("armory", "crypt")
+            for distance in (1, 3, 8)
+        ]
+
+        results = engine.decide_batch(contexts)
+
+        assert engine.decide_batch([]) == []
+        assert results == [engine.decide(context) for context in contexts]
+
     def test_learn_updates_table(self, encoder, q_config):
         engine = DecisionEngine(config=q_config, encoder=encoder)
         q_table = engine.agent.init_table()
@@ -235,3 +316,15 @@ class TestSpeciesKnowledgeStore:
         rec.q_table[0, 0] = 100.0
         store.reset_species("orc", state_space=encoder.state_space, action_count=len(AIAction))
         assert store.records["orc"].q_table[0, 0] == 0.0
+
+    @pytest.mark.asyncio
+    async def test_get_history_async(self, tmp_path, encoder):
+        store = SpeciesKnowledgeStore(tmp_path / "knowledge.json")
+        store.get_or_create("rat", state_space=encoder.state_space, action_count=len(AIAction))
+        for reward in (1.0, 2.0):
+            store.record_learning_event(
+                "rat", reward=reward, state_index=0, action="ATTACK", q_value_before=0.0, q_value_after=0.1
+            )
+        history = await store.get_history_async("rat", limit=1)
+        assert [h.reward for h in history] == [2.0]
+        assert await store.get_history_async("unknown") == []
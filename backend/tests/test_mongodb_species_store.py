@@ -3,13 +3,17 @@ Unit tests for MongoDB species knowledge store.
 
 Run with: pytest backend/tests/test_mongodb_species_store.py
 """
+import asyncio
+
 import pytest
 import numpy as np
 from unittest.mock import AsyncMock, MagicMock, patch
+import zstandard
 from bson import Binary
 
 from app.services.mongodb_species_store import MongoDBSpeciesKnowledgeStore
 from app.domain.intelligence.generations import SpeciesKnowledgeRecord
+from app.domain.intelligence.learning import SCHEMA_VERSION
 
 
 @pytest.fixture
@@ -21,6 +25,12 @@ def mock_mongodb():
         yield mock_db
 
 
+def _mock_history_events(mock_db, docs):
+    """Make the species_history_events query return docs."""
+    query = mock_db.species_history_events.find.return_value.sort.return_value.limit.return_value
+    query.to_list = AsyncMock(return_value=docs)
+
+
 @pytest.fixture
 def sample_q_table():
     """Sample Q-table for testing."""
@@ -42,10 +52,94 @@ async def test_async_save(mock_mongodb, sample_q_table):
     )
 
     mock_mongodb.species_knowledge.bulk_write = AsyncMock()
+    store._loaded = True
 
     await store._async_save()
 
     assert mock_mongodb.species_knowledge.bulk_write.called
+    op, = mock_mongodb.species_knowledge.bulk_write.call_args[0][0]
+    saved = op._doc["$set"]["q_table"]
+    assert isinstance(saved, Binary)
+    assert op._doc["$set"]["q_table_compression"] == "zstd"
+    assert op._doc["$unset"] == {"q_table_quantization": "", "q_table_scales": ""}
+    np.testing.assert_array_equal(
+        np.frombuffer(zstandard.decompress(saved), dtype=np.float32).reshape(sample_q_table.shape),
+        sample_q_table,
+    )
+    # Later diffs compare against a copy, not the live table
+    assert not np.shares_memory(store._saved_q_tables["goblin"], sample_q_table)
+
+
+@pytest.mark.asyncio
+async def test_save_before_load_is_skipped(mock_mongodb):
+    """Saving an unloaded store must not overwrite stored knowledge."""
+    store = MongoDBSpeciesKnowledgeStore()
+    store.get_or_create("goblin", state_space=10, action_count=5)
+    mock_mongodb.species_knowledge.bulk_write = AsyncMock()
+
+    store.save()
+    await store.flush()
+
+    mock_mongodb.species_knowledge.bulk_write.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_load_is_awaited_once(mock_mongodb):
+    """load() reads the collection once; records are ready when it returns."""
+    store = MongoDBSpeciesKnowledgeStore()
+
+    mock_mongodb.species_knowledge.find.return_value.to_list = AsyncMock(return_value=[])
+
+    await store.load()
+    await store.load()
+
+    assert store._loaded
+    mock_mongodb.species_knowledge.find.assert_called_once()
+    projection = mock_mongodb.species_knowledge.find.call_args[1]["projection"]
+    assert projection["_id"] == 0 and projection["q_table"] == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_saves_are_coalesced(mock_mongodb):
+    """Saves requested while one is running collapse into one more save."""
+    store = MongoDBSpeciesKnowledgeStore()
+    store._loaded = True
+    store.get_or_create("goblin", state_space=10, action_count=5)
+    released = asyncio.Event()
+
+    async def bulk_write(ops, **kwargs):
+        await released.wait()
+
+    mock_mongodb.species_knowledge.bulk_write = AsyncMock(side_effect=bulk_write)
+
+    for _ in range(5):
+        store.records["goblin"].encounters += 1
+        store.save()
+        await asyncio.sleep(0)
+    released.set()
+    await store.flush()
+
+    assert mock_mongodb.species_knowledge.bulk_write.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_history_recorded_before_load_is_kept(mock_mongodb):
+    """Stored history comes first, followed by entries recorded meanwhile."""
+    store = MongoDBSpeciesKnowledgeStore()
+    store.get_or_create("goblin", state_space=10, action_count=5)
+    _mock_history_events(mock_mongodb, [{
+        "timestamp": "2024-01-01T00:00:00", "generation": 0, "reward": 1.0, "state_index": 0,
+        "action": "FLEE", "q_value_before": 0.0, "q_value_after": 0.0,
+    }])
+
+    store.record_learning_event(
+        "goblin", reward=1.0, state_index=0, action="ATTACK",
+        q_value_before=0.0, q_value_after=0.1,
+    )
+    history = await store.get_history_async("goblin")
+
+    assert [h.action for h in history] == ["FLEE", "ATTACK"]
+    mock_mongodb.species_history_events.find.assert_called_once()
 
 
 @pytest.mark.asyncio
@@ -62,14 +156,10 @@ async def test_async_load(mock_mongodb, sample_q_table):
         "total_learning_steps": 1000,
         "q_table": q_table_binary,
         "q_table_shape": list(sample_q_table.shape),
-        "schema_version": 2
+        "schema_version": SCHEMA_VERSION
     }
 
-    # Mock async cursor
-    async def mock_cursor():
-        yield mock_doc
-
-    mock_mongodb.species_knowledge.find = MagicMock(return_value=mock_cursor())
+    mock_mongodb.species_knowledge.find.return_value.to_list = AsyncMock(return_value=[mock_doc])
 
     await store._async_load()
 
@@ -78,6 +168,153 @@ async def test_async_load(mock_mongodb, sample_q_table):
     assert record.generation == 5
     assert record.encounters == 100
     assert record.q_table.shape == sample_q_table.shape
+    np.testing.assert_array_equal(record.q_table, sample_q_table)
+
+
+@pytest.mark.asyncio
+async def test_failed_load_blocks_save(mock_mongodb, sample_q_table):
+    """A failed load must not let the next save overwrite stored knowledge."""
+    store = MongoDBSpeciesKnowledgeStore()
+    mock_mongodb.species_knowledge.find.return_value.to_list = AsyncMock(
+        side_effect=ConnectionError("transient")
+    )
+    mock_mongodb.species_knowledge.bulk_write = AsyncMock()
+
+    await store.load()
+    store.records["goblin"] = SpeciesKnowledgeRecord(monster_type="goblin", generation=0, q_table=sample_q_table)
+    await store._async_save()
+
+    assert store._loaded is False
+    mock_mongodb.species_knowledge.bulk_write.assert_not_called()
+
+    # A later load() retries and enables saving once it succeeds
+    mock_mongodb.species_knowledge.find.return_value.to_list = AsyncMock(return_value=[])
+    await store.load()
+    assert store._loaded is True
+
+
+@pytest.mark.asyncio
+async def test_save_pushes_changed_q_cells(mock_mongodb):
+    """After the first full write, saves push only changed cells."""
+    store = MongoDBSpeciesKnowledgeStore()
+    store._loaded = True
+    q_table = np.zeros((10, 4), dtype=np.float32)
+    store.records["goblin"] = SpeciesKnowledgeRecord(monster_type="goblin", generation=1, q_table=q_table)
+    mock_mongodb.species_knowledge.bulk_write = AsyncMock()
+
+    await store._async_save()
+    q_table[3, 2] = 1.5
+    await store._async_save()
+    store.records["goblin"].encounters += 1
+    await store._async_save()
+    await store._async_save()  # nothing changed: no write
+
+    first, second, third = [call[0][0][0]._doc for call in mock_mongodb.species_knowledge.bulk_write.call_args_list]
+    assert first["$set"]["q_table_deltas"] == [] and "$push" not in first
+    assert "q_table" not in second["$set"]
+    assert second["$push"] == {"q_table_deltas": {"$each": [{"s": 3, "a": 2, "v": 1.5}]}}
+    assert "q_table" not in third["$set"] and "$push" not in third
+    assert third["$set"]["encounters"] == 1
+
+    # Only the first save, before the document existed, is an upsert
+    upserts = [call[0][0][0]._upsert for call in mock_mongodb.species_knowledge.bulk_write.call_args_list]
+    assert upserts == [True, False, False]
+    assert "created_at" in first["$setOnInsert"] and "$setOnInsert" not in second
+
+
+@pytest.mark.asyncio
+async def test_save_compacts_q_deltas(mock_mongodb, monkeypatch):
+    """Past the delta limit the full Q-table is rewritten."""
+    from app.services import mongodb_species_store as module
+
+    monkeypatch.setattr(module, "_Q_DELTA_LIMIT", 2)
+    store = MongoDBSpeciesKnowledgeStore()
+    store._loaded = True
+    q_table = np.zeros((10, 4), dtype=np.float32)
+    store.records["goblin"] = SpeciesKnowledgeRecord(monster_type="goblin", generation=1, q_table=q_table)
+    mock_mongodb.species_knowledge.bulk_write = AsyncMock()
+
+    await store._async_save()
+    q_table[0, 0] = 1.0
+    q_table[1, 1] = 1.0
+    await store._async_save()
+    q_table[2, 2] = 1.0
+    await store._async_save()
+
+    last = mock_mongodb.species_knowledge.bulk_write.call_args[0][0][0]._doc
+    assert "$push" not in last
+    saved = zstandard.decompress(last["$set"]["q_table"])
+    assert np.frombuffer(saved, dtype=np.float32).reshape(10, 4)[2, 2] == 1.0
+
+
+@pytest.mark.asyncio
+async def test_async_load_applies_q_deltas(mock_mongodb):
+    """Stored deltas are replayed over the snapshot, newest last."""
+    store = MongoDBSpeciesKnowledgeStore()
+    mock_doc = {
+        "monster_type": "goblin",
+        "generation": 1,
+        "q_table": Binary(zstandard.compress(np.zeros((10, 4), dtype=np.float32).tobytes())),
+        "q_table_compression": "zstd",
+        "q_table_shape": [10, 4],
+        "q_table_deltas": [{"s": 3, "a": 2, "v": 1.0}, {"s": 3, "a": 2, "v": 2.5}],
+        "schema_version": SCHEMA_VERSION,
+    }
+    mock_mongodb.species_knowledge.find.return_value.to_list = AsyncMock(return_value=[mock_doc])
+    mock_mongodb.species_knowledge.bulk_write = AsyncMock()
+
+    await store.load()
+    await store._async_save()
+
+    assert store.records["goblin"].q_table[3, 2] == 2.5
+    mock_mongodb.species_knowledge.bulk_write.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_async_load_uncompressed_q_table(mock_mongodb, sample_q_table):
+    """Documents saved before compression hold raw float32 bytes."""
+    store = MongoDBSpeciesKnowledgeStore()
+    mock_doc = {
+        "monster_type": "goblin",
+        "q_table": Binary(sample_q_table.tobytes()),
+        "q_table_shape": list(sample_q_table.shape),
+        "schema_version": SCHEMA_VERSION,
+    }
+    mock_mongodb.species_knowledge.find.return_value.to_list = AsyncMock(return_value=[mock_doc])
+
+    await store._async_load()
+
+    np.testing.assert_array_equal(store.records["goblin"].q_table, sample_q_table)
+
+
+@pytest.mark.asyncio
+async def test_quantized_q_table_roundtrip(mock_mongodb, sample_q_table, monkeypatch):
+    """Opt-in int8 storage reloads each state to within its scale."""
+    from app.services import mongodb_species_store as module
+
+    monkeypatch.setattr(module.settings.ai, "quantize_q_tables", True)
+    sample_q_table[1] = 0.0
+    store = MongoDBSpeciesKnowledgeStore()
+    store._loaded = True
+    store.records["goblin"] = SpeciesKnowledgeRecord(monster_type="goblin", generation=1, q_table=sample_q_table)
+    mock_mongodb.species_knowledge.bulk_write = AsyncMock()
+
+    await store._async_save()
+
+    op, = mock_mongodb.species_knowledge.bulk_write.call_args[0][0]
+    fields = op._doc["$set"]
+    assert fields["q_table_quantization"] == "int8" and "$unset" not in op._doc
+    assert len(zstandard.decompress(fields["q_table"])) == sample_q_table.size
+
+    loader = MongoDBSpeciesKnowledgeStore()
+    mock_doc = {"monster_type": "goblin", "schema_version": SCHEMA_VERSION, **fields}
+    mock_mongodb.species_knowledge.find.return_value.to_list = AsyncMock(return_value=[mock_doc])
+    await loader._async_load()
+
+    loaded = loader.records["goblin"].q_table
+    tolerance = np.abs(sample_q_table).max(axis=1, keepdims=True) / 254 + 1e-7
+    assert (np.abs(loaded - sample_q_table) <= tolerance).all()
+    assert not loaded[1].any()
 
 
 @pytest.mark.asyncio
@@ -92,10 +329,7 @@ async def test_async_load_with_schema_mismatch(mock_mongodb):
         "generation": 5
     }
 
-    async def mock_cursor():
-        yield mock_doc
-
-    mock_mongodb.species_knowledge.find = MagicMock(return_value=mock_cursor())
+    mock_mongodb.species_knowledge.find.return_value.to_list = AsyncMock(return_value=[mock_doc])
     mock_mongodb.species_knowledge.delete_one = AsyncMock()
 
     await store._async_load()
@@ -127,11 +361,69 @@ async def test_save_history(mock_mongodb):
     )
 
     store.records["goblin"] = record
-    mock_mongodb.species_history.update_one = AsyncMock()
+    insert_many = mock_mongodb.species_history_events.insert_many = AsyncMock()
 
     await store._async_save_history(record)
 
-    assert mock_mongodb.species_history.update_one.called
+    events, = insert_many.call_args[0]
+    assert [(e["monster_type"], e["action"], e["reward"]) for e in events] == [("goblin", "ATTACK", 10.0)]
+    assert not record._history_dirty
+
+    # Only entries recorded since the last save are inserted
+    record.add_history_entry(
+        reward=-5.0, state_index=1, action="FLEE", q_value_before=0.1, q_value_after=0.0
+    )
+    await store._async_save_history(record)
+
+    events, = insert_many.call_args[0]
+    assert [e["action"] for e in events] == ["FLEE"]
+    assert insert_many.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_save_writes_all_history_in_one_request(mock_mongodb):
+    """A save sends one bulk_write for Q-tables and one insert for all new events."""
+    store = MongoDBSpeciesKnowledgeStore()
+    store._loaded = True
+    for monster_type in ("goblin", "orc"):
+        store.get_or_create(monster_type, state_space=10, action_count=5)
+        store.records[monster_type].add_history_entry(
+            reward=1.0, state_index=0, action="ATTACK", q_value_before=0.0, q_value_after=0.1
+        )
+    mock_mongodb.species_knowledge.bulk_write = AsyncMock()
+    insert_many = mock_mongodb.species_history_events.insert_many = AsyncMock()
+
+    await store._async_save()
+
+    mock_mongodb.species_knowledge.bulk_write.assert_awaited_once()
+    events, = insert_many.call_args[0]
+    assert insert_many.await_count == 1
+    assert sorted(e["monster_type"] for e in events) == ["goblin", "orc"]
+    assert not any(record._history_dirty for record in store.records.values())
+
+
+@pytest.mark.asyncio
+async def test_save_history_trims_old_events(mock_mongodb):
+    """Every _HISTORY_TRIM_EVERY inserts, events beyond HISTORY_LIMIT are deleted."""
+    from app.services.mongodb_species_store import _HISTORY_TRIM_EVERY
+
+    store = MongoDBSpeciesKnowledgeStore()
+    record = store.get_or_create("goblin", state_space=10, action_count=5)
+    events = mock_mongodb.species_history_events
+    events.insert_many = AsyncMock()
+    events.delete_many = AsyncMock()
+    cutoff = events.find.return_value.sort.return_value.skip.return_value.limit.return_value
+    cutoff.to_list = AsyncMock(return_value=[{"timestamp": "2024-01-01T00:00:00"}])
+
+    for _ in range(_HISTORY_TRIM_EVERY):
+        record.add_history_entry(
+            reward=1.0, state_index=0, action="ATTACK", q_value_before=0.0, q_value_after=0.1
+        )
+    await store._async_save_history(record)
+
+    events.delete_many.assert_awaited_once_with({
+        "monster_type": "goblin", "timestamp": {"$lte": "2024-01-01T00:00:00"},
+    })
 
 
 @pytest.mark.asyncio
@@ -147,24 +439,18 @@ async def test_load_history(mock_mongodb):
     )
     store.records["goblin"] = record
 
-    # Mock history document
-    mock_history = {
-        "monster_type": "goblin",
-        "schema_version": 2,
-        "history": [
-            {
-                "timestamp": "2024-01-01T00:00:00",
-                "generation": 1,
-                "reward": 10.0,
-                "state_index": 0,
-                "action": "ATTACK",
-                "q_value_before": 0.5,
-                "q_value_after": 0.6
-            }
-        ]
-    }
-
-    mock_mongodb.species_history.find_one = AsyncMock(return_value=mock_history)
+    # Mock history events (newest first, as queried)
+    _mock_history_events(mock_mongodb, [
+        {
+            "timestamp": "2024-01-01T00:00:00",
+            "generation": 1,
+            "reward": 10.0,
+            "state_index": 0,
+            "action": "ATTACK",
+            "q_value_before": 0.5,
+            "q_value_after": 0.6
+        }
+    ])
 
     await store._async_load_history(record)
 
@@ -173,6 +459,31 @@ async def test_load_history(mock_mongodb):
     assert record.history[0].action == "ATTACK"
 
 
+@pytest.mark.asyncio
+async def test_load_history_migrates_legacy_document(mock_mongodb):
+    """An embedded species_history array is moved into per-event documents."""
+    store = MongoDBSpeciesKnowledgeStore()
+    record = store.get_or_create("goblin", state_space=10, action_count=5)
+    _mock_history_events(mock_mongodb, [])
+    mock_mongodb.species_history.find_one = AsyncMock(return_value={
+        "schema_version": SCHEMA_VERSION,
+        "history": [{"timestamp": "2024-01-01T00:00:00", "action": "FLEE"}],
+    })
+    mock_mongodb.species_history.delete_one = AsyncMock()
+    insert_many = mock_mongodb.species_history_events.insert_many = AsyncMock()
+
+    await store._async_load_history(record)
+
+    assert [h.action for h in record.history] == ["FLEE"]
+    events, = insert_many.call_args[0]
+    assert [(e["monster_type"], e["action"]) for e in events] == [("goblin", "FLEE")]
+    mock_mongodb.species_history.delete_one.assert_awaited_once_with({"monster_type": "goblin"})
+
+    # Migrated entries count as saved
+    await store._async_save_history(record)
+    insert_many.assert_awaited_once()
+
+
 def test_get_or_create():
     """Test get_or_create method."""
     store = MongoDBSpeciesKnowledgeStore()
@@ -203,6 +514,31 @@ def test_get_or_create_with_resize():
     assert record.q_table.shape == (100, 10)
     # Old values should be preserved
     assert record.q_table[0, 0] == 1.0
+    assert record.q_table[49, 4] == 1.0 and record.q_table[50, 5] == 0.0
+
+    # Shrinking keeps the overlap; a matching shape returns the same table
+    record = store.get_or_create("goblin", state_space=20, action_count=3)
+    assert record.q_table.shape == (20, 3) and record.q_table.all()
+    table = record.q_table
+    assert store.get_or_create("goblin", state_space=20, action_count=3).q_table is table
+
+
+def test_history_is_trimmed_in_place():
+    """History keeps the newest HISTORY_LIMIT entries in the same list."""
+    from app.domain.intelligence.generations import HISTORY_LIMIT
+
+    record = SpeciesKnowledgeRecord(
+        monster_type="goblin", generation=0, q_table=np.zeros((10, 5), dtype=np.float32)
+    )
+    history = record.history
+    for i in range(HISTORY_LIMIT + 5):
+        record.add_history_entry(
+            reward=float(i), state_index=0, action="ATTACK", q_value_before=0.0, q_value_after=0.0
+        )
+
+    assert record.history is history
+    assert len(history) == HISTORY_LIMIT
+    assert history[0].reward == 5.0 and history[-1].reward == HISTORY_LIMIT + 4
 
 
 def test_bump_generation():
@@ -224,3 +560,18 @@ def test_bump_generation():
     store.bump_generation("goblin", max_generation=1)
 
     assert store.records["goblin"].generation == 1  # Should be capped
+
+
+def test_collection_handles_are_cached(mock_mongodb):
+    """Collections resolve once per database and refresh on reconnect."""
+    store = MongoDBSpeciesKnowledgeStore()
+
+    handles = store.db
+    assert store.db is handles
+    assert handles.species_knowledge is mock_mongodb.species_knowledge
+    assert "species_knowledge" in vars(handles)
+
+    with patch('app.services.mongodb_species_store.mongodb_manager') as reconnected:
+        reconnected.db = MagicMock()
+        assert store.db is not handles
+        assert store.db.species_knowledge is reconnected.db.species_knowledge
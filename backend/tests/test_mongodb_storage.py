@@ -39,6 +39,8 @@ async def test_save_game_by_id(mock_mongodb):
 
     assert success is True
     mock_mongodb.games.update_one.assert_called_once()
+    saved = mock_mongodb.games.update_one.call_args[0][1]["$set"]
+    assert isinstance(saved["saved_at"], int)  # epoch milliseconds
 
 
 @pytest.mark.asyncio
@@ -46,13 +48,9 @@ async def test_load_game_by_id(mock_mongodb):
     """Test loading a game from MongoDB."""
     storage = MongoDBStorageService()
 
-    # Mock game data
+    # Mock game data, as returned under the projection
     mock_game_data = {
-        "_id": "some_object_id",
-        "game_id": "test_game_1",
         "name": "Test Game",
-        "saved_at": datetime.now(),
-        "save_reason": "test",
         "map": {"width": 80, "height": 50}
     }
 
@@ -62,8 +60,9 @@ async def test_load_game_by_id(mock_mongodb):
 
     assert loaded is not None
     assert loaded["name"] == "Test Game"
-    assert "_id" not in loaded  # MongoDB-specific fields should be removed
-    assert "game_id" not in loaded
+    # MongoDB-specific fields are excluded by the query
+    projection = mock_mongodb.games.find_one.call_args[1]["projection"]
+    assert projection == {"_id": 0, "game_id": 0, "saved_at": 0, "save_reason": 0}
 
 
 @pytest.mark.asyncio
@@ -93,6 +92,30 @@ async def test_delete_game_save(mock_mongodb):
     mock_mongodb.games.delete_one.assert_called_once_with({"game_id": "test_game_1"})
 
 
+@pytest.mark.asyncio
+async def test_list_game_saves(mock_mongodb):
+    """Listing saves from a running loop returns them, newest first."""
+    storage = MongoDBStorageService()
+    legacy_saved_at = datetime(2024, 5, 1, 12, 0)
+    saved_at_ms = int(datetime(2024, 6, 1, 12, 0).timestamp() * 1000)
+
+    async def cursor():
+        yield {"game_id": "game-1", "name": "Oldest", "saved_at": None}
+        yield {"game_id": "game-2", "name": "Legacy", "saved_at": legacy_saved_at}
+        yield {"game_id": "game-3", "name": "Newer", "saved_at": saved_at_ms}
+
+    mock_mongodb.games.find.return_value = cursor()
+
+    saves = await storage.list_game_saves()
+
+    projection = mock_mongodb.games.find.call_args[1]["projection"]
+    assert "map" not in projection and projection["saved_at"] == 1
+    assert [s["game_id"] for s in saves] == ["game-3", "game-2", "game-1"]
+    assert saves[0]["saved_at"] == "2024-06-01T12:00:00"
+    assert saves[1]["saved_at"] == legacy_saved_at.isoformat()
+    assert saves[2]["saved_at"] is None
+
+
 @pytest.mark.asyncio
 async def test_save_player_registry(mock_mongodb):
     """Test saving player registry."""
@@ -124,29 +147,20 @@ async def test_load_player_registry(mock_mongodb):
     """Test loading player registry."""
     storage = MongoDBStorageService()
 
-    # Mock players data
+    # Mock players data (as projected, without _id/updated_at)
     mock_players = [
-        {"_id": "id1", "token": "token1", "display_name": "Player1"},
-        {"_id": "id2", "token": "token2", "display_name": "Player2"}
+        {"token": "token1", "display_name": "Player1"},
+        {"token": "token2", "display_name": "Player2"}
     ]
 
     # Mock stats data
     mock_stats = [
-        {"_id": "id1", "token": "token1", "experience_earned": 100},
-        {"_id": "id2", "token": "token2", "experience_earned": 200}
+        {"token": "token1", "experience_earned": 100},
+        {"token": "token2", "experience_earned": 200}
     ]
 
-    # Mock async cursors
-    async def players_cursor():
-        for player in mock_players:
-            yield player
-
-    async def stats_cursor():
-        for stat in mock_stats:
-            yield stat
-
-    mock_mongodb.players.find = MagicMock(return_value=players_cursor())
-    mock_mongodb.player_stats.find = MagicMock(return_value=stats_cursor())
+    mock_mongodb.players.find.return_value.to_list = AsyncMock(return_value=mock_players)
+    mock_mongodb.player_stats.find.return_value.to_list = AsyncMock(return_value=mock_stats)
 
     registry = await storage.load_player_registry()
 
@@ -155,3 +169,6 @@ async def test_load_player_registry(mock_mongodb):
     assert len(registry["stats"]) == 2
     assert "token1" in registry["players"]
     assert "token2" in registry["stats"]
+    assert registry["players"]["token1"] == {"display_name": "Player1"}
+    projection = mock_mongodb.players.find.call_args[1]["projection"]
+    assert projection == {"_id": 0, "updated_at": 0}
@@ -295,6 +295,15 @@ class TestMonsterSerialization:
         assert restored.last_move_tick == 500
         assert restored.stats.challenge_rating == 0.5
 
+    def test_move_jitter_is_derived_not_serialized(self, basic_monster):
+        """Move jitter is computed from the id and rebuilt on restore."""
+        data = basic_monster.to_dict()
+        restored = Monster.from_dict(data)
+
+        assert "move_jitter" not in data
+        assert 0 <= basic_monster.move_jitter < 6
+        assert restored.move_jitter == basic_monster.move_jitter
+
 
 class TestMonsterChallengeRating:
     """Tests for challenge rating integration."""
@@ -13,6 +13,7 @@ Tests cover:
 """
 import pytest
 import json
+import sys
 from pathlib import Path
 from unittest.mock import patch, MagicMock, AsyncMock
 
@@ -129,6 +130,8 @@ def fresh_monster_service(mock_config_data, mock_spawn_rates, tmp_path):
         q_table=mock_q_table
     ))
     service.monster_memories = {}
+    service._astar = None
+    service.monster_paths = {}
     service._initialized = True
     service._build_ai_profiles()
     return service
@@ -180,6 +183,12 @@ class TestMonsterServiceConfig:
         
         assert weights["goblin"] == 10
         assert weights["orc"] == 5
+
+    def test_get_monster_weights_default(self, fresh_monster_service):
+        """Unconfigured rooms weigh every known monster type equally."""
+        weights = fresh_monster_service.get_monster_weights("unknown_room")
+
+        assert weights == {"goblin": 5, "orc": 5}
     
     def test_get_max_monsters_per_room(self, fresh_monster_service):
         """Should return max monsters config."""
@@ -228,6 +237,19 @@ class TestMonsterTypeSelection:
         # Should use default weights (all monsters equal)
         assert monster_type in ["goblin", "orc"]
 
+    def test_select_monster_type_cache_follows_reload(self, fresh_monster_service, mock_spawn_rates):
+        """Replacing spawn rates should invalidate the cached room weights."""
+        assert fresh_monster_service.select_monster_type("chamber") in ["goblin", "orc"]
+
+        fresh_monster_service.spawn_rates = {
+            **mock_spawn_rates,
+            "room_monster_weights": {"chamber": {"orc": 1, "dragon": 50}},
+        }
+
+        assert {fresh_monster_service.select_monster_type("chamber") for _ in range(20)} == {"orc"}
+        fresh_monster_service.monster_types = {}
+        assert fresh_monster_service.select_monster_type("chamber") is None
+
 
 # ============================================================================
 # MONSTER CREATION TESTS
@@ -361,6 +383,27 @@ class TestRoomSpawning:
             assert (monsters[0].x, monsters[0].y) == free_pos
 
 
+    def test_spawn_positions_skip_doors_and_occupied(self):
+        """Spawn tiles are interior floor, away from doors, and unoccupied."""
+        from app.domain.map import TILE_DOOR_OPEN, TILE_FLOOR, TILE_WALL
+
+        tiles = [[TILE_FLOOR] * 7 for _ in range(6)]
+        for x in range(7):
+            tiles[0][x] = tiles[5][x] = TILE_WALL
+        tiles[0][2] = TILE_DOOR_OPEN  # in the top wall
+        tiles[3][5] = TILE_WALL
+        room = Room(id="r1", x=0, y=0, width=7, height=6)
+
+        positions = MonsterService._spawn_positions(room, tiles, {(4, 4)}, 7, 6)
+
+        assert positions == [
+            (4, 1), (5, 1),
+            (1, 2), (2, 2), (3, 2), (4, 2), (5, 2),
+            (1, 3), (2, 3), (3, 3), (4, 3),
+            (1, 4), (2, 4), (3, 4), (5, 4),
+        ]
+
+
 # ============================================================================
 # AI BEHAVIOR TESTS
 # ============================================================================
@@ -528,6 +571,18 @@ class TestDecisionMaking:
         
         assert isinstance(action, AIAction)
     
+    def test_last_world_state_is_not_caller_dict(self, fresh_monster_service):
+        """The recorded world state is the service's own dict, with defaults filled in."""
+        monster = fresh_monster_service.create_monster("goblin", 5, 5, "r1")
+        world_state = {"nearby_enemies": 2}
+
+        fresh_monster_service.decide_combat_action(monster, current_tick=100, world_state=world_state)
+        world_state["nearby_enemies"] = 0
+
+        recorded = monster.intelligence_state.last_world_state
+        assert recorded["nearby_enemies"] == 2
+        assert recorded["room_type"] == "chamber"
+    
     def test_decide_without_ai_profile(self, fresh_monster_service):
         """Monster without AI profile should get default action."""
         monster = fresh_monster_service.create_monster("orc", 5, 5, "r1")
@@ -540,6 +595,107 @@ class TestDecisionMaking:
         # Should return aggressive attack as default
         assert action == AIAction.ATTACK_AGGRESSIVE
 
+    def test_update_monsters_batch(self, fresh_monster_service, sample_room, sample_tiles):
+        """Batched updates record decisions and keep occupied positions in sync."""
+        goblins = [fresh_monster_service.create_monster("goblin", 12 + i, 12, "room-1") for i in range(3)]
+        orc = fresh_monster_service.create_monster("orc", 15, 15, "room-1")
+        monsters = goblins + [orc]
+        occupied = {m.position for m in monsters}
+        world_state = {"room_type": "chamber", "nearby_enemies": 1, "distance_to_threat": 3}
+
+        fresh_monster_service.update_monsters_batch(
+            [(m, sample_room.bounds, world_state) for m in monsters],
+            tiles=sample_tiles,
+            occupied_positions=occupied,
+            current_tick=50,
+        )
+
+        assert fresh_monster_service.species_store.get_or_create.call_count == 3 + 1
+        for goblin in goblins:
+            assert goblin.intelligence_state.last_decision_tick == 50
+            assert AIAction[goblin.intelligence_state.last_action] in AIAction
+        assert orc.intelligence_state.last_action is None
+        assert occupied == {m.position for m in monsters}
+
+    @pytest.mark.asyncio
+    async def test_game_tick_world_state_snapshot(self, fresh_monster_service, sample_room, sample_tiles, monkeypatch):
+        """Pre-move snapshots match world states rebuilt after the others moved."""
+        from app.core.game import Game
+        from app.domain.entities import Player
+
+        game = Game("g1", "Test")
+        game.tiles = sample_tiles
+        game.rooms = [sample_room]
+        game.players = {"p1": Player(id="p1", x=16, y=16)}
+        monsters = [fresh_monster_service.create_monster("goblin", 11 + i, 11, sample_room.id) for i in range(4)]
+        game.monsters = {m.id: m for m in monsters}
+        monkeypatch.setattr("app.core.game._get_monster_service", lambda: fresh_monster_service)
+        # Keep goblins out of fights, which skip their world state refresh
+        monkeypatch.setattr(game, "_check_monster_aggro", AsyncMock())
+
+        moved_any = False
+        for tick in range(10, 40):
+            before = {m.id: m.position for m in monsters}
+            await game.update_monsters(tick)
+            for monster in monsters:
+                # As the per-monster loop saw it: own tile before its move,
+                # every other monster wherever it ended up this tick
+                after = monster.position
+                monster.x, monster.y = before[monster.id]
+                rebuilt = fresh_monster_service._prepare_world_state(
+                    game._build_monster_world_state(monster, sample_room)
+                )
+                monster.x, monster.y = after
+                assert monster.intelligence_state.last_world_state == rebuilt
+            moved_any = moved_any or before != {m.id: m.position for m in monsters}
+        assert moved_any
+
+
+# ============================================================================
+# INITIALIZATION TESTS
+# ============================================================================
+
+class TestInitialization:
+    """Tests for loading configurations at startup."""
+
+    @pytest.fixture
+    def uninitialized_service(self, tmp_path):
+        service = object.__new__(MonsterService)
+        service.config_path = tmp_path
+        service.monster_types = {}
+        service.spawn_rates = {}
+        service.ai_profiles = {}
+        service.species_store = None
+        return service
+
+    @pytest.mark.asyncio
+    async def test_initialize_async_loads_from_mongodb(self, uninitialized_service, mock_config_data, mock_spawn_rates, monkeypatch):
+        """With MongoDB connected, configs are awaited before profiles are built."""
+        module = sys.modules[MonsterService.__module__]
+        manager = MagicMock(is_connected=True)
+        manager.db.monsters.find_one = AsyncMock(return_value={"config_version": "1.0", "monsters": mock_config_data})
+        manager.db.spawn_rates.find_one = AsyncMock(return_value={"config_version": "1.0", **mock_spawn_rates})
+        monkeypatch.setattr(module, "mongodb_manager", manager)
+        monkeypatch.setattr(module.settings.mongodb, "connection_string", "mongodb://test")
+        monkeypatch.setattr(module, "MongoDBSpeciesKnowledgeStore", MagicMock())
+
+        await uninitialized_service.initialize_async()
+
+        assert uninitialized_service.monster_types == mock_config_data
+        assert uninitialized_service.spawn_rates == mock_spawn_rates
+        assert set(uninitialized_service.ai_profiles) == {"goblin"}
+
+    def test_initialize_loads_json_only(self, uninitialized_service, mock_config_data, monkeypatch):
+        """The sync bootstrap never touches MongoDB."""
+        module = sys.modules[MonsterService.__module__]
+        (uninitialized_service.config_path / "monsters.json").write_text(json.dumps(mock_config_data))
+        monkeypatch.setattr(module, "mongodb_manager", MagicMock(is_connected=False))
+
+        uninitialized_service.initialize()
+
+        assert uninitialized_service.monster_types == mock_config_data
+        assert uninitialized_service.spawn_rates["max_monsters_per_room"] == 2
+
 
 # ============================================================================
 # SINGLETON TESTS
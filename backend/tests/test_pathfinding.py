@@ -0,0 +1,285 @@
+"""
+Tests for A* pathfinding and corridor detection.
+
+Tests cover:
+- A* paths around walls and occupied tiles
+- Path reuse across ticks
+- Direction/delta conversion
+- Corridor detection (walkable tiles outside rooms)
+- Nearest corridor search
+"""
+import pytest
+from app.domain.entities import Room
+from app.domain.map import (
+    AStar, Direction, PathFollower, TileGrid, build_room_mask,
+    get_corridor_mask, get_corridor_positions, is_in_corridor, find_nearest_corridor,
+    TILE_FLOOR, TILE_WALL, TILE_DOOR_CLOSED, TILE_DOOR_OPEN,
+)
+
+
+# Legend: '#' wall, '.' floor, '+' closed door, '/' open door
+LAYOUT = [
+    "##########",
+    "#....#...#",
+    "#....#...#",
+    "#....#...#",
+    "#..../...#",
+    "#....#####",
+    "#....+...#",
+    "#....#...#",
+    "##########",
+]
+_LEGEND = {"#": TILE_WALL, ".": TILE_FLOOR, "+": TILE_DOOR_CLOSED, "/": TILE_DOOR_OPEN}
+
+
+@pytest.fixture
+def tiles():
+    """A small hand-drawn map with a room on the left and two side areas."""
+    return [[_LEGEND[c] for c in row] for row in LAYOUT]
+
+
+@pytest.fixture
+def rooms():
+    """A single room covering the left area."""
+    return [Room(id="room_1", x=1, y=1, width=4, height=7)]
+
+
+class TestDirection:
+    """Tests for compass direction helpers."""
+
+    @pytest.mark.parametrize("direction", list(Direction))
+    def test_delta_roundtrip(self, direction):
+        """to_delta and from_delta should be inverses."""
+        assert Direction.from_delta(*direction.to_delta()) == direction
+
+    def test_from_delta_normalizes_magnitude(self):
+        """Longer deltas map to the same compass direction."""
+        assert Direction.from_delta(5, -3) == Direction.NORTHEAST
+        assert Direction.from_delta(0, 7) == Direction.SOUTH
+        assert Direction.from_delta(0, 0) == Direction.NONE
+
+
+class TestAStar:
+    """Tests for A* path search."""
+
+    def test_path_to_self_is_empty(self, tiles):
+        """A path from a tile to itself has no steps."""
+        assert AStar(tiles).find_path((2, 2), (2, 2)) == []
+
+    def test_path_goes_through_open_door(self, tiles):
+        """Path should cross the open door and end at the goal."""
+        path = AStar(tiles).find_path((1, 4), (8, 4))
+
+        assert path is not None
+        assert path[-1] == (8, 4)
+        assert (5, 4) in path
+        assert len(path) == 7
+
+    def test_path_steps_are_adjacent_and_walkable(self, tiles):
+        """Every step should move one tile onto a walkable tile."""
+        path = AStar(tiles).find_path((1, 1), (7, 1))
+
+        previous = (1, 1)
+        for x, y in path:
+            assert max(abs(x - previous[0]), abs(y - previous[1])) == 1
+            assert tiles[y][x] in (TILE_FLOOR, TILE_DOOR_OPEN)
+            previous = (x, y)
+
+    def test_cardinal_only_path(self, tiles):
+        """Without diagonals, every step moves along one axis."""
+        path = AStar(tiles, allow_diagonal=False).find_path((1, 1), (4, 7))
+
+        assert len(path) == 9
+        previous = (1, 1)
+        for x, y in path:
+            assert abs(x - previous[0]) + abs(y - previous[1]) == 1
+            previous = (x, y)
+
+    def test_closed_door_blocks_path(self, tiles):
+        """The lower area is only reachable through a closed door."""
+        assert AStar(tiles).find_path((1, 6), (7, 6)) is None
+
+    def test_occupied_tile_blocks_path(self, tiles):
+        """An occupied open door should block the only route."""
+        astar = AStar(tiles, occupied={(5, 4)})
+        assert astar.find_path((1, 4), (8, 4)) is None
+
+    def test_no_corner_cutting(self, tiles):
+        """Diagonal moves must not squeeze past wall corners."""
+        path = AStar(tiles).find_path((4, 3), (6, 3))
+
+        assert path is not None
+        assert (5, 4) in path
+        assert path[-1] == (6, 3)
+
+    def test_reused_instance_matches_fresh_searches(self, tiles):
+        """Search buffers must be reset between calls on one instance."""
+        queries = [((1, 1), (8, 4)), ((4, 7), (1, 1)), ((1, 6), (7, 6)), ((8, 1), (2, 7))]
+        astar = AStar(tiles)
+
+        for start, goal in queries:
+            assert astar.find_path(start, goal) == AStar(tiles).find_path(start, goal)
+
+    @pytest.mark.parametrize("start,goal", [
+        ((1, 4), (8, 4)), ((1, 1), (7, 1)), ((4, 7), (8, 2)), ((8, 3), (1, 7)),
+    ])
+    def test_bidirectional_matches_find_path(self, tiles, start, goal):
+        """Bidirectional search should find a path of the same length."""
+        astar = AStar(tiles)
+        path = astar.find_path_bidirectional(start, goal)
+        expected = astar.find_path(start, goal)
+
+        assert path[-1] == goal
+        assert len(path) == len(expected)
+        previous = start
+        for x, y in path:
+            assert max(abs(x - previous[0]), abs(y - previous[1])) == 1
+            assert tiles[y][x] in (TILE_FLOOR, TILE_DOOR_OPEN)
+            previous = (x, y)
+
+    def test_bidirectional_blocked_paths(self, tiles):
+        """Closed doors and occupied chokepoints block both searches."""
+        assert AStar(tiles).find_path_bidirectional((1, 6), (7, 6)) is None
+        astar = AStar(tiles, occupied={(5, 4)})
+        assert astar.find_path_bidirectional((1, 4), (8, 4)) is None
+        assert astar.find_path((1, 1), (4, 7)) is not None
+
+    def test_bidirectional_after_find_path(self):
+        """A find_path between bidirectional searches must not leave stale state."""
+        open_grid = [[TILE_FLOOR] * 20 for _ in range(20)]
+        astar = AStar(open_grid)
+
+        first = astar.find_path_bidirectional((0, 0), (19, 19))
+        assert astar.find_path((5, 5), (6, 6)) == [(6, 6)]
+        assert astar.find_path_bidirectional((0, 0), (19, 19)) == first
+        assert len(first) == 19
+
+    def test_flee_position_is_reachable_and_far(self, tiles):
+        """Flee target should be the farthest tile reachable from start."""
+        astar = AStar(tiles)
+        assert astar.find_flee_position((4, 4), (1, 4)) == (8, 1)
+
+    def test_flee_position_ignores_unreachable_tiles(self, tiles):
+        """Tiles behind a closed door are never chosen."""
+        astar = AStar(tiles)
+        flee = astar.find_flee_position((4, 6), (1, 6), search_radius=4)
+
+        assert flee is not None
+        assert flee[1] <= 4 or flee[0] <= 4
+
+
+class TestPathFollower:
+    """Tests for reusing a path between ticks."""
+
+    def test_first_call_matches_find_path(self, tiles):
+        """Without a previous path, the follower runs a normal search."""
+        astar = AStar(tiles)
+        assert PathFollower().find_path(astar, (1, 1), (8, 4)) == astar.find_path((1, 1), (8, 4))
+
+    def test_reuses_path_after_one_step(self, tiles):
+        """After moving one step, the rest of the previous path is returned."""
+        astar = AStar(tiles)
+        follower = PathFollower()
+        path = follower.find_path(astar, (1, 1), (8, 4))
+
+        assert follower.find_path(astar, path[0], (8, 4)) == path[1:]
+        assert follower.find_path(astar, path[0], (8, 4)) == path[1:]
+
+    def test_follows_moving_goal(self, tiles):
+        """A goal moving one tile extends the path to the new goal."""
+        astar = AStar(tiles)
+        follower = PathFollower()
+        path = follower.find_path(astar, (1, 4), (7, 4))
+
+        extended = follower.find_path(astar, path[0], (8, 4))
+        assert extended == path[1:] + [(8, 4)]
+
+        trimmed = follower.find_path(astar, path[0], (6, 4))
+        assert trimmed[-1] == (6, 4)
+        assert len(trimmed) == len(path) - 2
+
+    def test_replans_after_extension_limit(self, tiles):
+        """Goal moves beyond max_extensions trigger a fresh search."""
+        astar = AStar(tiles)
+        follower = PathFollower(max_extensions=1)
+        follower.find_path(astar, (1, 4), (6, 3))
+        follower.find_path(astar, (1, 4), (7, 3))
+
+        assert follower.find_path(astar, (1, 4), (8, 3)) == astar.find_path((1, 4), (8, 3))
+
+    def test_replans_when_path_blocked(self, tiles):
+        """A newly occupied step invalidates the stored path."""
+        follower = PathFollower()
+        follower.find_path(AStar(tiles), (1, 1), (8, 4))
+
+        blocked = AStar(tiles, occupied={(5, 4)})
+        assert follower.find_path(blocked, (1, 1), (8, 4)) is None
+        assert follower.goal is None
+
+    def test_replans_when_door_closes(self, tiles):
+        """Tiles changed in place are re-checked on reuse."""
+        astar = AStar(tiles)
+        follower = PathFollower()
+        assert follower.find_path(astar, (1, 4), (8, 4)) is not None
+
+        tiles[4][5] = TILE_DOOR_CLOSED
+        assert follower.find_path(astar, (1, 4), (8, 4)) is None
+
+    def test_replans_when_mover_jumps(self, tiles):
+        """A start off the stored path runs a fresh search."""
+        astar = AStar(tiles)
+        follower = PathFollower()
+        follower.find_path(astar, (1, 1), (8, 4))
+
+        assert follower.find_path(astar, (4, 7), (8, 4)) == astar.find_path((4, 7), (8, 4))
+
+
+class TestCorridors:
+    """Tests for runtime corridor detection."""
+
+    def test_corridor_positions(self, tiles, rooms):
+        """Walkable tiles outside rooms are corridors."""
+        corridors = get_corridor_positions(tiles, rooms)
+
+        assert (5, 4) in corridors
+        assert (7, 2) in corridors
+        assert (2, 2) not in corridors
+        assert (5, 6) not in corridors  # closed door is not walkable
+        assert all(not rooms[0].contains(x, y) for x, y in corridors)
+
+    def test_corridor_positions_accepts_tile_grid(self, tiles, rooms):
+        """TileGrid input should give the same result as nested lists."""
+        assert get_corridor_positions(TileGrid(tiles), rooms) == get_corridor_positions(tiles, rooms)
+
+    def test_corridor_mask_matches_positions(self, tiles, rooms):
+        """Mask and position set should describe the same tiles."""
+        mask = get_corridor_mask(tiles, rooms)
+        corridors = get_corridor_positions(tiles, rooms)
+
+        assert mask.shape == (len(tiles), len(tiles[0]))
+        assert {(x, y) for y, x in zip(*mask.nonzero())} == corridors
+
+    def test_room_mask_matches_room_bounds(self, tiles, rooms):
+        """Room mask should be set exactly inside room bounds and be shared."""
+        mask = build_room_mask((len(tiles), len(tiles[0])), rooms)
+
+        assert mask[1, 1] and mask[7, 4]
+        assert not mask[0, 0] and not mask[4, 5]
+        assert mask.sum() == rooms[0].area
+        assert build_room_mask((len(tiles), len(tiles[0])), rooms) is mask
+        assert not mask.flags.writeable
+
+    def test_is_in_corridor(self, tiles, rooms):
+        """Single-position check should agree with the bulk scan."""
+        corridors = get_corridor_positions(tiles, rooms)
+        for y in range(len(tiles)):
+            for x in range(len(tiles[0])):
+                assert is_in_corridor(x, y, tiles, rooms) == ((x, y) in corridors)
+
+    def test_find_nearest_corridor(self, tiles, rooms):
+        """Nearest corridor from inside the room is the open door."""
+        assert find_nearest_corridor(2, 4, tiles, rooms) == (5, 4)
+
+    def test_find_nearest_corridor_out_of_range(self, tiles, rooms):
+        """Search gives up beyond max_search."""
+        assert find_nearest_corridor(1, 7, tiles, rooms, max_search=2) is None
@@ -167,6 +167,20 @@ class TestRoomSerialization:
         assert room.visited is False
         assert room.furniture == []
     
+    def test_from_dict_converts_legacy_connected_room_ids(self):
+        """from_dict should map saved "room_N" ids to room indices."""
+        data = {
+            "id": "room_1",
+            "x": 0,
+            "y": 0,
+            "width": 10,
+            "height": 10,
+            "connected_rooms": ["room_2", "room_5", 3],
+        }
+        room = Room.from_dict(data)
+        
+        assert room.connected_rooms == [1, 4, 3]
+    
     def test_serialization_roundtrip_preserves_data(self, library_room):
         """Full serialization roundtrip should preserve all data."""
         data = library_room.to_dict()
@@ -202,7 +202,7 @@ class TestListGameSaves:
     @pytest.mark.asyncio
     async def test_list_empty(self, temp_storage_service):
         """Empty directory should return empty list."""
-        saves = temp_storage_service.list_game_saves()
+        saves = await temp_storage_service.list_game_saves()
         
         assert saves == []
     
@@ -212,7 +212,7 @@ class TestListGameSaves:
         await temp_storage_service.save_game_by_id("game-001", sample_game_state)
         await temp_storage_service.save_game_by_id("game-002", {**sample_game_state, "name": "Another Dungeon"})
         
-        saves = temp_storage_service.list_game_saves()
+        saves = await temp_storage_service.list_game_saves()
         
         assert len(saves) == 2
         game_ids = [s["game_id"] for s in saves]
@@ -224,7 +224,7 @@ class TestListGameSaves:
         """Listed saves should include metadata."""
         await temp_storage_service.save_game_by_id("game-001", sample_game_state)
         
-        saves = temp_storage_service.list_game_saves()
+        saves = await temp_storage_service.list_game_saves()
         
         assert len(saves) == 1
         save = saves[0]
@@ -317,7 +317,7 @@ class TestListSaves:
         await temp_storage_service.save_game(sample_game_state, save_id="save1")
         await temp_storage_service.save_game(sample_game_state, save_id="save2")
         
-        saves = temp_storage_service.list_saves()
+        saves = await temp_storage_service.list_saves()
         
         save_ids = [s["id"] for s in saves]
         assert "save1" in save_ids
@@ -332,7 +332,7 @@ class TestListSaves:
             reason="testing"
         )
         
-        saves = temp_storage_service.list_saves()
+        saves = await temp_storage_service.list_saves()
         save = next(s for s in saves if s["id"] == "test")
         
         assert save["version"] == "1.0"